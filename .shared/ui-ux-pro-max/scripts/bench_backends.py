@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+UI/UX Pro Max Backend Benchmark - pure-Python postings vs. NumPy sparse matrix
+
+Builds synthetic corpora (Zipf-like vocabulary, rows of 10-40 words, like
+the guideline CSVs but larger) and times fit, single queries and batched
+queries on both BM25 backends, checking they return the same top results.
+Used to pick NUMPY_MIN_DOCS in core.py.
+
+Usage: python bench_backends.py [--sizes 1000 10000 100000] [--queries 200] [--max-results 3]
+"""
+
+import argparse
+import random
+import time
+
+import core
+from core import BM25
+
+
+# ============ SYNTHETIC CORPUS ============
+def _vocabulary(size, rng):
+    """Distinct lowercase words of 4-10 letters"""
+    words = set()
+    while len(words) < size:
+        words.add("".join(rng.choice("abcdefghijklmnopqrstuvwxyz") for _ in range(rng.randint(4, 10))))
+    return sorted(words)
+
+
+def synthetic_corpus(rows, queries, seed=7):
+    """(documents, queries) drawing words with Zipf-like frequencies"""
+    rng = random.Random(seed)
+    vocabulary = _vocabulary(max(2000, rows // 5), rng)
+    weights = [1 / rank for rank in range(1, len(vocabulary) + 1)]
+
+    documents = [" ".join(rng.choices(vocabulary, weights, k=rng.randint(10, 40))) for _ in range(rows)]
+    query_list = [" ".join(rng.choices(vocabulary, weights, k=rng.randint(2, 4))) for _ in range(queries)]
+    return documents, query_list
+
+
+# ============ BENCHMARK ============
+def _seconds(fn):
+    start = time.perf_counter()
+    result = fn()
+    return time.perf_counter() - start, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark BM25 backends on synthetic corpora")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 5000, 10000, 50000, 100000], help="Corpus sizes (rows)")
+    parser.add_argument("--queries", "-q", type=int, default=200, help="Queries per corpus (default: 200)")
+    parser.add_argument("--max-results", "-n", type=int, default=3, help="Results per query (default: 3)")
+    args = parser.parse_args()
+
+    if core._numpy() is None:
+        raise SystemExit("NumPy is not installed; only the pure-Python backend is available")
+
+    print(f"{'rows':>8}{'backend':>9}{'fit ms':>10}{'query us':>11}{'batch us/q':>13}")
+    for rows in args.sizes:
+        documents, queries = synthetic_corpus(rows, args.queries)
+        rankings = {}
+        for backend in ("python", "numpy"):
+            bm25 = BM25(backend=backend)
+            fit, _ = _seconds(lambda: bm25.fit(documents))
+            single, ranked = _seconds(lambda: [bm25.top_k(query, args.max_results) for query in queries])
+            batch, batched = _seconds(lambda: bm25.top_k_batch(queries, args.max_results))
+            rankings[backend] = ([[idx for idx, _ in r] for r in ranked], [[idx for idx, _ in r] for r in batched])
+            print(f"{rows:>8}{backend:>9}{fit * 1e3:>10.1f}{single / len(queries) * 1e6:>11.1f}{batch / len(queries) * 1e6:>13.1f}")
+
+        if rankings["python"] != rankings["numpy"]:
+            raise SystemExit(f"Backends disagree on the {rows}-row corpus")
+
+
+if __name__ == "__main__":
+    main()
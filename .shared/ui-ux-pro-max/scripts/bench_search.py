@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+UI/UX Pro Max Search Benchmark - inverted index vs. linear BM25 scan
+
+Times every CSV in data/ and data/stacks/ with the queries agents send
+(each row's first search column, e.g. "Glassmorphism" or "Suspense
+Boundaries"), checks both scorers return the same top results, and prints
+per-file timings.
+
+Usage: python bench_search.py [--max-results 3] [--repeat 5]
+"""
+
+import argparse
+import time
+from collections import defaultdict
+
+from core import BM25, CSV_CONFIG, DATA_DIR, STACK_CONFIG, _STACK_COLS, _load_csv
+
+
+# ============ BASELINE ============
+def linear_top_k(bm25, query, k):
+    """Previous scorer: every document, term counts rebuilt per query, full sort"""
+    query_tokens = bm25.tokenize(query)
+    scores = []
+    for idx, doc in enumerate(bm25.corpus):
+        score = 0
+        term_freqs = defaultdict(int)
+        for word in doc:
+            term_freqs[word] += 1
+        for token in query_tokens:
+            if token in bm25.idf:
+                tf = term_freqs[token]
+                denominator = tf + bm25.k1 * (1 - bm25.b + bm25.b * bm25.doc_lengths[idx] / bm25.avgdl)
+                score += bm25.idf[token] * tf * (bm25.k1 + 1) / denominator
+        scores.append((idx, score))
+    ranked = sorted(scores, key=lambda x: x[1], reverse=True)
+    return [(idx, score) for idx, score in ranked[:k] if score > 0]
+
+
+# ============ BENCHMARK ============
+def _corpora():
+    """(name, documents, queries) for every CSV the search functions read"""
+    configs = [(domain, config["file"], config["search_cols"]) for domain, config in CSV_CONFIG.items()]
+    configs += [(f"stack:{stack}", config["file"], _STACK_COLS["search_cols"]) for stack, config in STACK_CONFIG.items()]
+    for name, file, search_cols in configs:
+        filepath = DATA_DIR / file
+        if not filepath.exists():
+            continue
+        data = _load_csv(filepath)
+        documents = [" ".join(str(row.get(col, "")) for col in search_cols) for row in data]
+        queries = [row.get(search_cols[0], "") for row in data if row.get(search_cols[0])]
+        yield name, documents, queries
+
+
+def _time(fn, queries, repeat):
+    """Best-of-repeat microseconds per query"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for query in queries:
+            fn(query)
+        best = min(best, time.perf_counter() - start)
+    return best / max(len(queries), 1) * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark BM25 scoring over the skill's CSVs")
+    parser.add_argument("--max-results", "-n", type=int, default=3, help="Results per query (default: 3)")
+    parser.add_argument("--repeat", "-r", type=int, default=5, help="Timing runs per file, best kept (default: 5)")
+    args = parser.parse_args()
+
+    print(f"{'corpus':<24}{'rows':>6}{'queries':>9}{'linear us/q':>14}{'index us/q':>13}{'speedup':>10}")
+    total_linear = total_index = 0.0
+    for name, documents, queries in _corpora():
+        bm25 = BM25()
+        bm25.fit(documents)
+
+        for query in queries:
+            expected = [idx for idx, _ in linear_top_k(bm25, query, args.max_results)]
+            actual = [idx for idx, _ in bm25.top_k(query, args.max_results)]
+            if expected != actual:
+                raise SystemExit(f"Ranking mismatch in {name} for {query!r}: {expected} != {actual}")
+
+        linear = _time(lambda q: linear_top_k(bm25, q, args.max_results), queries, args.repeat)
+        index = _time(lambda q: bm25.top_k(q, args.max_results), queries, args.repeat)
+        total_linear += linear * len(queries)
+        total_index += index * len(queries)
+        print(f"{name:<24}{len(documents):>6}{len(queries):>9}{linear:>14.1f}{index:>13.1f}{linear / index:>9.1f}x")
+
+    print(f"{'total (ms)':<39}{total_linear / 1000:>14.1f}{total_index / 1000:>13.1f}{total_linear / total_index:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
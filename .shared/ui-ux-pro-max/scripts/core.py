@@ -5,15 +5,38 @@ UI/UX Pro Max Core - BM25 search engine for UI/UX style guides
 """
 
 import csv
+import hashlib
+import heapq
+import importlib.util
+import os
+import pickle
 import re
 from pathlib import Path
 from math import log
-from collections import defaultdict
+from collections import Counter, defaultdict
 
 # ============ CONFIGURATION ============
 DATA_DIR = Path(__file__).parent.parent / "data"
 MAX_RESULTS = 3
 
+# Compiled indexes, one per CSV, rebuilt when the CSV changes
+INDEX_CACHE_DIR = Path(os.environ.get("UIPRO_INDEX_CACHE_DIR", Path(__file__).parent.parent / ".index-cache"))
+INDEX_FORMAT = 5  # bump when BM25, the stemmer or the cached layout changes
+
+# Text analysis, applied to rows at index time and to queries (see Analyzer)
+SYNONYMS_FILE = "synonyms.csv"
+ANALYZER_CONFIG = {
+    "min_length": 3,  # shorter words are dropped...
+    "keep_short": ["ui", "ux", "2d", "3d", "ai", "ar", "vr", "js", "ts", "ml", "qa", "db"],  # ...except these
+    "stem": True,     # plural endings: "icons" -> "icon"
+    "synonyms": True,  # map SYNONYMS_FILE entries to their term
+    "bigrams": True,  # also index adjacent word pairs ("dark mode")
+}
+
+# Scoring backend: "auto", "numpy" (sparse matrix, needs NumPy) or "python"
+BM25_BACKEND = os.environ.get("UIPRO_BM25_BACKEND", "auto")
+NUMPY_MIN_DOCS = 1000  # "auto" uses NumPy from this corpus size (see bench_backends.py)
+
 CSV_CONFIG = {
     "style": {
         "file": "styles.csv",
@@ -91,25 +114,185 @@ _STACK_COLS = {
 
 AVAILABLE_STACKS = list(STACK_CONFIG.keys())
 
+# Facets of the unified index: every domain, and every stack as "stack:<name>"
+FACETS = {**CSV_CONFIG, **{f"stack:{stack}": {**config, **_STACK_COLS} for stack, config in STACK_CONFIG.items()}}
+
+# BM25F field weights in the unified index (other search columns weigh 1.0)
+FIELD_BOOSTS = {
+    # Row names
+    "Style Category": 3.0,
+    "Product Type": 3.0,
+    "Pattern Name": 3.0,
+    "Font Pairing Name": 3.0,
+    "Data Type": 3.0,
+    "Icon Name": 3.0,
+    "Issue": 2.0,
+    "Guideline": 2.0,
+    # Curated keyword lists
+    "Keywords": 2.0,
+    "AI Prompt Keywords": 1.5,
+    "Mood/Style Keywords": 2.0,
+    "Best For": 1.5,
+    "Category": 1.5,
+}
+
+
+_np = None
+
+
+def _numpy():
+    """NumPy, imported on first use (it adds ~70 ms to a CLI call); None if not installed"""
+    global _np
+    if _np is None:
+        try:
+            import numpy
+            _np = numpy
+        except ImportError:  # Optional: scoring falls back to pure Python
+            _np = False
+    return _np or None
+
+
+# ============ TEXT ANALYSIS ============
+# Words the plural rules get wrong: not plurals ("news", "canvas") or irregular ("menus")
+_STEM_EXCEPTIONS = {
+    "news": "news", "series": "series", "species": "species", "saas": "saas", "canvas": "canvas",
+    "alias": "alias", "atlas": "atlas", "bebas": "bebas", "this": "this", "memphis": "memphis",
+    "chaos": "chaos", "macos": "macos", "visionos": "visionos",
+    "menus": "menu", "axes": "axis", "aliases": "alias", "bonuses": "bonus",
+    "caches": "cache", "niches": "niche", "quizzes": "quiz", "movies": "movie", "cookies": "cookie",
+}
+
+
+def _stem(word):
+    """S-stemmer: strip plural endings only ("icons" -> "icon", "categories" -> "category", "boxes" -> "box")"""
+    if word in _STEM_EXCEPTIONS:
+        return _STEM_EXCEPTIONS[word]
+    if len(word) <= 3 or not word.endswith("s") or word.endswith(("ss", "us", "sis", "xis")):
+        return word  # glass, status, analysis, axis
+    if word.endswith("ies") and not word.endswith(("eies", "aies")):
+        stem = word[:-3] + "y"  # categories
+    elif word.endswith(("sses", "ches", "shes", "xes", "zzes")):
+        stem = word[:-2]  # classes, switches, dashes, boxes, buzzes
+    else:
+        stem = word[:-1]  # icons, pages, cases
+    return stem if len(stem) >= 3 else word
+
+
+class Analyzer:
+    """
+    Text -> index terms.
+
+    Lowercase, split on punctuation, drop short words (keeping whitelisted
+    acronyms like "ui" and "3d"), stem plurals, replace synonyms (single
+    words or phrases) with their canonical term, then add adjacent-word
+    bigrams so phrase matches outrank scattered ones.
+    """
+
+    def __init__(self, min_length=3, keep_short=(), stem=True, synonyms=None, bigrams=True):
+        self.min_length = min_length
+        self.keep_short = frozenset(keep_short)
+        self.stem = stem
+        self.bigrams = bigrams
+        self._terms = {}  # word -> term (None if dropped), memoised
+
+        # Analysed synonym phrase -> analysed canonical phrase
+        self.synonyms = {}
+        for synonym, canonical in (synonyms or {}).items():
+            phrase, replacement = self._words(synonym), self._words(canonical)
+            if phrase and replacement and phrase != replacement:
+                self.synonyms[phrase] = replacement
+        self._max_phrase = max((len(phrase) for phrase in self.synonyms), default=0)
+
+    def __getstate__(self):
+        state = dict(self.__dict__)
+        state["_terms"] = {}  # Not worth caching to disk
+        return state
+
+    def key(self):
+        """Identifies this configuration; indexes built with another are rebuilt"""
+        config = (self.min_length, sorted(self.keep_short), self.stem, self.bigrams, sorted(self.synonyms.items()))
+        return hashlib.sha1(repr(config).encode("utf-8")).hexdigest()[:12]
+
+    def _term(self, word):
+        term = self._terms.get(word, False)
+        if term is False:
+            if len(word) < self.min_length and word not in self.keep_short:
+                term = None
+            else:
+                term = _stem(word) if self.stem else word
+            self._terms[word] = term
+        return term
+
+    def _words(self, text):
+        """Terms of text before synonyms and bigrams"""
+        words = re.sub(r'[^\w\s]', ' ', str(text).lower()).split()
+        return tuple(term for term in map(self._term, words) if term)
+
+    def _replace_synonyms(self, terms):
+        """Replace synonym phrases, longest first, with their canonical terms"""
+        output = []
+        i = 0
+        while i < len(terms):
+            for length in range(min(self._max_phrase, len(terms) - i), 0, -1):
+                replacement = self.synonyms.get(tuple(terms[i:i + length]))
+                if replacement:
+                    output.extend(replacement)
+                    i += length
+                    break
+            else:
+                output.append(terms[i])
+                i += 1
+        return output
+
+    def __call__(self, text):
+        terms = list(self._words(text))
+        if self.synonyms:
+            terms = self._replace_synonyms(terms)
+        if self.bigrams:
+            terms += [f"{first} {second}" for first, second in zip(terms, terms[1:])]
+        return terms
+
+
+_analyzer = None
+
+
+def get_analyzer():
+    """Get or create the analyzer configured by ANALYZER_CONFIG"""
+    global _analyzer
+    if _analyzer is None:
+        config = dict(ANALYZER_CONFIG)
+        synonyms = {}
+        if config.pop("synonyms") and (DATA_DIR / SYNONYMS_FILE).exists():
+            for row in _load_csv(DATA_DIR / SYNONYMS_FILE):
+                for synonym in row.get("Synonyms", "").split(","):
+                    if synonym.strip():
+                        synonyms[synonym.strip()] = row["Term"]
+        _analyzer = Analyzer(synonyms=synonyms, **config)
+    return _analyzer
+
 
 # ============ BM25 IMPLEMENTATION ============
 class BM25:
-    """BM25 ranking algorithm for text search"""
+    """BM25 ranking algorithm for text search, over an inverted index"""
 
-    def __init__(self, k1=1.5, b=0.75):
+    def __init__(self, k1=1.5, b=0.75, backend=None, analyzer=None):
         self.k1 = k1
         self.b = b
+        self.backend = backend or BM25_BACKEND
+        self.analyzer = analyzer or get_analyzer()
         self.corpus = []
         self.doc_lengths = []
         self.avgdl = 0
         self.idf = {}
         self.doc_freqs = defaultdict(int)
+        self.postings = {}  # term -> [(doc index, term frequency)]
+        self.norms = []     # per document: k1 * (1 - b + b * doc_len / avgdl)
+        self.csr = None     # NumPy backend: (term -> row, indptr, doc indices, BM25 weights)
         self.N = 0
 
     def tokenize(self, text):
-        """Lowercase, split, remove punctuation, filter short words"""
-        text = re.sub(r'[^\w\s]', ' ', str(text).lower())
-        return [w for w in text.split() if len(w) > 2]
+        """Index terms of text (see Analyzer)"""
+        return self.analyzer(text)
 
     def fit(self, documents):
         """Build BM25 index from documents"""
@@ -119,40 +302,207 @@ class BM25:
             return
         self.doc_lengths = [len(doc) for doc in self.corpus]
         self.avgdl = sum(self.doc_lengths) / self.N
+        self.norms = [self.k1 * (1 - self.b + self.b * doc_len / self.avgdl) for doc_len in self.doc_lengths]
 
-        for doc in self.corpus:
-            seen = set()
-            for word in doc:
-                if word not in seen:
-                    self.doc_freqs[word] += 1
-                    seen.add(word)
-
-        for word, freq in self.doc_freqs.items():
-            self.idf[word] = log((self.N - freq + 0.5) / (freq + 0.5) + 1)
+        postings = defaultdict(list)
+        for idx, doc in enumerate(self.corpus):
+            for word, tf in Counter(doc).items():
+                postings[word].append((idx, tf))
+        self.postings = dict(postings)
+
+        for word, plist in self.postings.items():
+            self.doc_freqs[word] = len(plist)
+            self.idf[word] = log((self.N - len(plist) + 0.5) / (len(plist) + 0.5) + 1)
+
+        if self.backend != "python" and (self.backend == "numpy" or self.N >= NUMPY_MIN_DOCS) and _numpy():
+            self._build_csr()
+
+    def _build_csr(self):
+        """Term-major CSR matrix of BM25 weights, so a query is a sparse dot product"""
+        np = _numpy()
+        terms = list(self.postings)
+        lengths = [len(self.postings[term]) for term in terms]
+        indptr = np.zeros(len(terms) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=indptr[1:])
+        nnz = int(indptr[-1])
+
+        indices = np.fromiter((idx for term in terms for idx, _ in self.postings[term]), dtype=np.int64, count=nnz)
+        tfs = np.fromiter((tf for term in terms for _, tf in self.postings[term]), dtype=np.float64, count=nnz)
+        idf = np.repeat(np.array([self.idf[term] for term in terms], dtype=np.float64), lengths)
+        weights = idf * tfs * (self.k1 + 1) / (tfs + np.asarray(self.norms, dtype=np.float64)[indices])
+
+        self.csr = ({term: row for row, term in enumerate(terms)}, indptr, indices, weights)
+
+    def _query_rows(self, query):
+        """(matrix row, occurrences) of the query's indexed terms"""
+        vocab = self.csr[0]
+        return [(vocab[token], count) for token, count in Counter(self.tokenize(query)).items() if token in vocab]
+
+    def _csr_top_k(self, scores, k):
+        """Best k of a dense score vector, ties in document order"""
+        np = _numpy()
+        candidates = np.flatnonzero(scores)
+        values = scores[candidates]
+        if len(candidates) > k:
+            # Keep everything tied with the k-th best, then order exactly
+            keep = values >= np.partition(values, len(values) - k)[len(values) - k]
+            candidates, values = candidates[keep], values[keep]
+        order = np.lexsort((candidates, -values))[:k]
+        return [(int(candidates[i]), float(values[i])) for i in order]
+
+    def _accumulate(self, query):
+        """Scores of the documents containing at least one query term"""
+        scores = defaultdict(float)
+        k1_plus_1 = self.k1 + 1
+        norms = self.norms
+        for token in self.tokenize(query):
+            plist = self.postings.get(token)
+            if plist is None:
+                continue
+            idf = self.idf[token]
+            for idx, tf in plist:
+                scores[idx] += idf * tf * k1_plus_1 / (tf + norms[idx])
+        return scores
 
     def score(self, query):
         """Score all documents against query"""
-        query_tokens = self.tokenize(query)
-        scores = []
-
-        for idx, doc in enumerate(self.corpus):
-            score = 0
-            doc_len = self.doc_lengths[idx]
-            term_freqs = defaultdict(int)
-            for word in doc:
-                term_freqs[word] += 1
-
-            for token in query_tokens:
-                if token in self.idf:
-                    tf = term_freqs[token]
-                    idf = self.idf[token]
-                    numerator = tf * (self.k1 + 1)
-                    denominator = tf + self.k1 * (1 - self.b + self.b * doc_len / self.avgdl)
-                    score += idf * numerator / denominator
+        scores = self._accumulate(query)
+        return sorted(((idx, scores.get(idx, 0)) for idx in range(self.N)), key=lambda x: x[1], reverse=True)
+
+    def top_k(self, query, k):
+        """Best k (doc index, score) pairs with score > 0, ties in document order"""
+        if k <= 0:
+            return []
+        if self.csr is not None:
+            np = _numpy()
+            _, indptr, indices, weights = self.csr
+            rows = self._query_rows(query)
+            if not rows:
+                return []
+            scores = np.bincount(
+                np.concatenate([indices[indptr[row]:indptr[row + 1]] for row, _ in rows]),
+                weights=np.concatenate([weights[indptr[row]:indptr[row + 1]] * count for row, count in rows]),
+                minlength=self.N
+            )
+            return self._csr_top_k(scores, k)
+
+        scores = self._accumulate(query)
+        return heapq.nlargest(k, scores.items(), key=lambda x: (x[1], -x[0]))
+
+    def top_k_batch(self, queries, k):
+        """top_k for many queries in one pass over the postings of their terms"""
+        if self.csr is not None:
+            # Each query is already one vectorised sparse product; a stacked
+            # (queries x documents) product measured slower (bench_backends.py)
+            return [self.top_k(query, k) for query in queries]
+
+        # Sparse query-term matrix: term -> {query index: occurrences}
+        query_terms = defaultdict(dict)
+        for qi, query in enumerate(queries):
+            for token, count in Counter(self.tokenize(query)).items():
+                if token in self.postings:
+                    query_terms[token][qi] = count
+
+        scores = [defaultdict(float) for _ in queries]
+        k1_plus_1 = self.k1 + 1
+        norms = self.norms
+        for token, counts in query_terms.items():
+            idf = self.idf[token]
+            for idx, tf in self.postings[token]:
+                weight = idf * tf * k1_plus_1 / (tf + norms[idx])
+                for qi, count in counts.items():
+                    scores[qi][idx] += weight * count
+
+        return [heapq.nlargest(k, s.items(), key=lambda x: (x[1], -x[0])) for s in scores]
+
+
+class BM25F:
+    """
+    BM25F over documents made of boosted fields, each document in one facet.
+
+    A term's frequency is summed across fields, each weighted by its boost
+    and normalised by the field's length against that field's average in the
+    facet; the sum is then saturated once, as in BM25.
+    """
+
+    tokenize = BM25.tokenize
+
+    def __init__(self, k1=1.2, b=0.75, boosts=None, analyzer=None):
+        self.k1 = k1
+        self.b = b
+        self.boosts = boosts or {}
+        self.analyzer = analyzer or get_analyzer()
+        self.idf = {}
+        self.postings = {}  # term -> [(doc index, BM25F weight)]
+        self.facets = []    # facet of each document
+        self.N = 0
 
-            scores.append((idx, score))
+    def fit(self, documents, facets):
+        """Build the index from {field: text} documents and their facets"""
+        tokenized = [{field: self.tokenize(text) for field, text in doc.items()} for doc in documents]
+        self.facets = list(facets)
+        self.N = len(tokenized)
+        if self.N == 0:
+            return
 
-        return sorted(scores, key=lambda x: x[1], reverse=True)
+        # Average length of each field within its facet
+        totals = defaultdict(lambda: [0, 0])
+        for doc, facet in zip(tokenized, self.facets):
+            for field, tokens in doc.items():
+                totals[(facet, field)][0] += len(tokens)
+                totals[(facet, field)][1] += 1
+        avg_lengths = {key: length / count for key, (length, count) in totals.items()}
+
+        pseudo_tfs = defaultdict(list)
+        for idx, (doc, facet) in enumerate(zip(tokenized, self.facets)):
+            weighted = defaultdict(float)
+            for field, tokens in doc.items():
+                if not tokens:
+                    continue
+                norm = 1 - self.b + self.b * len(tokens) / avg_lengths[(facet, field)]
+                boost = self.boosts.get(field, 1.0)
+                for word, tf in Counter(tokens).items():
+                    weighted[word] += boost * tf / norm
+            for word, tf in weighted.items():
+                pseudo_tfs[word].append((idx, tf))
+
+        for word, plist in pseudo_tfs.items():
+            idf = self.idf[word] = log((self.N - len(plist) + 0.5) / (len(plist) + 0.5) + 1)
+            self.postings[word] = [(idx, idf * tf * (self.k1 + 1) / (self.k1 + tf)) for idx, tf in plist]
+
+    def top_k_by_facet_batch(self, queries, limits):
+        """
+        Per query: {facet: best (doc index, score) pairs}, facets best-first.
+
+        limits maps each facet to search onto its number of results. Queries
+        are scored together in one pass over the postings of their terms.
+        """
+        query_terms = defaultdict(dict)
+        for qi, query in enumerate(queries):
+            for token, count in Counter(self.tokenize(query)).items():
+                if token in self.postings:
+                    query_terms[token][qi] = count
+
+        scores = [defaultdict(float) for _ in queries]
+        facets = self.facets
+        for token, counts in query_terms.items():
+            for idx, weight in self.postings[token]:
+                if facets[idx] in limits:
+                    for qi, count in counts.items():
+                        scores[qi][idx] += weight * count
+
+        results = []
+        for query_scores in scores:
+            by_facet = defaultdict(list)
+            for idx, score in query_scores.items():
+                by_facet[facets[idx]].append((idx, score))
+            ranked = {}
+            for facet, hits in by_facet.items():
+                best = heapq.nlargest(limits[facet], hits, key=lambda x: (x[1], -x[0]))
+                if best:
+                    ranked[facet] = best
+            results.append(dict(sorted(ranked.items(), key=lambda item: item[1][0][1], reverse=True)))
+        return results
 
 
 # ============ SEARCH FUNCTIONS ============
@@ -162,29 +512,101 @@ def _load_csv(filepath):
         return list(csv.DictReader(f))
 
 
-def _search_csv(filepath, search_cols, output_cols, query, max_results):
-    """Core search function using BM25"""
-    if not filepath.exists():
-        return []
+def _index_cache_path(filepath, search_cols):
+    """Cache file for a CSV indexed on the given columns"""
+    backend = BM25_BACKEND if importlib.util.find_spec("numpy") else "python"
+    key = "\0".join([str(filepath.resolve()), backend, get_analyzer().key(), *search_cols])
+    return INDEX_CACHE_DIR / f"{filepath.stem}-{hashlib.sha1(key.encode('utf-8')).hexdigest()[:12]}.pickle"
+
 
+def _build_index(filepath, search_cols):
+    """Parse a CSV and fit BM25 over its search columns"""
     data = _load_csv(filepath)
 
     # Build documents from search columns
     documents = [" ".join(str(row.get(col, "")) for col in search_cols) for row in data]
 
-    # BM25 search
     bm25 = BM25()
     bm25.fit(documents)
-    ranked = bm25.score(query)
+    return data, bm25
+
+
+def _load_cached(cache_path, source, build):
+    """build() result, from the compiled index cache while its source is unchanged"""
+    try:
+        with open(cache_path, "rb") as f:
+            cached = pickle.load(f)
+        if cached["format"] == INDEX_FORMAT and cached["source"] == source:
+            return cached["index"]
+    except Exception:
+        pass  # Missing, stale or unreadable: rebuild
+
+    index = build()
+
+    try:
+        INDEX_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        temp_path = cache_path.with_name(f".{cache_path.name}.{os.getpid()}")
+        with open(temp_path, "wb") as f:
+            pickle.dump({"format": INDEX_FORMAT, "source": source, "index": index},
+                        f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_path, cache_path)
+    except OSError:
+        pass  # Read-only install: search still works, just re-indexes each time
+
+    return index
+
+
+def _load_index(filepath, search_cols, source):
+    """Rows and fitted BM25 for a CSV, from the compiled index when it is current"""
+    return _load_cached(_index_cache_path(filepath, search_cols), source, lambda: _build_index(filepath, search_cols))
+
+
+# Indexes loaded by this process: (path, search columns) -> (source, rows, bm25),
+# and "unified" -> (source, (rows, BM25F))
+_INDEXES = {}
 
-    # Get top results with score > 0
-    results = []
-    for idx, score in ranked[:max_results]:
-        if score > 0:
-            row = data[idx]
-            results.append({col: row.get(col, "") for col in output_cols if col in row})
 
-    return results
+def get_index(filepath, search_cols):
+    """
+    Rows and fitted BM25 for a CSV, loaded at most once per process.
+
+    Every search in a run (e.g. the product, style, color, landing, typography
+    and page override lookups of one design system) shares the loaded index.
+    The CSV is stat'ed on each call, so an edited file is picked up.
+    """
+    stat = filepath.stat()
+    source = (stat.st_mtime_ns, stat.st_size)
+    key = (str(filepath), tuple(search_cols))
+
+    entry = _INDEXES.get(key)
+    if entry is None or entry[0] != source:
+        entry = _INDEXES[key] = (source, *_load_index(filepath, search_cols, source))
+    return entry[1], entry[2]
+
+
+def _rows(data, ranked, output_cols):
+    """Output columns of ranked rows"""
+    return [{col: data[idx].get(col, "") for col in output_cols if col in data[idx]} for idx, _ in ranked]
+
+
+def _search_csv(filepath, search_cols, output_cols, query, max_results):
+    """Core search function using BM25"""
+    if not filepath.exists():
+        return []
+
+    data, bm25 = get_index(filepath, search_cols)
+
+    # BM25 search (only documents sharing a term with the query are scored)
+    return _rows(data, bm25.top_k(query, max_results), output_cols)
+
+
+def _search_csv_batch(filepath, search_cols, output_cols, queries, max_results):
+    """_search_csv for many queries, scored together"""
+    if not filepath.exists():
+        return [[] for _ in queries]
+
+    data, bm25 = get_index(filepath, search_cols)
+    return [_rows(data, ranked, output_cols) for ranked in bm25.top_k_batch(queries, max_results)]
 
 
 def detect_domain(query):
@@ -251,3 +673,131 @@ def search_stack(query, stack, max_results=MAX_RESULTS):
         "count": len(results),
         "results": results
     }
+
+
+def search_batch(queries, domain=None, max_results=MAX_RESULTS):
+    """
+    Search many queries; returns one search() result per query, in order.
+
+    Queries for the same domain (given, or detected per query) are scored
+    together in one pass over that domain's index.
+    """
+    groups = defaultdict(list)
+    for i, query in enumerate(queries):
+        groups[domain or detect_domain(query)].append(i)
+
+    output = [None] * len(queries)
+    for group_domain, indexes in groups.items():
+        config = CSV_CONFIG.get(group_domain, CSV_CONFIG["style"])
+        filepath = DATA_DIR / config["file"]
+
+        if not filepath.exists():
+            for i in indexes:
+                output[i] = {"error": f"File not found: {filepath}", "domain": group_domain}
+            continue
+
+        group_queries = [queries[i] for i in indexes]
+        batch = _search_csv_batch(filepath, config["search_cols"], config["output_cols"], group_queries, max_results)
+        for i, results in zip(indexes, batch):
+            output[i] = {
+                "domain": group_domain,
+                "query": queries[i],
+                "file": config["file"],
+                "count": len(results),
+                "results": results
+            }
+
+    return output
+
+
+def search_stack_batch(queries, stack, max_results=MAX_RESULTS):
+    """Search stack-specific guidelines for many queries, scored together"""
+    if stack not in STACK_CONFIG:
+        return [{"error": f"Unknown stack: {stack}. Available: {', '.join(AVAILABLE_STACKS)}"} for _ in queries]
+
+    filepath = DATA_DIR / STACK_CONFIG[stack]["file"]
+
+    if not filepath.exists():
+        return [{"error": f"Stack file not found: {filepath}", "stack": stack} for _ in queries]
+
+    batch = _search_csv_batch(filepath, _STACK_COLS["search_cols"], _STACK_COLS["output_cols"], queries, max_results)
+
+    return [{
+        "domain": "stack",
+        "stack": stack,
+        "query": query,
+        "file": STACK_CONFIG[stack]["file"],
+        "count": len(results),
+        "results": results
+    } for query, results in zip(queries, batch)]
+
+
+# ============ UNIFIED SEARCH ============
+def _build_unified_index():
+    """Rows of every domain and stack CSV, and BM25F over their search columns"""
+    rows, documents, facets = [], [], []
+    for facet, config in FACETS.items():
+        filepath = DATA_DIR / config["file"]
+        if not filepath.exists():
+            continue
+        for row in _load_csv(filepath):
+            rows.append(row)
+            documents.append({col: str(row.get(col, "")) for col in config["search_cols"]})
+            facets.append(facet)
+
+    bm25f = BM25F(boosts=FIELD_BOOSTS)
+    bm25f.fit(documents, facets)
+    return rows, bm25f
+
+
+def get_unified_index():
+    """Rows and BM25F over every domain and stack, loaded at most once per process"""
+    source = []
+    for facet, config in FACETS.items():
+        filepath = DATA_DIR / config["file"]
+        if filepath.exists():
+            stat = filepath.stat()
+            source.append((config["file"], stat.st_mtime_ns, stat.st_size))
+    source = tuple(source)
+
+    entry = _INDEXES.get("unified")
+    if entry is None or entry[0] != source:
+        key = hashlib.sha1(f"{DATA_DIR.resolve()}\0{get_analyzer().key()}".encode("utf-8")).hexdigest()[:12]
+        entry = _INDEXES["unified"] = (source, _load_cached(INDEX_CACHE_DIR / f"unified-{key}.pickle", source, _build_unified_index))
+    return entry[1]
+
+
+def search_all(query, max_results=MAX_RESULTS):
+    """
+    Search every domain and stack in one pass over the unified index.
+
+    max_results is a count per facet, or {facet: count} to search only those
+    facets (domain names, and stacks as "stack:<name>"). Results are grouped
+    by facet in search() result form, best-scoring facet first.
+    """
+    return search_all_batch([query], max_results)[0]
+
+
+def search_all_batch(queries, max_results=MAX_RESULTS):
+    """search_all for many queries, scored together"""
+    rows, bm25f = get_unified_index()
+    limits = max_results if isinstance(max_results, dict) else {facet: max_results for facet in FACETS}
+    unknown = [facet for facet in limits if facet not in FACETS]
+    if unknown:
+        return [{"error": f"Unknown domain: {', '.join(unknown)}. Available: {', '.join(FACETS)}"} for _ in queries]
+
+    output = []
+    for query, ranked in zip(queries, bm25f.top_k_by_facet_batch(queries, limits)):
+        groups = {}
+        for facet, hits in ranked.items():
+            config = FACETS[facet]
+            results = _rows(rows, hits, config["output_cols"])
+            group = {"domain": "stack", "stack": facet[len("stack:"):]} if facet.startswith("stack:") else {"domain": facet}
+            group.update({"query": query, "file": config["file"], "count": len(results), "results": results})
+            groups[facet] = group
+        output.append({
+            "query": query,
+            "count": sum(group["count"] for group in groups.values()),
+            "domains": groups
+        })
+    return output
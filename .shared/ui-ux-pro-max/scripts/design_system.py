@@ -18,7 +18,7 @@ import json
 import os
 from datetime import datetime
 from pathlib import Path
-from core import search, DATA_DIR
+from core import search_all, search_all_batch, DATA_DIR
 
 
 # ============ CONFIGURATION ============
@@ -33,12 +33,57 @@ SEARCH_CONFIG = {
 }
 
 
+# ============ RULE LOOKUP ============
+class _Trie:
+    """Character trie over lowercased categories; each node keeps the first rule index below it"""
+    __slots__ = ("children", "first", "end")
+
+    def __init__(self):
+        self.children = {}
+        self.first = None  # first rule whose key passes through this node
+        self.end = None    # first rule whose key ends here
+
+    def insert(self, key: str, index: int):
+        node = self
+        if node.first is None:
+            node.first = index
+        for ch in key:
+            node = node.children.setdefault(ch, _Trie())
+            if node.first is None:
+                node.first = index
+        if node.end is None:
+            node.end = index
+
+    def first_with_prefix(self, prefix: str):
+        """First rule whose key starts with prefix, or None"""
+        node = self
+        for ch in prefix:
+            node = node.children.get(ch)
+            if node is None:
+                return None
+        return node.first
+
+    def first_key_in(self, text: str):
+        """First rule whose key occurs anywhere in text, or None"""
+        best = self.end
+        for start in range(len(text)):
+            node = self
+            for ch in text[start:]:
+                node = node.children.get(ch)
+                if node is None:
+                    break
+                if node.end is not None and (best is None or node.end < best):
+                    best = node.end
+        return best
+
+
 # ============ DESIGN SYSTEM GENERATOR ============
 class DesignSystemGenerator:
     """Generates design system recommendations from aggregated searches."""
 
     def __init__(self):
         self.reasoning_data = self._load_reasoning()
+        self._index_reasoning()
 
     def _load_reasoning(self) -> list:
         """Load reasoning rules from CSV."""
@@ -48,42 +93,52 @@ class DesignSystemGenerator:
         with open(filepath, 'r', encoding='utf-8') as f:
             return list(csv.DictReader(f))
 
-    def _multi_domain_search(self, query: str, style_priority: list = None) -> dict:
-        """Execute searches across multiple domains."""
-        results = {}
-        for domain, config in SEARCH_CONFIG.items():
-            if domain == "style" and style_priority:
-                # For style, also search with priority keywords
-                priority_query = " ".join(style_priority[:2]) if style_priority else query
-                combined_query = f"{query} {priority_query}"
-                results[domain] = search(combined_query, domain, config["max_results"])
-            else:
-                results[domain] = search(query, domain, config["max_results"])
-        return results
+    def _index_reasoning(self):
+        """Index rules by exact category; the fuzzy lookups wait for the first miss."""
+        self._exact_rules = {}
+        for index, rule in enumerate(self.reasoning_data):
+            self._exact_rules.setdefault(rule.get("UI_Category", "").lower(), index)
+        self._fuzzy_index = None
+
+    def _get_fuzzy_index(self) -> tuple:
+        """(category trie, suffix trie, keyword map, keyword lengths), built once."""
+        if self._fuzzy_index is None:
+            category_trie = _Trie()  # whole categories, to find one inside a query
+            suffix_trie = _Trie()    # every suffix, to find a query inside a category
+            keyword_rules = {}
+            for index, rule in enumerate(self.reasoning_data):
+                ui_cat = rule.get("UI_Category", "").lower()
+                category_trie.insert(ui_cat, index)
+                for start in range(len(ui_cat) + 1):
+                    suffix_trie.insert(ui_cat[start:], index)
+                for kw in ui_cat.replace("/", " ").replace("-", " ").split():
+                    keyword_rules.setdefault(kw, index)
+            self._fuzzy_index = (category_trie, suffix_trie, keyword_rules, sorted({len(kw) for kw in keyword_rules}))
+        return self._fuzzy_index
 
     def _find_reasoning_rule(self, category: str) -> dict:
         """Find matching reasoning rule for a category."""
         category_lower = category.lower()
 
         # Try exact match first
-        for rule in self.reasoning_data:
-            if rule.get("UI_Category", "").lower() == category_lower:
-                return rule
+        index = self._exact_rules.get(category_lower)
+        if index is not None:
+            return self.reasoning_data[index]
+
+        category_trie, suffix_trie, keyword_rules, keyword_lengths = self._get_fuzzy_index()
 
-        # Try partial match
-        for rule in self.reasoning_data:
-            ui_cat = rule.get("UI_Category", "").lower()
-            if ui_cat in category_lower or category_lower in ui_cat:
-                return rule
+        # Try partial match: a rule category inside this one, or this one inside a rule category
+        matches = [i for i in (category_trie.first_key_in(category_lower),
+                               suffix_trie.first_with_prefix(category_lower)) if i is not None]
 
         # Try keyword match
-        for rule in self.reasoning_data:
-            ui_cat = rule.get("UI_Category", "").lower()
-            keywords = ui_cat.replace("/", " ").replace("-", " ").split()
-            if any(kw in category_lower for kw in keywords):
-                return rule
+        if not matches:
+            matches = [keyword_rules[category_lower[start:start + length]]
+                       for length in keyword_lengths
+                       for start in range(len(category_lower) - length + 1)
+                       if category_lower[start:start + length] in keyword_rules]
 
-        return {}
+        return self.reasoning_data[min(matches)] if matches else {}
 
     def _apply_reasoning(self, category: str, search_results: dict) -> dict:
         """Apply reasoning rules to search results."""
@@ -127,26 +182,27 @@ class DesignSystemGenerator:
         if not priority_keywords:
             return results[0]
 
+        priorities = [priority.lower().strip() for priority in priority_keywords]
+        style_names = [result.get("Style Category", "").lower() for result in results]
+
         # First: try exact style name match
-        for priority in priority_keywords:
-            priority_lower = priority.lower().strip()
-            for result in results:
-                style_name = result.get("Style Category", "").lower()
-                if priority_lower in style_name or style_name in priority_lower:
+        for priority in priorities:
+            for result, style_name in zip(results, style_names):
+                if priority in style_name or style_name in priority:
                     return result
 
         # Second: score by keyword match in all fields
         scored = []
-        for result in results:
+        for result, style_name in zip(results, style_names):
+            keywords = result.get("Keywords", "").lower()
             result_str = str(result).lower()
             score = 0
-            for kw in priority_keywords:
-                kw_lower = kw.lower().strip()
+            for kw_lower in priorities:
                 # Higher score for style name match
-                if kw_lower in result.get("Style Category", "").lower():
+                if kw_lower in style_name:
                     score += 10
                 # Lower score for keyword field match
-                elif kw_lower in result.get("Keywords", "").lower():
+                elif kw_lower in keywords:
                     score += 3
                 # Even lower for other field matches
                 elif kw_lower in result_str:
@@ -162,21 +218,41 @@ class DesignSystemGenerator:
 
     def generate(self, query: str, project_name: str = None) -> dict:
         """Generate complete design system recommendation."""
-        # Step 1: First search product to get category
-        product_result = search(query, "product", 1)
-        product_results = product_result.get("results", [])
-        category = "General"
-        if product_results:
-            category = product_results[0].get("Product Type", "General")
-
-        # Step 2: Get reasoning rules for this category
-        reasoning = self._apply_reasoning(category, {})
-        style_priority = reasoning.get("style_priority", [])
-
-        # Step 3: Multi-domain search with style priority hints
-        search_results = self._multi_domain_search(query, style_priority)
-        search_results["product"] = product_result  # Reuse product search
+        return self.generate_batch([query], [project_name])[0]
+
+    def generate_batch(self, queries: list, project_names: list = None) -> list:
+        """Generate design systems for many queries, searched together."""
+        project_names = project_names or [None] * len(queries)
+
+        # Step 1: Search every domain at once (product picks the category)
+        limits = {domain: config["max_results"] for domain, config in SEARCH_CONFIG.items()}
+        all_search_results = [result["domains"] for result in search_all_batch(queries, limits)]
+
+        # Step 2: Get reasoning rules for each category
+        categories = []
+        reasonings = []
+        for search_results in all_search_results:
+            results = self._extract_results(search_results.get("product", {}))
+            category = results[0].get("Product Type", "General") if results else "General"
+            categories.append(category)
+            reasonings.append(self._apply_reasoning(category, {}))
+
+        # Step 3: Re-rank styles with the category's priority keywords, which
+        # are only known after step 1
+        prioritised = [i for i, reasoning in enumerate(reasonings) if reasoning.get("style_priority")]
+        style_queries = [f"{queries[i]} {' '.join(reasonings[i]['style_priority'][:2])}" for i in prioritised]
+        style_limit = {"style": SEARCH_CONFIG["style"]["max_results"]}
+        for i, result in zip(prioritised, search_all_batch(style_queries, style_limit)):
+            all_search_results[i]["style"] = result["domains"].get("style", {})
+
+        return [
+            self._build(query, project_name, category, reasoning, search_results)
+            for query, project_name, category, reasoning, search_results
+            in zip(queries, project_names, categories, reasonings, all_search_results)
+        ]
 
+    def _build(self, query: str, project_name: str, category: str, reasoning: dict, search_results: dict) -> dict:
+        """Build one design system from its searches and reasoning."""
         # Step 4: Select best matches from each domain using priority
         style_results = self._extract_results(search_results.get("style", {}))
         color_results = self._extract_results(search_results.get("color", {}))
@@ -236,6 +312,18 @@ class DesignSystemGenerator:
         }
 
 
+# Shared generator, so reasoning rules are loaded once per process
+_generator = None
+
+
+def get_generator() -> DesignSystemGenerator:
+    """Get or create the process-wide generator."""
+    global _generator
+    if _generator is None:
+        _generator = DesignSystemGenerator()
+    return _generator
+
+
 # ============ OUTPUT FORMATTERS ============
 BOX_WIDTH = 90  # Wider box for more content
 
@@ -475,8 +563,7 @@ def generate_design_system(query: str, project_name: str = None, output_format:
     Returns:
         Formatted design system string
     """
-    generator = DesignSystemGenerator()
-    design_system = generator.generate(query, project_name)
+    design_system = get_generator().generate(query, project_name)
     
     # Persist to files if requested
     if persist:
@@ -487,6 +574,24 @@ def generate_design_system(query: str, project_name: str = None, output_format:
     return format_ascii_box(design_system)
 
 
+def generate_design_systems(queries: list, project_names: list = None, output_format: str = "ascii",
+                            persist: bool = False, output_dir: str = None) -> list:
+    """
+    Generate design systems for many projects at once.
+
+    Each domain is searched once for all queries (see generate_design_system
+    for the arguments). Returns formatted strings in query order.
+    """
+    design_systems = get_generator().generate_batch(queries, project_names)
+
+    formatted = []
+    for query, design_system in zip(queries, design_systems):
+        if persist:
+            persist_design_system(design_system, None, output_dir, query)
+        formatted.append(format_markdown(design_system) if output_format == "markdown" else format_ascii_box(design_system))
+    return formatted
+
+
 # ============ PERSISTENCE FUNCTIONS ============
 def persist_design_system(design_system: dict, page: str = None, output_dir: str = None, page_query: str = None) -> dict:
     """
@@ -918,16 +1023,15 @@ def _generate_intelligent_overrides(page_name: str, page_query: str, design_syst
     Uses the existing search infrastructure to find relevant style, UX, and layout
     data instead of hardcoded page types.
     """
-    from core import search
-    
     page_lower = page_name.lower()
     query_lower = (page_query or "").lower()
     combined_context = f"{page_lower} {query_lower}"
     
     # Search across multiple domains for page-specific guidance
-    style_search = search(combined_context, "style", max_results=1)
-    ux_search = search(combined_context, "ux", max_results=3)
-    landing_search = search(combined_context, "landing", max_results=1)
+    domains = search_all(combined_context, {"style": 1, "ux": 3, "landing": 1})["domains"]
+    style_search = domains.get("style", {})
+    ux_search = domains.get("ux", {})
+    landing_search = domains.get("landing", {})
     
     # Extract results from search response
     style_results = style_search.get("results", [])
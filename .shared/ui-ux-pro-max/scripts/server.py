@@ -0,0 +1,226 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+UI/UX Pro Max Search Daemon - keeps every index warm and answers queries over a Unix socket
+Usage: python search.py --serve
+
+While it runs, search.py sends its queries here instead of loading indexes
+itself, and falls back to searching locally when no daemon answers.
+
+Protocol: one JSON request per line, one JSON response per line
+  {"op": "search", "query": "...", "domain": null, "max_results": 3, "version": 3}
+  {"ok": true, "result": {...}}
+  {"op": "batch", "requests": [{"op": "search", "query": "..."}, ...], "version": 3}
+  {"ok": true, "result": [{...}, ...]}
+"""
+
+import hashlib
+import json
+import os
+import signal
+import socket
+import socketserver
+import sys
+import tempfile
+from collections import defaultdict
+
+from core import (CSV_CONFIG, DATA_DIR, MAX_RESULTS, STACK_CONFIG, _STACK_COLS, get_index, get_unified_index,
+                  search, search_all, search_all_batch, search_batch, search_stack, search_stack_batch)
+
+# ============ CONFIGURATION ============
+PROTOCOL_VERSION = 3  # bump when requests or results change shape
+
+# One daemon per user and data directory
+SOCKET_PATH = os.environ.get("UIPRO_SOCKET") or os.path.join(
+    tempfile.gettempdir(),
+    f"uipro-{getattr(os, 'getuid', lambda: 0)()}-{hashlib.sha1(str(DATA_DIR.resolve()).encode('utf-8')).hexdigest()[:8]}.sock"
+)
+
+CLIENT_TIMEOUT = 10.0  # seconds before the CLI gives up and searches locally
+
+
+# ============ REQUESTS ============
+_BATCH_OPS = ("search", "search_all", "search_stack", "design_system")
+
+
+def validate_request(request):
+    """Why a batch item can't run, or None if it can"""
+    if not isinstance(request, dict):
+        return f"Request must be a JSON object, got {type(request).__name__}"
+    op = request.get("op", "search")
+    if op not in _BATCH_OPS:
+        return f"Unknown op: {op!r} (expected one of {', '.join(_BATCH_OPS)})"
+    if not isinstance(request.get("query"), str) or not request["query"].strip():
+        return "query must be a non-empty string"
+
+    max_results = request.get("max_results", MAX_RESULTS)
+    if op == "search_all" and isinstance(max_results, dict):
+        if not all(isinstance(n, int) and not isinstance(n, bool) for n in max_results.values()):
+            return "max_results must map facets to integers"
+    elif op != "design_system" and (not isinstance(max_results, int) or isinstance(max_results, bool)):
+        return "max_results must be an integer"
+
+    if op == "search" and request.get("domain") is not None and request["domain"] not in CSV_CONFIG:
+        return f"Unknown domain: {request['domain']!r} (expected one of {', '.join(CSV_CONFIG)})"
+    if op == "search_stack" and request.get("stack") not in STACK_CONFIG:
+        return f"Unknown stack: {request.get('stack')!r} (expected one of {', '.join(STACK_CONFIG)})"
+    if op == "design_system" and not isinstance(request.get("project_name") or "", str):
+        return "project_name must be a string"
+    return None
+
+
+def execute(request):
+    """Run one request; shared by the daemon and the CLI's local fallback"""
+    op = request.get("op")
+    if op == "search":
+        return search(request["query"], request.get("domain"), request.get("max_results", MAX_RESULTS))
+    if op == "search_all":
+        return search_all(request["query"], request.get("max_results", MAX_RESULTS))
+    if op == "search_stack":
+        return search_stack(request["query"], request["stack"], request.get("max_results", MAX_RESULTS))
+    if op == "design_system":
+        from design_system import generate_design_system  # Not needed by daemon clients
+        return generate_design_system(
+            request["query"],
+            request.get("project_name"),
+            request.get("format", "ascii"),
+            persist=request.get("persist", False),
+            page=request.get("page"),
+            output_dir=request.get("output_dir")
+        )
+    if op == "batch":
+        return execute_batch(request["requests"])
+    if op == "ping":
+        return PROTOCOL_VERSION
+    raise ValueError(f"Unknown op: {op}")
+
+
+def execute_batch(requests):
+    """
+    Run many requests; returns their results in order.
+
+    Searches of the same domain or stack with the same max_results are scored
+    together, and design systems are generated with one batch per domain.
+    Design systems come back as dicts rather than formatted text. An invalid
+    request, or a group that fails, gets {"error": ...} in its slots while
+    the rest still run.
+    """
+    results = [None] * len(requests)
+    groups = defaultdict(list)
+    for i, request in enumerate(requests):
+        error = validate_request(request)
+        if error:
+            results[i] = {"error": error}
+            continue
+        op = request.get("op", "search")
+        max_results = request.get("max_results", MAX_RESULTS)
+        if op == "search":
+            groups[(op, request.get("domain"), max_results)].append(i)
+        elif op == "search_stack":
+            groups[(op, request["stack"], max_results)].append(i)
+        elif op == "search_all":
+            # max_results may be a {facet: count} dict
+            groups[(op, json.dumps(max_results, sort_keys=True))].append(i)
+        else:
+            groups[(op,)].append(i)
+
+    for key, indexes in groups.items():
+        queries = [requests[i]["query"] for i in indexes]
+        try:
+            if key[0] == "search":
+                batch = search_batch(queries, key[1], key[2])
+            elif key[0] == "search_stack":
+                batch = search_stack_batch(queries, key[1], key[2])
+            elif key[0] == "search_all":
+                batch = search_all_batch(queries, json.loads(key[1]))
+            else:
+                from design_system import get_generator
+                batch = get_generator().generate_batch(queries, [requests[i].get("project_name") for i in indexes])
+        except Exception as e:
+            batch = [{"error": f"{type(e).__name__}: {e}"}] * len(indexes)
+        for i, result in zip(indexes, batch):
+            results[i] = result
+
+    return results
+
+
+def warm():
+    """Load every domain and stack index, the unified index and the reasoning rules"""
+    from design_system import get_generator
+
+    configs = list(CSV_CONFIG.values()) + [{**config, **_STACK_COLS} for config in STACK_CONFIG.values()]
+    for config in configs:
+        filepath = DATA_DIR / config["file"]
+        if filepath.exists():
+            get_index(filepath, config["search_cols"])
+    get_unified_index()
+    get_generator()
+
+
+# ============ DAEMON ============
+class _Handler(socketserver.StreamRequestHandler):
+    """Answers newline-delimited JSON requests until the client disconnects"""
+
+    def handle(self):
+        for line in self.rfile:
+            try:
+                request = json.loads(line)
+                if request.get("version") != PROTOCOL_VERSION:
+                    raise ValueError(f"Protocol version {request.get('version')} != {PROTOCOL_VERSION}")
+                response = {"ok": True, "result": execute(request)}
+            except Exception as e:
+                response = {"ok": False, "error": f"{type(e).__name__}: {e}"}
+            self.wfile.write(json.dumps(response, ensure_ascii=False).encode("utf-8") + b"\n")
+            self.wfile.flush()
+
+
+def serve(socket_path=SOCKET_PATH):
+    """Warm all indexes and answer queries until interrupted"""
+    if not hasattr(socket, "AF_UNIX"):
+        raise SystemExit("--serve needs Unix domain sockets, which this platform lacks")
+    if query_daemon({"op": "ping"}, socket_path=socket_path) is not None:
+        raise SystemExit(f"A search daemon is already serving on {socket_path}")
+
+    warm()
+
+    # Remove a socket left behind by a daemon that was killed
+    if os.path.exists(socket_path):
+        os.unlink(socket_path)
+
+    old_umask = os.umask(0o177)  # socket readable by this user only
+    try:
+        server = socketserver.ThreadingUnixStreamServer(socket_path, _Handler)
+    finally:
+        os.umask(old_umask)
+    server.daemon_threads = True
+
+    signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+    print(f"UI/UX Pro Max search daemon serving on {socket_path} (Ctrl+C to stop)", file=sys.stderr)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        if os.path.exists(socket_path):
+            os.unlink(socket_path)
+
+
+# ============ CLIENT ============
+def query_daemon(request, socket_path=SOCKET_PATH, timeout=CLIENT_TIMEOUT):
+    """Result of a request from the running daemon, or None if none answered"""
+    if not hasattr(socket, "AF_UNIX") or not os.path.exists(socket_path):
+        return None
+
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(timeout)
+            sock.connect(socket_path)
+            sock.sendall(json.dumps({**request, "version": PROTOCOL_VERSION}).encode("utf-8") + b"\n")
+            with sock.makefile("rb") as f:
+                line = f.readline()
+        response = json.loads(line)
+    except (OSError, ValueError):
+        return None  # Not running, stale socket or timed out
+
+    return response["result"] if response.get("ok") else None
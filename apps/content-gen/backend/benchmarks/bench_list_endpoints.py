@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""Latency benchmark for the paginated list endpoints.
+
+Seeds a throwaway SQLite database with articles, ideas and published videos,
+then requests 100-item pages from each list endpoint and reports p50/p99.
+
+Usage:
+    python benchmarks/bench_list_endpoints.py [--rows 2000] [--requests 300]
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+# Add backend to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+_workdir = tempfile.mkdtemp(prefix="cg_bench_")
+os.chdir(_workdir)
+os.environ.setdefault("OPENAI_API_KEY", "bench")
+os.environ["DATABASE_URL"] = f"sqlite:///{_workdir}/bench.db"
+
+
+def seed(rows: int) -> None:
+    """Insert `rows` articles, ideas and published videos."""
+    from content_gen_backend.database import SessionLocal, init_db
+    from content_gen_backend.models.news import NewsArticleDB
+    from content_gen_backend.models.idea import VideoIdeaDB
+    from content_gen_backend.models.publishing import PublishedVideoDB
+
+    init_db()
+    db = SessionLocal()
+    now = datetime.utcnow()
+    body = "Lorem ipsum dolor sit amet, consectetur adipiscing elit. " * 20
+    for i in range(rows):
+        article_id = uuid4()
+        idea_id = uuid4()
+        db.add(NewsArticleDB(
+            id=article_id,
+            title=f"Article {i}",
+            description=body[:200],
+            content=body,
+            url=f"https://example.com/{i}",
+            source="Bench Wire",
+            category="technology",
+            published_at=now - timedelta(minutes=i),
+            image_url=f"https://example.com/{i}.jpg",
+        ))
+        db.add(VideoIdeaDB(
+            id=idea_id,
+            article_id=article_id,
+            title=f"Idea {i}",
+            concept=body[:200],
+            video_prompt=body,
+            style="comedic",
+        ))
+        db.add(PublishedVideoDB(
+            id=uuid4(),
+            video_id=f"video_{i}",
+            idea_id=idea_id,
+            platform="youtube",
+            status="published",
+            title=f"Video {i}",
+            description=body[:500],
+            tags=["coffee", "news", "bench"],
+            privacy="public",
+            published_at=now,
+        ))
+    db.commit()
+    db.close()
+
+
+def percentile(samples: list[float], pct: float) -> float:
+    """Nearest-rank percentile."""
+    ordered = sorted(samples)
+    index = max(0, min(len(ordered) - 1, int(round(pct / 100 * len(ordered))) - 1))
+    return ordered[index]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="List endpoint latency benchmark")
+    parser.add_argument("--rows", type=int, default=2000, help="Rows to seed per table")
+    parser.add_argument("--requests", type=int, default=300, help="Requests per endpoint")
+    args = parser.parse_args()
+
+    seed(args.rows)
+
+    from fastapi.testclient import TestClient
+    from content_gen_backend.main import app
+
+    endpoints = [
+        "/api/v1/news?page_size=100",
+        "/api/v1/ideas?page_size=100",
+        "/api/v1/publish?page_size=100",
+    ]
+
+    print("=" * 60)
+    print(f"List endpoints: {args.rows} rows, {args.requests} requests each")
+    print("=" * 60)
+
+    with TestClient(app) as client:
+        for endpoint in endpoints:
+            for _ in range(10):  # warm up
+                client.get(endpoint)
+
+            timings = []
+            for i in range(args.requests):
+                page = i % max(1, args.rows // 100) + 1
+                start = time.perf_counter()
+                response = client.get(f"{endpoint}&page={page}")
+                timings.append((time.perf_counter() - start) * 1000)
+                response.raise_for_status()
+
+            print(
+                f"{endpoint:<32} p50={statistics.median(timings):6.2f} ms  "
+                f"p99={percentile(timings, 99):6.2f} ms"
+            )
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
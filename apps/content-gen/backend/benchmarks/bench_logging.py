@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""Request throughput benchmark with logging enabled.
+
+Adds a route that logs like a status poll (a few INFO lines and DEBUG lines
+per request) and measures requests/second through the app, first with the
+file and console handlers attached directly to the logger (synchronous I/O
+on the request path) and then through the queue listener pipeline.
+
+Console output goes to /dev/null so terminal speed doesn't skew results.
+
+Usage:
+    python benchmarks/bench_logging.py [--requests 2000] [--lines 5] [--sample-rate 10]
+"""
+
+import argparse
+import logging
+import os
+import sys
+import tempfile
+import time
+
+# Add backend to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+_workdir = tempfile.mkdtemp(prefix="cg_bench_")
+os.chdir(_workdir)
+os.environ.setdefault("OPENAI_API_KEY", "bench")
+os.environ["DATABASE_URL"] = f"sqlite:///{_workdir}/bench.db"
+
+_stdout = sys.stdout
+
+
+def configure(mode: str, json_format: bool, sample_rate: int) -> logging.Logger:
+    """Install the logging pipeline for `mode` ("direct" or "queue")."""
+    from content_gen_backend.utils import logging_setup
+
+    sys.stdout = open(os.devnull, "w")
+    try:
+        logger = logging_setup.setup_logging(
+            log_level=logging.DEBUG,
+            json_format=json_format,
+            debug_sample_rate=sample_rate,
+        )
+    finally:
+        sys.stdout = _stdout
+
+    if mode == "direct":
+        # Pre-queue behaviour: handlers called on the logging thread
+        handlers = logging_setup._listener.handlers
+        logging_setup._stop_listener()
+        logger.handlers.clear()
+        for handler in handlers:
+            logger.addHandler(handler)
+    return logger
+
+
+def percentile(samples: list[float], pct: float) -> float:
+    """Nearest-rank percentile."""
+    ordered = sorted(samples)
+    index = max(0, min(len(ordered) - 1, int(round(pct / 100 * len(ordered))) - 1))
+    return ordered[index]
+
+
+def run(requests: int, lines: int) -> tuple[float, float]:
+    """Return (requests/second, p99 ms) for the logging route."""
+    from fastapi.testclient import TestClient
+    from content_gen_backend.main import app
+
+    with TestClient(app) as client:
+        for _ in range(20):  # warm up
+            client.get("/bench/log", params={"lines": lines})
+
+        timings = []
+        start = time.perf_counter()
+        for _ in range(requests):
+            begin = time.perf_counter()
+            client.get("/bench/log", params={"lines": lines}).raise_for_status()
+            timings.append((time.perf_counter() - begin) * 1000)
+        return requests / (time.perf_counter() - start), percentile(timings, 99)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Logging throughput benchmark")
+    parser.add_argument("--requests", type=int, default=2000, help="Requests per configuration")
+    parser.add_argument("--lines", type=int, default=5, help="INFO and DEBUG lines logged per request")
+    parser.add_argument("--sample-rate", type=int, default=10, help="DEBUG sample rate for the sampled run")
+    args = parser.parse_args()
+
+    from content_gen_backend.main import app
+    from content_gen_backend.utils.logging_setup import logger
+
+    @app.get("/bench/log")
+    async def bench_log(lines: int = 5):
+        for i in range(lines):
+            logger.info("Fetching status for video: %s (%d)", "video_bench", i)
+            logger.debug("Video %s status: %s, progress: %s", "video_bench", "in_progress", i * 10)
+        return {"ok": True}
+
+    configurations = [
+        ("direct", False, 1),
+        ("queue", False, 1),
+        ("queue", True, 1),
+        ("queue", False, args.sample_rate),
+    ]
+
+    print("=" * 60)
+    print(f"Logging throughput: {args.requests} requests, {args.lines} INFO + {args.lines} DEBUG lines each")
+    print("=" * 60)
+
+    for mode, json_format, sample_rate in configurations:
+        configure(mode, json_format, sample_rate)
+        rps, p99 = run(args.requests, args.lines)
+        label = f"{mode}, {'json' if json_format else 'text'}, debug 1/{sample_rate}"
+        print(f"{label:<32} {rps:8.1f} req/s  p99={p99:6.2f} ms")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
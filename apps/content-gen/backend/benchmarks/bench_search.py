@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""Latency benchmark for the full-text search endpoints.
+
+Seeds a throwaway SQLite database with synthetic articles and ideas, then
+runs ranked searches through /api/v1/news/search and /api/v1/ideas/search.
+
+Usage:
+    python benchmarks/bench_search.py [--rows 200000] [--requests 200]
+"""
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime
+from itertools import accumulate
+from uuid import uuid4
+
+# Add backend to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+_workdir = tempfile.mkdtemp(prefix="cg_bench_")
+os.chdir(_workdir)
+os.environ.setdefault("OPENAI_API_KEY", "bench")
+os.environ["DATABASE_URL"] = f"sqlite:///{_workdir}/bench.db"
+
+SYLLABLES = ["ka", "ro", "mi", "te", "su", "na", "lo", "vi", "de", "pa", "zu", "ge", "bo", "xi", "fa", "ly"]
+
+# ~5k synthetic words drawn with a Zipf-like skew, so common words match many
+# rows and rare words few, roughly like real news text
+WORDS = sorted({a + b + c for a in SYLLABLES for b in SYLLABLES for c in SYLLABLES})
+CUM_WEIGHTS = list(accumulate(1.0 / (rank + 1) for rank in range(len(WORDS))))
+
+
+def sentence(rng: random.Random, n: int) -> str:
+    return " ".join(rng.choices(WORDS, cum_weights=CUM_WEIGHTS, k=n))
+
+
+def seed(rows: int) -> None:
+    """Bulk insert `rows` articles and ideas (FTS triggers index them)."""
+    from content_gen_backend.database import engine, init_db
+    from content_gen_backend.models.news import NewsArticleDB
+    from content_gen_backend.models.idea import VideoIdeaDB
+
+    init_db()
+    rng = random.Random(42)
+    now = datetime.utcnow()
+    batch = 5000
+    with engine.begin() as conn:
+        for start in range(0, rows, batch):
+            articles, ideas = [], []
+            for i in range(start, min(start + batch, rows)):
+                article_id = uuid4()
+                articles.append({
+                    "id": article_id,
+                    "title": sentence(rng, 8),
+                    "description": sentence(rng, 25),
+                    "content": sentence(rng, 80),
+                    "url": f"https://example.com/{i}",
+                    "source": "Bench Wire",
+                    "category": "general",
+                    "created_at": now,
+                    "is_processed": False,
+                })
+                ideas.append({
+                    "id": uuid4(),
+                    "article_id": article_id,
+                    "title": sentence(rng, 6),
+                    "concept": sentence(rng, 20),
+                    "video_prompt": sentence(rng, 60),
+                    "estimated_duration": 45,
+                    "is_approved": False,
+                    "created_at": now,
+                })
+            conn.execute(NewsArticleDB.__table__.insert(), articles)
+            conn.execute(VideoIdeaDB.__table__.insert(), ideas)
+
+
+def percentile(samples: list[float], pct: float) -> float:
+    """Nearest-rank percentile."""
+    ordered = sorted(samples)
+    index = max(0, min(len(ordered) - 1, int(round(pct / 100 * len(ordered))) - 1))
+    return ordered[index]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Full-text search latency benchmark")
+    parser.add_argument("--rows", type=int, default=200000, help="Rows to seed per table")
+    parser.add_argument("--requests", type=int, default=200, help="Searches per endpoint")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    seed(args.rows)
+    print(f"Seeded {args.rows} articles and ideas in {time.perf_counter() - start:.1f}s")
+
+    from fastapi.testclient import TestClient
+    from content_gen_backend.main import app
+
+    rng = random.Random(7)
+    queries = [sentence(rng, 2) for _ in range(args.requests)]
+
+    print("=" * 60)
+    print(f"Search endpoints: {args.rows} rows, {args.requests} queries each")
+    print("=" * 60)
+
+    with TestClient(app) as client:
+        for endpoint in ["/api/v1/news/search", "/api/v1/ideas/search"]:
+            timings = []
+            for query in queries:
+                begin = time.perf_counter()
+                response = client.get(endpoint, params={"q": query, "page_size": 20})
+                timings.append((time.perf_counter() - begin) * 1000)
+                response.raise_for_status()
+
+            print(
+                f"{endpoint:<24} p50={statistics.median(timings):7.2f} ms  "
+                f"p99={percentile(timings, 99):7.2f} ms"
+            )
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
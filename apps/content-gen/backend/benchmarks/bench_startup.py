@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""Cold-start benchmark for the FastAPI application.
+
+Each run starts a fresh interpreter and measures:
+
+  import    time to `import content_gen_backend.main`
+  first     time from process start to the first /health response
+
+Usage:
+    python benchmarks/bench_startup.py [--runs 10] [--importtime]
+
+With --importtime, also prints the slowest modules from `python -X importtime`.
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+SRC = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src")
+
+_CHILD = """
+import time
+start = time.perf_counter()
+import content_gen_backend.main as main
+imported = time.perf_counter()
+from fastapi.testclient import TestClient
+with TestClient(main.app) as client:
+    client.get("/health").raise_for_status()
+first = time.perf_counter()
+print(f"{(imported - start) * 1000:.1f} {(first - start) * 1000:.1f}")
+"""
+
+
+def child_env(workdir: str) -> dict:
+    env = dict(os.environ)
+    env["PYTHONPATH"] = SRC
+    env.setdefault("OPENAI_API_KEY", "bench")
+    env["DATABASE_URL"] = f"sqlite:///{workdir}/bench.db"
+    return env
+
+
+def run_once(workdir: str) -> tuple[float, float]:
+    """Return (import ms, first response ms) for one fresh interpreter."""
+    result = subprocess.run(
+        [sys.executable, "-c", _CHILD],
+        cwd=workdir,
+        env=child_env(workdir),
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    import_ms, first_ms = result.stdout.strip().splitlines()[-1].split()
+    return float(import_ms), float(first_ms)
+
+
+def slowest_imports(workdir: str, top: int = 15) -> list[tuple[int, str]]:
+    """Cumulative import time (us) of the slowest top-level imports."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import content_gen_backend.main"],
+        cwd=workdir,
+        env=child_env(workdir),
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    rows = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        # Only direct children of the app import and its packages
+        if len(name) - len(name.lstrip()) <= 3:
+            rows.append((int(cumulative), name.strip()))
+    return sorted(rows, reverse=True)[:top]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Application cold-start benchmark")
+    parser.add_argument("--runs", type=int, default=10, help="Fresh interpreters to start")
+    parser.add_argument("--importtime", action="store_true", help="Show slowest imports")
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix="cg_bench_")
+    run_once(workdir)  # warm the bytecode cache
+
+    imports, firsts = [], []
+    for _ in range(args.runs):
+        import_ms, first_ms = run_once(workdir)
+        imports.append(import_ms)
+        firsts.append(first_ms)
+
+    print("=" * 60)
+    print(f"Cold start: {args.runs} fresh interpreters")
+    print("=" * 60)
+    print(f"{'import main':<24} median={statistics.median(imports):8.1f} ms  min={min(imports):8.1f} ms")
+    print(f"{'first /health':<24} median={statistics.median(firsts):8.1f} ms  min={min(firsts):8.1f} ms")
+
+    if args.importtime:
+        print()
+        print("Slowest imports (cumulative):")
+        for cumulative, name in slowest_imports(workdir):
+            print(f"  {cumulative / 1000:8.1f} ms  {name}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,5 +1,8 @@
 """Configuration settings for the Content Generation Backend."""
 
+from functools import lru_cache
+from typing import Literal, Optional
+
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -14,6 +17,8 @@ class Settings(BaseSettings):
     default_size: str = "1280x720"
     default_seconds: int = 4
     max_file_size: int = 10485760  # 10MB
+    reference_storage_path: str = "./references"  # Normalised reference images
+    public_base_url: str = ""  # Externally reachable URL of this API, for images providers fetch
 
     # Database Configuration
     database_url: str = "sqlite:///./content_gen.db"
@@ -29,6 +34,55 @@ class Settings(BaseSettings):
     # Kie.ai API (for Veo 3.1 video generation)
     kie_api_key: str = ""
 
+    # Auto model routing (model="auto")
+    routing_objective: Literal["fastest", "cheapest"] = "fastest"
+    routing_max_cost: Optional[float] = None  # USD per video
+    routing_max_latency: Optional[float] = None  # Expected seconds until completed
+    routing_min_success_rate: float = 0.5
+
+    # Duplicate request handling for POST /api/v1/videos
+    idempotency_key_ttl_seconds: float = 86400.0
+    dedup_ttl_seconds: float = 600.0  # Identical requests reuse the job; 0 = only while in flight
+
+    # Batch video generation (POST /api/v1/videos/batches)
+    batch_max_items: int = 100
+    batch_provider_concurrency: dict[str, int] = {"sora": 4, "kie_veo": 2, "kie_wan": 2}  # Jobs running at once
+    batch_poll_interval: float = 10.0
+    batch_job_timeout: float = 1800.0
+
+    # Upstream rate limits: token bucket per "provider" or "provider:operation"
+    rate_limit_backend: Literal["local", "redis"] = "local"  # redis shares buckets across workers
+    rate_limits_per_minute: dict[str, float] = {
+        "sora": 120.0,
+        "sora:create": 30.0,
+        "kie_veo": 60.0,
+        "kie_veo:create": 10.0,
+        "kie_wan": 60.0,
+        "kie_wan:create": 10.0,
+    }
+    rate_limit_burst: float = 5.0  # Tokens a bucket can save up
+    rate_limit_max_retries: int = 2  # Retries of a call answered with 429
+
+    # Background download of completed jobs into local storage
+    prefetch_enabled: bool = True
+    prefetch_concurrency: int = 3  # Assets downloading at once
+
+    # Thumbnails, spritesheets and previews generated locally with ffmpeg
+    ffmpeg_workers: int = 2  # ffmpeg processes running at once
+    ffmpeg_timeout: float = 120.0
+    thumbnail_width: int = 640
+    spritesheet_frames: int = 16
+    preview_height: int = 360
+
+    # Provider resilience
+    create_deadline_seconds: float = 60.0  # Whole create request, including fallbacks
+    status_deadline_seconds: float = 15.0
+    status_hedge_delay: Optional[float] = None  # Seconds before asking Wan about an unrecorded Kie job; None disables
+    circuit_failure_rate: float = 0.5
+    circuit_window_seconds: float = 60.0
+    circuit_min_requests: int = 5
+    circuit_open_seconds: float = 30.0
+
     # Social Media Publishing Configuration
     youtube_client_id: str = ""
     youtube_client_secret: str = ""
@@ -49,5 +103,18 @@ class Settings(BaseSettings):
     )
 
 
-# Global settings instance
-settings = Settings()
+@lru_cache
+def get_settings() -> Settings:
+    """Load settings from the environment on first use."""
+    return Settings()
+
+
+class _LazySettings:
+    """Stand-in for the settings instance that loads it on first attribute access."""
+
+    def __getattr__(self, name: str):
+        return getattr(get_settings(), name)
+
+
+# Global settings instance (loaded lazily, so importing config has no side effects)
+settings: Settings = _LazySettings()  # type: ignore[assignment]
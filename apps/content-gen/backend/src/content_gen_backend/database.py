@@ -1,26 +1,45 @@
 """Database configuration and session management."""
 
+from functools import lru_cache
 from sqlalchemy import create_engine
+from sqlalchemy.engine import Engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, Session
 from typing import Generator
 
-from .config import settings
-
-# Create SQLAlchemy engine
-engine = create_engine(
-    settings.database_url,
-    connect_args={"check_same_thread": False} if settings.database_url.startswith("sqlite") else {},
-    echo=False  # Set to True for SQL query logging
-)
-
-# Create session factory
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+from .config import get_settings
 
 # Base class for declarative models
 Base = declarative_base()
 
 
+@lru_cache
+def get_engine() -> Engine:
+    """Create the SQLAlchemy engine on first use, from settings.database_url."""
+    database_url = get_settings().database_url
+    return create_engine(
+        database_url,
+        connect_args={"check_same_thread": False} if database_url.startswith("sqlite") else {},
+        echo=False  # Set to True for SQL query logging
+    )
+
+
+@lru_cache
+def get_sessionmaker() -> sessionmaker:
+    """Session factory bound to the engine, created on first use."""
+    return sessionmaker(autocommit=False, autoflush=False, bind=get_engine())
+
+
+def __getattr__(name: str):
+    # `engine` and `SessionLocal` stay importable for scripts; they are built
+    # when first imported rather than when this module is
+    if name == "engine":
+        return get_engine()
+    if name == "SessionLocal":
+        return get_sessionmaker()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 def get_db() -> Generator[Session, None, None]:
     """
     Dependency function to get database session.
@@ -30,7 +49,7 @@ def get_db() -> Generator[Session, None, None]:
         def read_items(db: Session = Depends(get_db)):
             return db.query(Item).all()
     """
-    db = SessionLocal()
+    db = get_sessionmaker()()
     try:
         yield db
     finally:
@@ -39,7 +58,18 @@ def get_db() -> Generator[Session, None, None]:
 
 def init_db() -> None:
     """
-    Initialize database by creating all tables.
+    Initialize database by creating all tables and full-text search indexes.
     Should be called on application startup.
     """
+    from .services.search_service import init_search_indexes
+
+    engine = get_engine()
     Base.metadata.create_all(bind=engine)
+
+    # create_all() skips tables that already exist, so indexes added to a
+    # model later are created here, on existing databases, if missing
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(bind=engine, checkfirst=True)
+
+    init_search_indexes(engine)
@@ -1,9 +1,16 @@
+import asyncio
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import Response
 from .routers import videos, news, ideas, publishing
-from .utils.logging_setup import logger
+from .utils.logging_setup import configure_logging
+from .utils import metrics
+from .utils.uploads import UploadLimitMiddleware
 from .database import init_db
 
+logger = configure_logging()
+
 app = FastAPI(
     title="Content Gen Backend",
     description="AI-powered content generation with Sora video API, news aggregation, and creative ideation",
@@ -19,6 +26,12 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Reject oversized multipart uploads while they stream in
+app.add_middleware(UploadLimitMiddleware)
+
+# Request latency per route, served at /metrics
+app.add_middleware(metrics.MetricsMiddleware)
+
 # Include routers
 app.include_router(videos.router)
 app.include_router(news.router)
@@ -35,6 +48,12 @@ async def health_check():
     return {"status": "healthy", "service": "content-gen-backend", "version": "1.0.0"}
 
 
+@app.get("/metrics", include_in_schema=False)
+async def metrics_endpoint():
+    """Prometheus metrics endpoint."""
+    return Response(content=metrics.render(), media_type=metrics.CONTENT_TYPE)
+
+
 @app.on_event("startup")
 async def startup_event():
     """Application startup event."""
@@ -47,13 +66,20 @@ async def startup_event():
     except Exception as e:
         logger.error(f"Failed to initialize database: {str(e)}")
 
+    app.state.loop_lag_monitor = asyncio.create_task(metrics.monitor_event_loop_lag())
+
     logger.info("Video API endpoints available at /api/v1/videos")
     logger.info("News API endpoints available at /api/v1/news")
     logger.info("Ideas API endpoints available at /api/v1/ideas")
     logger.info("Publishing API endpoints available at /api/v1/publish")
+    logger.info("Metrics available at /metrics")
 
 
 @app.on_event("shutdown")
 async def shutdown_event():
     """Application shutdown event."""
     logger.info("Application shutting down...")
+
+    monitor = getattr(app.state, "loop_lag_monitor", None)
+    if monitor:
+        monitor.cancel()
@@ -1,13 +1,23 @@
 """Pydantic models for video generation."""
 
-from .video_request import CreateVideoRequest, RemixVideoRequest
-from .video_response import VideoJob, VideoListResponse, VideoDeleteResponse, ErrorDetail
+from .video_request import CreateVideoRequest, RemixVideoRequest, CreateVideoBatchRequest
+from .video_response import (
+    VideoJob,
+    VideoListResponse,
+    VideoDeleteResponse,
+    ErrorDetail,
+    VideoBatch,
+    VideoBatchItem,
+)
 
 __all__ = [
     "CreateVideoRequest",
     "RemixVideoRequest",
+    "CreateVideoBatchRequest",
     "VideoJob",
     "VideoListResponse",
     "VideoDeleteResponse",
     "ErrorDetail",
+    "VideoBatch",
+    "VideoBatchItem",
 ]
@@ -42,7 +42,45 @@ class VideoIdeaDB(Base):
     is_approved = Column(Boolean, default=False, nullable=False, index=True)
     approved_by = Column(String(100), nullable=True)
     approved_at = Column(DateTime, nullable=True)
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False, index=True)
+
+
+# Columns loaded for idea responses (projected queries skip ORM hydration)
+VIDEO_IDEA_COLUMNS = (
+    VideoIdeaDB.id,
+    VideoIdeaDB.article_id,
+    VideoIdeaDB.title,
+    VideoIdeaDB.concept,
+    VideoIdeaDB.video_prompt,
+    VideoIdeaDB.style,
+    VideoIdeaDB.estimated_duration,
+    VideoIdeaDB.is_approved,
+    VideoIdeaDB.approved_by,
+    VideoIdeaDB.approved_at,
+    VideoIdeaDB.created_at,
+)
+
+
+def video_idea_to_dict(row) -> dict:
+    """
+    Map an idea row to VideoIdeaResponse fields.
+
+    Accepts either a VideoIdeaDB instance or a row projected from
+    VIDEO_IDEA_COLUMNS.
+    """
+    return {
+        "id": str(row.id),
+        "article_id": str(row.article_id),
+        "title": row.title,
+        "concept": row.concept,
+        "video_prompt": row.video_prompt,
+        "style": row.style,
+        "estimated_duration": row.estimated_duration,
+        "is_approved": row.is_approved,
+        "approved_by": row.approved_by,
+        "approved_at": row.approved_at,
+        "created_at": row.created_at,
+    }
 
 
 # Pydantic Models for API
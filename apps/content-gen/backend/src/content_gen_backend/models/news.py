@@ -76,10 +76,48 @@ class NewsArticleDB(Base):
     category = Column(String(50), nullable=True, index=True)
     published_at = Column(DateTime, nullable=True)
     image_url = Column(String(1000), nullable=True)
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False, index=True)
     is_processed = Column(Boolean, default=False, nullable=False, index=True)
 
 
+# Columns loaded for article responses (projected queries skip ORM hydration)
+NEWS_ARTICLE_COLUMNS = (
+    NewsArticleDB.id,
+    NewsArticleDB.title,
+    NewsArticleDB.description,
+    NewsArticleDB.content,
+    NewsArticleDB.url,
+    NewsArticleDB.source,
+    NewsArticleDB.category,
+    NewsArticleDB.published_at,
+    NewsArticleDB.image_url,
+    NewsArticleDB.created_at,
+    NewsArticleDB.is_processed,
+)
+
+
+def news_article_to_dict(row) -> dict:
+    """
+    Map an article row to NewsArticleResponse fields.
+
+    Accepts either a NewsArticleDB instance or a row projected from
+    NEWS_ARTICLE_COLUMNS.
+    """
+    return {
+        "id": str(row.id),
+        "title": row.title,
+        "description": row.description,
+        "content": row.content,
+        "url": row.url,
+        "source": row.source,
+        "category": row.category,
+        "published_at": row.published_at,
+        "image_url": row.image_url,
+        "created_at": row.created_at,
+        "is_processed": row.is_processed,
+    }
+
+
 # Pydantic Models for API
 class NewsArticleBase(BaseModel):
     """Base model for news article."""
@@ -85,10 +85,51 @@ class PublishedVideoDB(Base):
     retry_count = Column(Integer, default=0, nullable=False)
 
     # Timestamps
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False, index=True)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
 
 
+# Columns loaded for publish responses (projected queries skip ORM hydration)
+PUBLISHED_VIDEO_COLUMNS = (
+    PublishedVideoDB.id,
+    PublishedVideoDB.video_id,
+    PublishedVideoDB.idea_id,
+    PublishedVideoDB.platform,
+    PublishedVideoDB.status,
+    PublishedVideoDB.platform_video_id,
+    PublishedVideoDB.platform_url,
+    PublishedVideoDB.title,
+    PublishedVideoDB.description,
+    PublishedVideoDB.tags,
+    PublishedVideoDB.category,
+    PublishedVideoDB.privacy,
+    PublishedVideoDB.scheduled_at,
+    PublishedVideoDB.published_at,
+    PublishedVideoDB.created_at,
+    PublishedVideoDB.updated_at,
+    PublishedVideoDB.views,
+    PublishedVideoDB.likes,
+    PublishedVideoDB.comments,
+    PublishedVideoDB.shares,
+    PublishedVideoDB.last_analytics_update,
+    PublishedVideoDB.error_message,
+    PublishedVideoDB.retry_count,
+)
+
+
+def published_video_to_dict(row) -> dict:
+    """
+    Map a published video row to PublishResponse fields.
+
+    Accepts either a PublishedVideoDB instance or a row projected from
+    PUBLISHED_VIDEO_COLUMNS.
+    """
+    data = {column.key: getattr(row, column.key) for column in PUBLISHED_VIDEO_COLUMNS}
+    data["id"] = str(row.id)
+    data["idea_id"] = str(row.idea_id) if row.idea_id else None
+    return data
+
+
 class PlatformCredentialDB(Base):
     """Database model for storing platform credentials."""
 
@@ -0,0 +1,39 @@
+"""Local record of video generation jobs across providers."""
+
+from datetime import datetime
+
+from sqlalchemy import Column, DateTime, Index, Integer, String, Text
+
+from ..database import Base
+
+
+# SQLAlchemy ORM Model
+class VideoJobDB(Base):
+    """Database model for video jobs created on any provider."""
+
+    __tablename__ = "video_jobs"
+    __table_args__ = (
+        # Keyset pagination for the merged listing
+        Index("ix_video_jobs_created_at_id", "created_at", "id"),
+    )
+
+    id = Column(String(100), primary_key=True)  # Provider job ID
+    provider = Column(String(20), nullable=False, index=True)  # sora, kie_veo, kie_wan
+    model = Column(String(50), nullable=False)
+    status = Column(String(20), nullable=False, index=True)
+    progress = Column(Integer, nullable=True)
+    prompt = Column(Text, nullable=True)
+    size = Column(String(20), nullable=False)
+    seconds = Column(String(10), nullable=False)
+
+    # Unix timestamps, as reported by the provider
+    created_at = Column(Integer, nullable=False)
+    completed_at = Column(Integer, nullable=True)
+    expires_at = Column(Integer, nullable=True)
+
+    video_url = Column(Text, nullable=True)
+    remixed_from_video_id = Column(String(100), nullable=True)
+    error_message = Column(Text, nullable=True)
+    error_type = Column(String(50), nullable=True)
+
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
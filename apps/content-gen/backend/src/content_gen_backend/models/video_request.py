@@ -1,7 +1,8 @@
 """Request models for video generation endpoints."""
 
 from typing import Literal, Optional
-from pydantic import BaseModel, Field
+from uuid import UUID
+from pydantic import BaseModel, Field, model_validator
 
 
 class CreateVideoRequest(BaseModel):
@@ -34,3 +35,36 @@ class RemixVideoRequest(BaseModel):
                 "prompt": "Change the cat to orange and add confetti falling"
             }
         }
+
+
+class CreateVideoBatchRequest(BaseModel):
+    """Request model for generating many videos at once."""
+
+    prompts: list[str] = Field(default_factory=list, description="Text prompts, one video each")
+    idea_ids: list[UUID] = Field(default_factory=list, description="Video ideas whose prompts to generate")
+    model: Literal["sora-2", "sora-2-pro", "veo-3.1", "wan-2.5", "auto"] = Field(
+        default="auto", description="Video generation model for every item"
+    )
+    seconds: int = Field(default=4, description="Duration in seconds")
+    size: str = Field(default="1280x720", description="Output resolution (widthxheight)")
+    max_cost: Optional[float] = Field(default=None, gt=0, description="For auto, max USD per video")
+    max_latency: Optional[float] = Field(default=None, gt=0, description="For auto, max expected seconds per video")
+
+    @model_validator(mode="after")
+    def check_not_empty(self) -> "CreateVideoBatchRequest":
+        if not self.prompts and not self.idea_ids:
+            raise ValueError("Provide at least one prompt or idea ID")
+        if any(not prompt.strip() or len(prompt) > 2000 for prompt in self.prompts):
+            raise ValueError("Prompts must be 1-2000 characters")
+        return self
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "prompts": ["A calico cat playing piano on stage under spotlight"],
+                "idea_ids": [],
+                "model": "auto",
+                "seconds": 8,
+                "size": "1280x720",
+            }
+        }
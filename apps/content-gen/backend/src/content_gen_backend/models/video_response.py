@@ -57,3 +57,32 @@ class VideoDeleteResponse(BaseModel):
     id: str = Field(..., description="Deleted video ID")
     object: str = Field(default="video", description="Object type")
     deleted: bool = Field(default=True, description="Deletion confirmation")
+
+
+class VideoBatchItem(BaseModel):
+    """One video of a batch."""
+
+    index: int = Field(..., description="Position in the batch")
+    prompt: str = Field(..., description="Prompt being generated")
+    idea_id: Optional[str] = Field(None, description="Source video idea, if any")
+    model: Optional[str] = Field(None, description="Model the item was scheduled on")
+    status: Literal["pending", "queued", "in_progress", "completed", "failed"] = Field(
+        default="pending", description="pending until a provider slot is free, then the job status"
+    )
+    progress: int = Field(default=0, ge=0, le=100, description="Progress percentage")
+    video: Optional[VideoJob] = Field(None, description="Latest job status")
+    error: Optional[str] = Field(None, description="Why the item failed")
+
+
+class VideoBatch(BaseModel):
+    """Aggregate status of a batch of video generation jobs."""
+
+    id: str = Field(..., description="Unique batch identifier")
+    object: str = Field(default="video.batch", description="Object type")
+    status: Literal["in_progress", "completed"] = Field(..., description="completed once every item finished")
+    created_at: int = Field(..., description="Unix timestamp of creation")
+    completed_at: Optional[int] = Field(None, description="Unix timestamp of completion")
+    total: int = Field(..., description="Number of items")
+    counts: dict[str, int] = Field(default_factory=dict, description="Items per status")
+    progress: int = Field(default=0, ge=0, le=100, description="Mean progress across items")
+    items: List[VideoBatchItem] = Field(default_factory=list, description="Per-item status")
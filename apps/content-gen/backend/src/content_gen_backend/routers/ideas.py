@@ -14,7 +14,9 @@ from ..models.idea import (
     VideoStyle,
 )
 from ..services.idea_service import IdeaService
+from ..services.search_service import SearchService
 from ..utils.logging_setup import logger
+from ..utils.serialization import json_response
 
 router = APIRouter(prefix="/api/v1/ideas", tags=["ideas"])
 
@@ -89,19 +91,56 @@ async def list_ideas(
 
         total_pages = (total + page_size - 1) // page_size
 
-        return VideoIdeaListResponse(
-            ideas=ideas,
-            total=total,
-            page=page,
-            page_size=page_size,
-            total_pages=total_pages,
-        )
+        # Rows are already shaped like VideoIdeaListResponse; serialise
+        # them directly instead of validating every idea again
+        return json_response({
+            "ideas": ideas,
+            "total": total,
+            "page": page,
+            "page_size": page_size,
+            "total_pages": total_pages,
+        })
 
     except Exception as e:
         logger.error(f"Error listing ideas: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Failed to list ideas: {str(e)}")
 
 
+@router.get("/search", response_model=VideoIdeaListResponse)
+async def search_ideas(
+    q: str = Query(..., min_length=1, max_length=200, description="Search query"),
+    page: int = Query(1, ge=1, description="Page number"),
+    page_size: int = Query(20, ge=1, le=100, description="Ideas per page"),
+    db: Session = Depends(get_db),
+):
+    """
+    Full-text search over idea titles, concepts and video prompts.
+
+    Results are ranked by relevance, with title matches weighted highest.
+
+    - **q**: Search query
+    - **page**: Page number (starts at 1)
+    - **page_size**: Number of ideas per page (1-100)
+    """
+    try:
+        search_service = SearchService(db)
+        offset = (page - 1) * page_size
+
+        ideas, total = search_service.search_ideas(q, limit=page_size, offset=offset)
+
+        return json_response({
+            "ideas": ideas,
+            "total": total,
+            "page": page,
+            "page_size": page_size,
+            "total_pages": (total + page_size - 1) // page_size,
+        })
+
+    except Exception as e:
+        logger.error(f"Error searching ideas: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Failed to search ideas: {str(e)}")
+
+
 @router.get("/{idea_id}", response_model=VideoIdeaResponse)
 async def get_idea(
     idea_id: str,
@@ -12,7 +12,9 @@ from ..models.news import (
     NewsCategory,
 )
 from ..services.news_service import NewsService
+from ..services.search_service import SearchService
 from ..utils.logging_setup import logger
+from ..utils.serialization import json_response
 
 router = APIRouter(prefix="/api/v1/news", tags=["news"])
 
@@ -84,19 +86,56 @@ async def list_news(
 
         total_pages = (total + page_size - 1) // page_size
 
-        return NewsArticleListResponse(
-            articles=articles,
-            total=total,
-            page=page,
-            page_size=page_size,
-            total_pages=total_pages,
-        )
+        # Rows are already shaped like NewsArticleListResponse; serialise
+        # them directly instead of validating every article again
+        return json_response({
+            "articles": articles,
+            "total": total,
+            "page": page,
+            "page_size": page_size,
+            "total_pages": total_pages,
+        })
 
     except Exception as e:
         logger.error(f"Error listing news: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Failed to list news: {str(e)}")
 
 
+@router.get("/search", response_model=NewsArticleListResponse)
+async def search_news(
+    q: str = Query(..., min_length=1, max_length=200, description="Search query"),
+    page: int = Query(1, ge=1, description="Page number"),
+    page_size: int = Query(20, ge=1, le=100, description="Articles per page"),
+    db: Session = Depends(get_db),
+):
+    """
+    Full-text search over article titles, descriptions and content.
+
+    Results are ranked by relevance, with title matches weighted highest.
+
+    - **q**: Search query
+    - **page**: Page number (starts at 1)
+    - **page_size**: Number of articles per page (1-100)
+    """
+    try:
+        search_service = SearchService(db)
+        offset = (page - 1) * page_size
+
+        articles, total = search_service.search_articles(q, limit=page_size, offset=offset)
+
+        return json_response({
+            "articles": articles,
+            "total": total,
+            "page": page,
+            "page_size": page_size,
+            "total_pages": (total + page_size - 1) // page_size,
+        })
+
+    except Exception as e:
+        logger.error(f"Error searching news: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Failed to search news: {str(e)}")
+
+
 @router.get("/{article_id}", response_model=NewsArticleResponse)
 async def get_news_article(
     article_id: str,
@@ -13,6 +13,7 @@ from sqlalchemy.orm import Session
 from ..config import settings
 from ..database import get_db
 from ..models.publishing import (
+    PUBLISHED_VIDEO_COLUMNS,
     Platform,
     PublishStatus,
     PublishedVideoDB,
@@ -24,22 +25,18 @@ from ..models.publishing import (
     AnalyticsSnapshot,
     BulkPublishRequest,
     YouTubeMetadata,
+    published_video_to_dict,
 )
 from ..models.idea import VideoIdeaDB
-from ..services.metadata_service import MetadataGenerationService
+from ..services.metadata_service import MetadataGenerationService, get_metadata_service
 from ..services.youtube_service import get_youtube_service
+from ..utils.serialization import json_response
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/v1/publish", tags=["publishing"])
 
 
-# Dependency for metadata service
-def get_metadata_service() -> MetadataGenerationService:
-    """Get metadata generation service."""
-    return MetadataGenerationService()
-
-
 @router.post("/metadata", response_model=MetadataGenerationResponse)
 async def generate_metadata(
     request: MetadataGenerationRequest,
@@ -248,7 +245,7 @@ async def list_published_videos(
     - Video ID
     - Idea ID
     """
-    query = db.query(PublishedVideoDB)
+    query = db.query(*PUBLISHED_VIDEO_COLUMNS)
 
     # Apply filters
     if platform:
@@ -265,18 +262,16 @@ async def list_published_videos(
 
     # Apply pagination
     offset = (page - 1) * page_size
-    videos = query.order_by(PublishedVideoDB.created_at.desc()).offset(offset).limit(page_size).all()
-
-    # Convert to response models
-    video_responses = [PublishResponse.model_validate(v) for v in videos]
-
-    return PublishListResponse(
-        videos=video_responses,
-        total=total,
-        page=page,
-        page_size=page_size,
-        total_pages=(total + page_size - 1) // page_size,
-    )
+    rows = query.order_by(PublishedVideoDB.created_at.desc()).offset(offset).limit(page_size).all()
+
+    # Serialise projected rows directly instead of validating each PublishResponse
+    return json_response({
+        "videos": [published_video_to_dict(row) for row in rows],
+        "total": total,
+        "page": page,
+        "page_size": page_size,
+        "total_pages": (total + page_size - 1) // page_size,
+    })
 
 
 @router.get("/{publish_id}", response_model=PublishResponse)
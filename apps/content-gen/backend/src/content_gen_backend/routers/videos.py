@@ -1,10 +1,10 @@
 """API endpoints for video generation."""
 
 from typing import Optional, Literal, Annotated
-from fastapi import APIRouter, HTTPException, File, UploadFile, Form, Query
-from fastapi.responses import StreamingResponse
+from fastapi import APIRouter, Depends, HTTPException, File, UploadFile, Form, Query, Header, Response
+from fastapi.responses import FileResponse, StreamingResponse
 from pydantic import field_validator, Field
-import io
+from sqlalchemy.orm import Session
 
 from ..models import (
     CreateVideoRequest,
@@ -12,109 +12,329 @@ from ..models import (
     VideoJob,
     VideoListResponse,
     VideoDeleteResponse,
+    CreateVideoBatchRequest,
+    VideoBatch,
 )
-from ..services import SoraService, StorageService
-from ..services.model_router_service import ModelRouterService
+from ..models.idea import VideoIdeaDB
+from ..database import get_db
+from ..services import StorageService, get_storage_service
+from ..services.batch_service import BatchService, get_batch_service
+from ..services.derivative_service import DerivativeKind, DerivativeService, get_derivative_service
+from ..services.idempotency_service import (
+    IdempotencyConflictError,
+    IdempotencyService,
+    get_idempotency_service,
+    request_fingerprint,
+)
+from ..services.model_router_service import ModelRouterService, RoutingPolicy, get_model_router
+from ..services.prefetch_service import PrefetchService, get_prefetch_service
+from ..services.reference_asset_service import ReferenceAssetService, get_reference_asset_service
 from ..config import settings
 from ..utils.logging_setup import logger
+from ..utils.resilience import CircuitOpenError, deadline, hedge
+from ..utils.uploads import UploadTooLargeError, inspect_image_upload
 
 router = APIRouter(prefix="/api/v1/videos", tags=["videos"])
 
-# Initialize services
-sora_service = SoraService()
-storage_service = StorageService()
-model_router = ModelRouterService()  # Phase 3: Multi-model support
+
+def _validate_duration(model: str, seconds: int) -> None:
+    """
+    Check that `model` can generate a video of `seconds`.
+
+    Raises:
+        HTTPException: 400 if the duration is not supported
+    """
+    if model == "auto":
+        # For auto mode, accept all valid durations (will be validated by selected model)
+        if seconds not in [4, 5, 8, 10, 12]:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Invalid duration. Must be 4, 5, 8, 10, or 12 seconds, got {seconds}",
+            )
+    elif model in ["veo-3.1", "wan-2.5"]:
+        if seconds not in [5, 10]:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Invalid duration for {model}. Must be 5 or 10 seconds, got {seconds}",
+            )
+    elif model in ["sora-2", "sora-2-pro"]:
+        if seconds not in [4, 8, 12]:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Invalid duration for Sora. Must be 4, 8, or 12 seconds, got {seconds}",
+            )
 
 
 @router.post("", response_model=VideoJob, status_code=201)
 async def create_video(
+    response: Response,
     prompt: str = Form(...),
-    model: Literal["sora-2", "sora-2-pro", "veo-3.1", "wan-2.5", "auto"] = Form(settings.default_model),
-    seconds: int = Form(settings.default_seconds),
-    size: str = Form(settings.default_size),
+    model: Optional[Literal["sora-2", "sora-2-pro", "veo-3.1", "wan-2.5", "auto"]] = Form(None),
+    seconds: Optional[int] = Form(None),
+    size: Optional[str] = Form(None),
     input_reference: Optional[UploadFile] = File(None),
     image_url: Optional[str] = Form(None),
+    max_cost: Optional[float] = Form(None, gt=0),
+    max_latency: Optional[float] = Form(None, gt=0),
+    idempotency_key: Optional[str] = Header(None, alias="Idempotency-Key", max_length=255),
+    model_router: ModelRouterService = Depends(get_model_router),
+    idempotency: IdempotencyService = Depends(get_idempotency_service),
+    reference_assets: ReferenceAssetService = Depends(get_reference_asset_service),
 ):
     """
     Create a new video generation job (Phase 3: Multi-model support).
 
+    Retried requests (same Idempotency-Key) and identical requests within
+    the de-duplication window return the job the first one created, with an
+    `Idempotent-Replayed: true` header, instead of paying for a new one.
+
     Args:
         prompt: Text description of the video to generate
-        model: Model to use (sora-2, sora-2-pro, veo-3.1, wan-2.5, or auto for intelligent selection)
-        seconds: Duration in seconds (4, 8, or 12 for Sora; 5 or 10 for Veo/Wan)
-        size: Resolution as widthxheight (e.g., 1280x720)
-        input_reference: Optional reference image (Sora only)
+        model: Model to use (sora-2, sora-2-pro, veo-3.1, wan-2.5, or auto for intelligent selection;
+            default: DEFAULT_MODEL)
+        seconds: Duration in seconds (4, 8, or 12 for Sora; 5 or 10 for Veo/Wan; default: DEFAULT_SECONDS)
+        size: Resolution as widthxheight (e.g., 1280x720; default: DEFAULT_SIZE)
+        input_reference: Optional reference image, resized to `size` (Sora; Wan 2.5 via
+            its stored URL when PUBLIC_BASE_URL is set)
         image_url: Optional image URL for image-to-video (Wan 2.5)
+        max_cost: For auto, only pick models costing at most this many USD
+        max_latency: For auto, only pick models expected to finish within this many seconds
+        idempotency_key: Optional client-chosen key identifying this request
 
     Returns:
         VideoJob with initial status
     """
+    # Defaults come from settings here rather than in the signature, which is
+    # evaluated when the router is imported
+    model = model or settings.default_model
+    seconds = settings.default_seconds if seconds is None else seconds
+    size = size or settings.default_size
+
     try:
-        # Validate seconds parameter based on model
-        if model == "auto":
-            # For auto mode, accept all valid durations (will be validated by selected model)
-            if seconds not in [4, 5, 8, 10, 12]:
-                raise HTTPException(
-                    status_code=400,
-                    detail=f"Invalid duration. Must be 4, 5, 8, 10, or 12 seconds, got {seconds}",
-                )
-        elif model in ["veo-3.1", "wan-2.5"]:
-            if seconds not in [5, 10]:
-                raise HTTPException(
-                    status_code=400,
-                    detail=f"Invalid duration for {model}. Must be 5 or 10 seconds, got {seconds}",
-                )
-        elif model in ["sora-2", "sora-2-pro"]:
-            if seconds not in [4, 8, 12]:
-                raise HTTPException(
-                    status_code=400,
-                    detail=f"Invalid duration for Sora. Must be 4, 8, or 12 seconds, got {seconds}",
-                )
+        _validate_duration(model, seconds)
 
         logger.info(f"Received create video request: model={model}, seconds={seconds}, size={size}")
 
         # Handle input reference if provided
         reference_bytes = None
         if input_reference:
-            # Validate file size
-            content = await input_reference.read()
-            if len(content) > settings.max_file_size:
-                raise HTTPException(
-                    status_code=413,
-                    detail=f"File too large. Maximum size is {settings.max_file_size} bytes",
-                )
+            # Checked in chunks from the spooled upload; the type is sniffed
+            # from the contents rather than the client's content type
+            try:
+                upload = await inspect_image_upload(input_reference, settings.max_file_size)
+            except UploadTooLargeError as e:
+                raise HTTPException(status_code=413, detail=str(e))
+            except ValueError as e:
+                raise HTTPException(status_code=400, detail=str(e))
 
-            # Validate file type
-            if not input_reference.content_type or not input_reference.content_type.startswith("image/"):
-                raise HTTPException(
-                    status_code=400,
-                    detail="Input reference must be an image (JPEG, PNG, or WebP)",
+            # Stored once per image and size; repeat uploads reuse the normalised copy
+            try:
+                reference = await reference_assets.prepare(upload.file, upload.digest, size)
+            except ValueError as e:
+                raise HTTPException(status_code=400, detail=str(e))
+            reference_bytes = await reference.read()
+            logger.info(
+                f"Reference image received: {input_reference.filename} "
+                f"({upload.media_type}, {upload.size} bytes), stored as {reference.name}"
+            )
+
+            if model == "wan-2.5" and not image_url:
+                # Wan fetches its image by URL
+                if reference.url is None:
+                    raise HTTPException(
+                        status_code=400,
+                        detail="Wan 2.5 needs a public image URL: pass image_url or set PUBLIC_BASE_URL",
+                    )
+                image_url = reference.url
+
+        async def generate() -> VideoJob:
+            # Phase 3: Use ModelRouter for multi-model support
+            # One deadline covers the chosen model and any fallback
+            with deadline(settings.create_deadline_seconds):
+                return await model_router.generate_video(
+                    prompt=prompt,
+                    model=model,
+                    seconds=seconds,
+                    size=size,
+                    input_reference=reference_bytes,
+                    image_url=image_url,  # For Wan 2.5 image-to-video
+                    policy=RoutingPolicy.from_settings(max_cost=max_cost, max_latency=max_latency),
                 )
 
-            reference_bytes = content
-            logger.info(f"Reference image received: {input_reference.filename}, size: {len(content)} bytes")
-
-        # Phase 3: Use ModelRouter for multi-model support
-        video = await model_router.generate_video(
-            prompt=prompt,
-            model=model,
-            seconds=seconds,
-            size=size,
-            input_reference=reference_bytes,
-            image_url=image_url,  # For Wan 2.5 image-to-video
+        fingerprint = request_fingerprint(
+            prompt,
+            model,
+            seconds,
+            size,
+            reference_bytes,
+            image_url=image_url,
+            max_cost=max_cost,
+            max_latency=max_latency,
         )
+        video, replayed = await idempotency.create_once(fingerprint, generate, idempotency_key)
+        if replayed:
+            response.headers["Idempotent-Replayed"] = "true"
 
         return video
 
     except HTTPException:
         raise
+    except IdempotencyConflictError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+    except CircuitOpenError as e:
+        raise HTTPException(status_code=503, detail=str(e))
+    except TimeoutError as e:
+        logger.warning(f"Video creation timed out: {str(e)}")
+        raise HTTPException(status_code=504, detail=f"Video creation timed out: {str(e)}")
     except Exception as e:
         logger.error(f"Error creating video: {str(e)}", exc_info=True)
         raise HTTPException(status_code=500, detail=f"Failed to create video: {str(e)}")
 
 
+@router.get("/routing/stats")
+async def get_routing_stats(model_router: ModelRouterService = Depends(get_model_router)):
+    """
+    Get the live per-model estimates used by auto model selection.
+
+    Returns:
+        Expected latency (seconds), success rate, job counts and provider
+        circuit state per model
+    """
+    return model_router.get_routing_stats()
+
+
+@router.post("/batches", response_model=VideoBatch, status_code=202)
+async def create_video_batch(
+    request: CreateVideoBatchRequest,
+    db: Session = Depends(get_db),
+    batch_service: BatchService = Depends(get_batch_service),
+):
+    """
+    Generate many videos in one call.
+
+    Items are scheduled in the background with per-provider concurrency and
+    rate limits. Follow progress with GET /batches/{batch_id} or stream it
+    from GET /batches/{batch_id}/events.
+
+    Args:
+        request: Prompts and/or video idea IDs plus shared generation settings
+
+    Returns:
+        The batch handle, with every item pending
+    """
+    try:
+        _validate_duration(request.model, request.seconds)
+
+        total = len(request.prompts) + len(request.idea_ids)
+        if total > settings.batch_max_items:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Too many items. Maximum batch size is {settings.batch_max_items}, got {total}",
+            )
+
+        items: list[tuple[str, Optional[str]]] = [(prompt, None) for prompt in request.prompts]
+        if request.idea_ids:
+            rows = (
+                db.query(VideoIdeaDB.id, VideoIdeaDB.video_prompt)
+                .filter(VideoIdeaDB.id.in_(request.idea_ids))
+                .all()
+            )
+            prompts = {row.id: row.video_prompt for row in rows}
+            missing = [str(idea_id) for idea_id in request.idea_ids if idea_id not in prompts]
+            if missing:
+                raise HTTPException(status_code=404, detail=f"Ideas not found: {', '.join(missing)}")
+            items.extend((prompts[idea_id], str(idea_id)) for idea_id in request.idea_ids)
+
+        return batch_service.submit(
+            items,
+            model=request.model,
+            seconds=request.seconds,
+            size=request.size,
+            policy=RoutingPolicy.from_settings(max_cost=request.max_cost, max_latency=request.max_latency),
+        )
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error creating video batch: {str(e)}", exc_info=True)
+        raise HTTPException(status_code=500, detail=f"Failed to create video batch: {str(e)}")
+
+
+@router.get("/batches/{batch_id}", response_model=VideoBatch)
+async def get_video_batch(
+    batch_id: str,
+    batch_service: BatchService = Depends(get_batch_service),
+):
+    """
+    Get the aggregate and per-item status of a batch.
+
+    Args:
+        batch_id: The batch identifier
+
+    Returns:
+        VideoBatch with counts per status and mean progress
+    """
+    batch = batch_service.get_batch(batch_id)
+    if batch is None:
+        raise HTTPException(status_code=404, detail=f"Batch {batch_id} not found")
+    return batch
+
+
+@router.get("/batches/{batch_id}/events")
+async def stream_video_batch(
+    batch_id: str,
+    batch_service: BatchService = Depends(get_batch_service),
+):
+    """
+    Stream batch status as Server-Sent Events.
+
+    Sends the batch as a `batch` event on every change (and periodically as
+    a heartbeat) until every item has finished.
+
+    Args:
+        batch_id: The batch identifier
+    """
+    if batch_service.get_batch(batch_id) is None:
+        raise HTTPException(status_code=404, detail=f"Batch {batch_id} not found")
+
+    async def events():
+        async for batch in batch_service.watch(batch_id):
+            yield f"event: batch\ndata: {batch.model_dump_json()}\n\n"
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache"},
+    )
+
+
+@router.get("/references/{name}")
+async def get_reference_image(
+    name: str,
+    reference_assets: ReferenceAssetService = Depends(get_reference_asset_service),
+):
+    """
+    Serve a stored reference image (used as image_url for providers that fetch by URL).
+
+    Args:
+        name: Stored file name (<sha256>_<WxH>.jpg)
+    """
+    path = reference_assets.get_path(name)
+    if path is None:
+        raise HTTPException(status_code=404, detail=f"Reference image {name} not found")
+    # Content-addressed, so the file never changes
+    return FileResponse(
+        path,
+        media_type="image/jpeg",
+        headers={"Cache-Control": "public, max-age=31536000, immutable"},
+    )
+
+
 @router.get("/{video_id}", response_model=VideoJob)
-async def get_video_status(video_id: str):
+async def get_video_status(
+    video_id: str,
+    model_router: ModelRouterService = Depends(get_model_router),
+):
     """
     Get the current status of a video generation job.
 
@@ -125,27 +345,33 @@ async def get_video_status(video_id: str):
         VideoJob with current status and progress
     """
     try:
-        logger.info(f"Fetching status for video: {video_id}")
-
-        # Route to appropriate service based on video ID format
-        # Sora videos start with "video_", Kie.ai videos are other formats
-        if video_id.startswith("video_"):
-            video = await sora_service.get_video_status(video_id)
+        logger.info("Fetching status for video: %s", video_id)
+
+        # Route to the service running the job: Sora IDs start with "video_",
+        # Kie jobs are looked up in the job table
+        service = await model_router.known_service(video_id)
+        if service is not None:
+            # Not hedged: a second request to the same provider only adds load
+            calls = [lambda: service.get_video_status(video_id)]
         else:
-            # Kie.ai video - try Veo first, then Wan
-            # Both use same task ID format, try to detect from response
-            try:
-                video = await model_router.kie_veo.get_video_status(video_id)
-            except Exception as veo_error:
-                # If Veo fails, try Wan
-                try:
-                    video = await model_router.kie_wan.get_video_status(video_id)
-                except Exception:
-                    # If both fail, re-raise original error
-                    raise veo_error
+            # Unrecorded Kie.ai video - try Veo first, then Wan (both use the same
+            # task ID format); with hedging, Wan starts if Veo is slow
+            calls = [
+                lambda: model_router.kie_veo.get_video_status(video_id),
+                lambda: model_router.kie_wan.get_video_status(video_id),
+            ]
+
+        with deadline(settings.status_deadline_seconds):
+            video = await hedge(*calls, delay=settings.status_hedge_delay)
 
+        await model_router.observe_job(video)
         return video
 
+    except CircuitOpenError as e:
+        raise HTTPException(status_code=503, detail=str(e))
+    except TimeoutError as e:
+        logger.warning(f"Status check timed out for video {video_id}")
+        raise HTTPException(status_code=504, detail=f"Status check timed out: {str(e)}")
     except Exception as e:
         logger.error(f"Error fetching video status: {str(e)}", exc_info=True)
         if "not found" in str(e).lower() or "404" in str(e):
@@ -154,7 +380,11 @@ async def get_video_status(video_id: str):
 
 
 @router.get("/{video_id}/poll", response_model=VideoJob)
-async def poll_video(video_id: str, timeout: int = Query(300, ge=1, le=600)):
+async def poll_video(
+    video_id: str,
+    timeout: int = Query(300, ge=1, le=600),
+    model_router: ModelRouterService = Depends(get_model_router),
+):
     """
     Poll video status until completion or timeout.
 
@@ -168,23 +398,23 @@ async def poll_video(video_id: str, timeout: int = Query(300, ge=1, le=600)):
     try:
         logger.info(f"Starting poll for video: {video_id}, timeout: {timeout}s")
 
-        # Route to appropriate service based on video ID format
-        if video_id.startswith("video_"):
-            video = await sora_service.poll_until_complete(video_id, timeout=timeout)
-        else:
-            # Kie.ai video - try Veo first, then Wan
-            try:
-                video = await model_router.kie_veo.poll_until_complete(video_id, timeout=timeout)
-            except Exception as veo_error:
-                # If Veo fails, try Wan
-                try:
-                    video = await model_router.kie_wan.poll_until_complete(video_id, timeout=timeout)
-                except Exception:
-                    # If both fail, re-raise original error
-                    raise veo_error
+        # Route to the service running the job
+        service = await model_router.known_service(video_id)
+        with deadline(timeout):
+            if service is not None:
+                video = await service.poll_until_complete(video_id, timeout=timeout)
+            else:
+                # Unrecorded Kie.ai video - try Veo first, then Wan
+                video = await hedge(
+                    lambda: model_router.kie_veo.poll_until_complete(video_id, timeout=timeout),
+                    lambda: model_router.kie_wan.poll_until_complete(video_id, timeout=timeout),
+                )
 
+        await model_router.observe_job(video)
         return video
 
+    except CircuitOpenError as e:
+        raise HTTPException(status_code=503, detail=str(e))
     except TimeoutError as e:
         logger.warning(f"Polling timeout for video {video_id}")
         raise HTTPException(status_code=504, detail=str(e))
@@ -197,57 +427,72 @@ async def poll_video(video_id: str, timeout: int = Query(300, ge=1, le=600)):
 
 @router.get("/{video_id}/content")
 async def download_video_content(
-    video_id: str, variant: Literal["video", "thumbnail", "spritesheet"] = Query("video")
+    video_id: str,
+    variant: Literal["video", "thumbnail", "spritesheet"] = Query("video"),
+    model_router: ModelRouterService = Depends(get_model_router),
+    storage_service: StorageService = Depends(get_storage_service),
+    prefetcher: PrefetchService = Depends(get_prefetch_service),
 ):
     """
-    Download video content or supporting assets.
+    Download video content or supporting assets, from any provider.
+
+    Served from local storage when cached; otherwise streamed from the
+    provider and cached on the way through.
 
     Args:
         video_id: The video job identifier
-        variant: Type of asset to download (video, thumbnail, or spritesheet)
+        variant: Type of asset to download (video, thumbnail, or spritesheet;
+            Kie.ai provides only the video, see /derivatives for the others)
 
     Returns:
         Binary stream of the requested asset
     """
+    headers = {"Content-Disposition": f'attachment; filename="{video_id}_{variant}.{variant}"'}
+    content_type = storage_service.get_content_type(variant)
     try:
-        logger.info(f"Download request for video {video_id}, variant: {variant}")
+        logger.info("Download request for video %s, variant: %s", video_id, variant)
+
+        # Only completed jobs are stored, so a local copy needs no status check
+        # (finishing a prefetch already under way)
+        await prefetcher.wait(video_id, variant)
+        local_path = await storage_service.get_video_path(video_id, variant)
+        if local_path:
+            logger.info("Serving %s from local storage: %s", variant, local_path)
+            return FileResponse(local_path, media_type=content_type, headers=headers)
+
+        service = await model_router.resolve_service(video_id)
+        if variant not in service.get_content_variants():
+            raise HTTPException(
+                status_code=404,
+                detail=f"{service.get_service_name()} videos have no {variant}; use /derivatives/{variant}",
+            )
 
         # Check if video is completed first
-        video = await sora_service.get_video_status(video_id)
+        video = await service.get_video_status(video_id)
+        await model_router.observe_job(video)
         if video.status != "completed":
             raise HTTPException(
                 status_code=409,
                 detail=f"Video is not ready for download. Current status: {video.status}",
             )
 
-        # Check if we have it cached locally
-        local_path = await storage_service.get_video_path(video_id, variant)
+        # Stream from the provider and cache; the first chunk is read here so
+        # upstream errors still become error responses
+        logger.info(f"Streaming {variant} from {service.get_service_name()}")
+        chunks = storage_service.save_stream(video_id, service.stream_video_content(video_id, variant), variant)
+        first = await anext(chunks, b"")
 
-        if local_path:
-            # Serve from local storage
-            logger.info(f"Serving {variant} from local storage: {local_path}")
-            with open(local_path, "rb") as f:
-                content = f.read()
-        else:
-            # Download from OpenAI and cache
-            logger.info(f"Downloading {variant} from OpenAI API")
-            content = await sora_service.download_video_content(video_id, variant)
-
-            # Save to local storage
-            await storage_service.save_video(video_id, content, variant)
-
-        # Return as streaming response
-        content_type = storage_service.get_content_type(variant)
-        return StreamingResponse(
-            io.BytesIO(content),
-            media_type=content_type,
-            headers={
-                "Content-Disposition": f'attachment; filename="{video_id}_{variant}.{variant}"',
-            },
-        )
+        async def body():
+            yield first
+            async for chunk in chunks:
+                yield chunk
+
+        return StreamingResponse(body(), media_type=content_type, headers=headers)
 
     except HTTPException:
         raise
+    except CircuitOpenError as e:
+        raise HTTPException(status_code=503, detail=str(e))
     except Exception as e:
         logger.error(f"Error downloading video content: {str(e)}", exc_info=True)
         if "not found" in str(e).lower() or "404" in str(e):
@@ -255,19 +500,73 @@ async def download_video_content(
         raise HTTPException(status_code=500, detail=f"Failed to download video content: {str(e)}")
 
 
+@router.get("/{video_id}/derivatives/{kind}")
+async def get_video_derivative(
+    video_id: str,
+    kind: DerivativeKind,
+    storage_service: StorageService = Depends(get_storage_service),
+    prefetcher: PrefetchService = Depends(get_prefetch_service),
+    derivatives: DerivativeService = Depends(get_derivative_service),
+):
+    """
+    Get a lightweight version of a stored video, generated on first request.
+
+    Works for every provider once the video is in local storage (completed
+    jobs are prefetched automatically).
+
+    Args:
+        video_id: The video job identifier
+        kind: thumbnail (WebP), spritesheet (JPEG frame grid) or preview (low-res MP4)
+
+    Returns:
+        The derivative file
+    """
+    try:
+        await prefetcher.wait(video_id, "video")
+        video_path = await storage_service.get_video_path(video_id, "video")
+        if video_path is None:
+            raise HTTPException(
+                status_code=409,
+                detail=f"Video {video_id} is not in local storage yet; it is fetched once the job completes",
+            )
+
+        path = await derivatives.get(video_path, kind)
+        return FileResponse(
+            path,
+            media_type=derivatives.get_content_type(kind),
+            headers={"Cache-Control": "public, max-age=86400"},
+        )
+
+    except HTTPException:
+        raise
+    except TimeoutError as e:
+        raise HTTPException(status_code=504, detail=str(e))
+    except Exception as e:
+        logger.error(f"Error generating {kind} for video {video_id}: {str(e)}", exc_info=True)
+        raise HTTPException(status_code=500, detail=f"Failed to generate {kind}: {str(e)}")
+
+
 @router.get("", response_model=VideoListResponse)
 async def list_videos(
     limit: int = Query(20, ge=1, le=100),
     after: Optional[str] = Query(None),
     order: Literal["asc", "desc"] = Query("desc"),
+    provider: Optional[Literal["sora", "kie_veo", "kie_wan"]] = Query(None),
+    status: Optional[Literal["queued", "in_progress", "completed", "failed"]] = Query(None),
+    model_router: ModelRouterService = Depends(get_model_router),
 ):
     """
-    List video generation jobs with pagination.
+    List video generation jobs across all providers with pagination.
+
+    Served from the local job table, which records every job created or
+    checked through this API, so no provider is called.
 
     Args:
         limit: Maximum number of results (1-100, default: 20)
         after: Pagination cursor (video ID to start after)
-        order: Sort order (asc or desc, default: desc)
+        order: Sort order by creation time (asc or desc, default: desc)
+        provider: Only jobs on this provider (sora, kie_veo, kie_wan)
+        status: Only jobs with this status
 
     Returns:
         VideoListResponse with list of videos
@@ -275,7 +574,9 @@ async def list_videos(
     try:
         logger.info(f"Listing videos: limit={limit}, after={after}, order={order}")
 
-        videos, has_more = await sora_service.list_videos(limit=limit, after=after, order=order)
+        videos, has_more = await model_router.jobs.list(
+            limit=limit, after=after, order=order, provider=provider, status=status
+        )
 
         return VideoListResponse(data=videos, has_more=has_more)
 
@@ -285,9 +586,13 @@ async def list_videos(
 
 
 @router.delete("/{video_id}", response_model=VideoDeleteResponse)
-async def delete_video(video_id: str):
+async def delete_video(
+    video_id: str,
+    model_router: ModelRouterService = Depends(get_model_router),
+    storage_service: StorageService = Depends(get_storage_service),
+):
     """
-    Delete a video from OpenAI storage and local cache.
+    Delete a video from provider storage and local cache.
 
     Args:
         video_id: The video job identifier
@@ -298,15 +603,19 @@ async def delete_video(video_id: str):
     try:
         logger.info(f"Deleting video: {video_id}")
 
-        # Delete from OpenAI
-        result = await sora_service.delete_video(video_id)
+        # Delete from the provider
+        service = await model_router.resolve_service(video_id)
+        result = await service.delete_video(video_id)
 
-        # Delete local files
+        # Delete local files and the job record
         deleted_files = await storage_service.delete_video_files(video_id)
         logger.info(f"Deleted {deleted_files} local files for video {video_id}")
+        await model_router.jobs.delete(video_id)
 
         return VideoDeleteResponse(**result)
 
+    except CircuitOpenError as e:
+        raise HTTPException(status_code=503, detail=str(e))
     except Exception as e:
         logger.error(f"Error deleting video: {str(e)}", exc_info=True)
         if "not found" in str(e).lower() or "404" in str(e):
@@ -315,12 +624,16 @@ async def delete_video(video_id: str):
 
 
 @router.post("/{video_id}/remix", response_model=VideoJob, status_code=201)
-async def remix_video(video_id: str, request: RemixVideoRequest):
+async def remix_video(
+    video_id: str,
+    request: RemixVideoRequest,
+    model_router: ModelRouterService = Depends(get_model_router),
+):
     """
     Create a remix of an existing video with modifications.
 
     Args:
-        video_id: Source video identifier (must be completed)
+        video_id: Source video identifier (must be completed; Sora only)
         request: Remix request with new prompt
 
     Returns:
@@ -329,8 +642,16 @@ async def remix_video(video_id: str, request: RemixVideoRequest):
     try:
         logger.info(f"Creating remix of video {video_id}")
 
+        service = await model_router.resolve_service(video_id)
+        if not service.supports_remix:
+            raise HTTPException(
+                status_code=400,
+                detail=f"{service.get_service_name()} does not support remixing videos",
+            )
+
         # Verify source video is completed
-        source_video = await sora_service.get_video_status(video_id)
+        source_video = await service.get_video_status(video_id)
+        await model_router.observe_job(source_video)
         if source_video.status != "completed":
             raise HTTPException(
                 status_code=400,
@@ -338,12 +659,15 @@ async def remix_video(video_id: str, request: RemixVideoRequest):
             )
 
         # Create remix
-        remix = await sora_service.remix_video(video_id, request.prompt)
+        remix = await service.remix_video(video_id, request.prompt)
+        await model_router.jobs.record(remix, prompt=request.prompt)
 
         return remix
 
     except HTTPException:
         raise
+    except CircuitOpenError as e:
+        raise HTTPException(status_code=503, detail=str(e))
     except Exception as e:
         logger.error(f"Error creating remix: {str(e)}", exc_info=True)
         if "not found" in str(e).lower() or "404" in str(e):
@@ -1,6 +1,6 @@
 """Service modules for business logic."""
 
-from .sora_service import SoraService
-from .storage_service import StorageService
+from .sora_service import SoraService, get_sora_service
+from .storage_service import StorageService, get_storage_service
 
-__all__ = ["SoraService", "StorageService"]
+__all__ = ["SoraService", "StorageService", "get_sora_service", "get_storage_service"]
@@ -1,7 +1,7 @@
 """Abstract base class for video generation services."""
 
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import AsyncIterator, Optional
 from ..models.video_response import VideoJob
 
 
@@ -13,6 +13,9 @@ class AbstractVideoService(ABC):
     to ensure consistency and enable the model router to work with any service.
     """
 
+    # Whether remix_video() is available; callers check this before calling it
+    supports_remix: bool = False
+
     @abstractmethod
     async def create_video(
         self,
@@ -72,12 +75,13 @@ class AbstractVideoService(ABC):
         pass
 
     @abstractmethod
-    async def download_video_content(self, video_id: str) -> bytes:
+    async def download_video_content(self, video_id: str, variant: str = "video") -> bytes:
         """
         Download video content.
 
         Args:
             video_id: The video job identifier
+            variant: Asset to download (one of get_content_variants())
 
         Returns:
             Binary content of the video
@@ -87,6 +91,66 @@ class AbstractVideoService(ABC):
         """
         pass
 
+    @abstractmethod
+    def stream_video_content(self, video_id: str, variant: str = "video") -> AsyncIterator[bytes]:
+        """
+        Download video content in chunks, without holding it in memory.
+
+        Args:
+            video_id: The video job identifier
+            variant: Asset to download (one of get_content_variants())
+
+        Returns:
+            Async iterator of content chunks
+
+        Raises:
+            Exception: If download fails (raised while iterating)
+        """
+        pass
+
+    @abstractmethod
+    async def delete_video(self, video_id: str) -> dict:
+        """
+        Delete a video from the provider's storage.
+
+        Args:
+            video_id: The video job identifier
+
+        Returns:
+            Deletion confirmation dict (id, object, deleted)
+
+        Raises:
+            Exception: If deletion fails
+        """
+        pass
+
+    async def remix_video(self, video_id: str, prompt: str) -> VideoJob:
+        """
+        Create a remix of an existing video.
+
+        Args:
+            video_id: Source video identifier
+            prompt: New prompt describing the modification
+
+        Returns:
+            VideoJob for the new remix
+
+        Only called on services with supports_remix set.
+
+        Raises:
+            NotImplementedError: If a service sets supports_remix without implementing this
+        """
+        raise NotImplementedError(f"{type(self).__name__} sets supports_remix but does not implement remix_video")
+
+    def get_content_variants(self) -> tuple[str, ...]:
+        """
+        Get the assets this service can download for a completed video.
+
+        Returns:
+            Variant names (always including "video")
+        """
+        return ("video",)
+
     @abstractmethod
     def get_supported_models(self) -> list[str]:
         """
@@ -0,0 +1,257 @@
+"""Batch video generation with per-provider concurrency and rate limits."""
+
+import asyncio
+import time
+from collections import OrderedDict
+from typing import AsyncIterator, Optional
+from uuid import uuid4
+
+from ..config import settings
+from ..models.video_response import VideoBatch, VideoBatchItem, VideoJob
+from ..utils.logging_setup import logger
+from ..utils.resilience import deadline
+from .model_router_service import MODEL_PROVIDERS, ModelRouterService, RoutingPolicy, get_model_router
+
+# Finished batches kept for status queries (oldest dropped first)
+_MAX_BATCHES = 100
+
+# Consecutive status errors before an item is given up on
+_MAX_STATUS_ERRORS = 5
+
+# Seconds between stream updates when nothing changes
+_HEARTBEAT_SECONDS = 15.0
+
+
+class _BatchState:
+    """A batch plus the event its watchers wait on."""
+
+    def __init__(self, batch: VideoBatch):
+        self.batch = batch
+        self.changed = asyncio.Event()
+        self.task: Optional[asyncio.Task] = None
+
+    def notify(self) -> None:
+        _refresh(self.batch)
+        changed, self.changed = self.changed, asyncio.Event()
+        changed.set()
+
+
+def _refresh(batch: VideoBatch) -> None:
+    """Recompute a batch's aggregate counts, progress and status."""
+    counts: dict[str, int] = {}
+    for item in batch.items:
+        counts[item.status] = counts.get(item.status, 0) + 1
+    batch.counts = counts
+    batch.progress = sum(item.progress for item in batch.items) // max(batch.total, 1)
+    if counts.get("completed", 0) + counts.get("failed", 0) == batch.total:
+        batch.status = "completed"
+        batch.completed_at = batch.completed_at or int(time.time())
+
+
+class BatchService:
+    """
+    Runs batches of video generation jobs.
+
+    Each item holds a provider slot from creation until its job finishes,
+    so at most `batch_provider_concurrency[provider]` jobs of a batch run
+    on a provider at once; creations queue on the provider's rate limit
+    (see utils.rate_limiter). "auto" items take the best-ranked
+    model with a free slot (of the top two), spreading a batch across
+    providers once the preferred one is full.
+    """
+
+    def __init__(self, model_router: Optional[ModelRouterService] = None):
+        """
+        Initialize the batch service.
+
+        Args:
+            model_router: Router used to create and check jobs (default: shared instance)
+        """
+        self.model_router = model_router or get_model_router()
+        self._batches: OrderedDict[str, _BatchState] = OrderedDict()
+        self._in_use: dict[str, int] = {}
+        self._slot_freed = asyncio.Condition()
+        logger.info("BatchService initialized")
+
+    def submit(
+        self,
+        items: list[tuple[str, Optional[str]]],
+        model: str,
+        seconds: int,
+        size: str,
+        policy: Optional[RoutingPolicy] = None,
+    ) -> VideoBatch:
+        """
+        Start generating a batch in the background.
+
+        Args:
+            items: (prompt, idea ID or None) per video
+            model: Model for every item, or "auto"
+            seconds: Duration in seconds
+            size: Resolution
+            policy: Routing objectives for "auto"
+
+        Returns:
+            The new batch, with every item pending
+        """
+        batch = VideoBatch(
+            id=f"batch_{uuid4().hex}",
+            status="in_progress",
+            created_at=int(time.time()),
+            total=len(items),
+            items=[
+                VideoBatchItem(index=index, prompt=prompt, idea_id=idea_id)
+                for index, (prompt, idea_id) in enumerate(items)
+            ],
+        )
+        _refresh(batch)
+
+        state = _BatchState(batch)
+        state.task = asyncio.create_task(self._run(state, model, seconds, size, policy))
+        self._batches[batch.id] = state
+        self._prune()
+
+        logger.info(f"Batch {batch.id} submitted: {batch.total} videos on {model}")
+        return batch
+
+    def get_batch(self, batch_id: str) -> Optional[VideoBatch]:
+        """Current status of a batch, or None if unknown."""
+        state = self._batches.get(batch_id)
+        return state.batch if state else None
+
+    async def watch(self, batch_id: str) -> AsyncIterator[VideoBatch]:
+        """
+        Yield the batch now and after every change until it completes.
+
+        Also yields every _HEARTBEAT_SECONDS without changes, so streams
+        stay open through proxies.
+
+        Raises:
+            KeyError: If the batch is unknown
+        """
+        state = self._batches[batch_id]
+        while True:
+            changed = state.changed
+            yield state.batch
+            if state.batch.status == "completed":
+                return
+            try:
+                await asyncio.wait_for(changed.wait(), _HEARTBEAT_SECONDS)
+            except asyncio.TimeoutError:
+                pass
+
+    async def _run(
+        self, state: _BatchState, model: str, seconds: int, size: str, policy: Optional[RoutingPolicy]
+    ) -> None:
+        await asyncio.gather(
+            *(self._run_item(state, item, model, seconds, size, policy) for item in state.batch.items)
+        )
+        logger.info(f"Batch {state.batch.id} finished: {state.batch.counts}")
+
+    async def _run_item(
+        self,
+        state: _BatchState,
+        item: VideoBatchItem,
+        model: str,
+        seconds: int,
+        size: str,
+        policy: Optional[RoutingPolicy],
+    ) -> None:
+        """Create one video and follow it to completion, holding a provider slot."""
+        try:
+            if model == "auto":
+                candidates = self.model_router.rank_models(item.prompt, policy, seconds=seconds)[:2]
+            else:
+                candidates = [model]
+            chosen = await self._acquire(candidates)
+        except Exception as e:
+            self._fail(state, item, e)
+            return
+
+        try:
+            item.model = chosen
+            with deadline(settings.create_deadline_seconds):
+                # No fallback: a job on another provider would run outside the slot held for it
+                video = await self.model_router.generate_video(
+                    prompt=item.prompt, model=chosen, policy=policy, fallback=False, seconds=seconds, size=size
+                )
+            self._update(state, item, video)
+            await self._follow(state, item, video.id, chosen)
+        except Exception as e:
+            self._fail(state, item, e)
+        finally:
+            await self._release(chosen)
+
+    async def _follow(self, state: _BatchState, item: VideoBatchItem, video_id: str, model: str) -> None:
+        """Poll a job until it finishes, updating its item."""
+        started = time.monotonic()
+        errors = 0
+        while item.status not in ("completed", "failed"):
+            if time.monotonic() - started > settings.batch_job_timeout:
+                raise TimeoutError(f"Job {video_id} did not finish within {settings.batch_job_timeout:.0f}s")
+            await asyncio.sleep(settings.batch_poll_interval)
+            try:
+                with deadline(settings.status_deadline_seconds):
+                    video = await self.model_router.get_video_status(video_id, model)
+            except Exception as e:
+                errors += 1
+                if errors >= _MAX_STATUS_ERRORS:
+                    raise
+                logger.warning(f"Status check for batch job {video_id} failed ({errors}): {str(e)}")
+                continue
+            errors = 0
+            await self.model_router.observe_job(video)
+            self._update(state, item, video)
+
+    @staticmethod
+    def _fail(state: _BatchState, item: VideoBatchItem, error: Exception) -> None:
+        logger.error(f"Batch {state.batch.id} item {item.index} failed: {str(error)}")
+        item.status = "failed"
+        item.progress = 100
+        item.error = str(error)
+        state.notify()
+
+    @staticmethod
+    def _update(state: _BatchState, item: VideoBatchItem, video: VideoJob) -> None:
+        item.video = video
+        item.status = video.status
+        if video.status == "failed" and video.error:
+            item.error = video.error.message
+        item.progress = 100 if video.status in ("completed", "failed") else (video.progress or 0)
+        state.notify()
+
+    async def _acquire(self, candidates: list[str]) -> str:
+        """Take a slot on the first candidate's provider with capacity, waiting if none has."""
+        async with self._slot_freed:
+            while True:
+                for model in candidates:
+                    provider = MODEL_PROVIDERS.get(model, model)
+                    limit = settings.batch_provider_concurrency.get(provider, 1)
+                    if self._in_use.get(provider, 0) < limit:
+                        self._in_use[provider] = self._in_use.get(provider, 0) + 1
+                        return model
+                await self._slot_freed.wait()
+
+    async def _release(self, model: str) -> None:
+        provider = MODEL_PROVIDERS.get(model, model)
+        async with self._slot_freed:
+            self._in_use[provider] -= 1
+            self._slot_freed.notify_all()
+
+    def _prune(self) -> None:
+        """Forget the oldest finished batches beyond _MAX_BATCHES."""
+        finished = [batch_id for batch_id, state in self._batches.items() if state.batch.status == "completed"]
+        for batch_id in finished[: max(0, len(self._batches) - _MAX_BATCHES)]:
+            del self._batches[batch_id]
+
+
+# Singleton instance
+_batch_service: Optional[BatchService] = None
+
+
+def get_batch_service() -> BatchService:
+    """Get or create the batch service singleton."""
+    global _batch_service
+    if _batch_service is None:
+        _batch_service = BatchService()
+    return _batch_service
@@ -0,0 +1,214 @@
+"""Thumbnails, spritesheets and preview clips generated locally from stored videos."""
+
+import asyncio
+import hashlib
+import io
+import math
+from pathlib import Path
+from typing import Literal, Optional
+from uuid import uuid4
+
+from ..config import settings
+from ..utils.logging_setup import logger
+from ..utils.metrics import FFMPEG_QUEUE_DEPTH, STORAGE_CACHE_REQUESTS
+
+DerivativeKind = Literal["thumbnail", "spritesheet", "preview"]
+
+_EXTENSIONS = {"thumbnail": ".webp", "spritesheet": ".jpg", "preview": ".mp4"}
+_CONTENT_TYPES = {"thumbnail": "image/webp", "spritesheet": "image/jpeg", "preview": "video/mp4"}
+
+# Width of one spritesheet frame in pixels
+_SPRITE_TILE_WIDTH = 160
+
+_WEBP_QUALITY = 80
+
+
+def _save_webp(png: bytes, output: Path) -> None:
+    """Re-encode an ffmpeg PNG frame as WebP (ffmpeg builds often lack libwebp)."""
+    from PIL import Image
+
+    with Image.open(io.BytesIO(png)) as image:
+        image.save(output, "WEBP", quality=_WEBP_QUALITY)
+
+
+def _hash_file(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class DerivativeService:
+    """
+    Generates lighter versions of stored videos for galleries.
+
+    - thumbnail: representative frame as WebP, `thumbnail_width` wide
+    - spritesheet: `spritesheet_frames` evenly spaced frames tiled in a JPEG grid
+    - preview: `preview_height`p silent H.264 MP4 with faststart
+
+    Outputs are cached by the SHA-256 of the source video, so identical
+    videos share derivatives and a replaced video gets new ones. ffmpeg runs
+    as a subprocess, at most `ffmpeg_workers` at a time.
+    """
+
+    def __init__(self, storage_path: Optional[str] = None):
+        """
+        Initialize the derivative service.
+
+        Args:
+            storage_path: Directory for generated files (default: <video storage>/derivatives)
+        """
+        self.storage_path = Path(storage_path or Path(settings.video_storage_path) / "derivatives")
+        self.storage_path.mkdir(parents=True, exist_ok=True)
+        self._workers = asyncio.Semaphore(max(1, settings.ffmpeg_workers))
+        self._digests: dict[Path, tuple[int, int, str]] = {}  # path -> (mtime_ns, size, sha256)
+        self._pending: dict[str, asyncio.Future] = {}
+        logger.info(f"DerivativeService initialized with path: {self.storage_path.absolute()}")
+
+    async def get(self, video_path: Path, kind: DerivativeKind) -> Path:
+        """
+        Get a derivative of a stored video, generating it if new.
+
+        Args:
+            video_path: Local MP4
+            kind: thumbnail, spritesheet or preview
+
+        Returns:
+            Path to the generated file
+
+        Raises:
+            RuntimeError: If ffmpeg is not installed
+            TimeoutError: If ffmpeg runs longer than `ffmpeg_timeout`
+            ValueError: If ffmpeg fails (e.g. the video is unreadable)
+        """
+        digest = await self._digest(video_path)
+        path = self.storage_path / f"{digest}_{kind}{_EXTENSIONS[kind]}"
+
+        if path.exists():
+            STORAGE_CACHE_REQUESTS.inc(variant=f"derivative_{kind}", result="hit")
+            return path
+        STORAGE_CACHE_REQUESTS.inc(variant=f"derivative_{kind}", result="miss")
+
+        # Concurrent requests for the same derivative share one ffmpeg run
+        pending = self._pending.get(path.name)
+        if pending is not None:
+            await asyncio.shield(pending)
+            return path
+
+        future = self._pending[path.name] = asyncio.get_running_loop().create_future()
+        temp_path = path.with_name(f".{path.stem}.{uuid4().hex[:8]}{path.suffix}")
+        try:
+            if kind == "thumbnail":
+                await self._thumbnail(video_path, temp_path)
+            elif kind == "spritesheet":
+                await self._spritesheet(video_path, temp_path)
+            else:
+                await self._preview(video_path, temp_path)
+            temp_path.replace(path)
+            future.set_result(None)
+        except BaseException as e:
+            temp_path.unlink(missing_ok=True)
+            if isinstance(e, Exception):
+                future.set_exception(e)
+                future.exception()  # Mark retrieved; waiters still receive it
+            else:
+                future.cancel()
+            raise
+        finally:
+            del self._pending[path.name]
+
+        logger.info(f"Generated {kind} for {video_path.name}: {path.name} ({path.stat().st_size} bytes)")
+        return path
+
+    def get_content_type(self, kind: DerivativeKind) -> str:
+        """MIME type of a derivative kind."""
+        return _CONTENT_TYPES[kind]
+
+    async def _digest(self, video_path: Path) -> str:
+        """SHA-256 of a video, remembered until the file changes."""
+        stat = video_path.stat()
+        cached = self._digests.get(video_path)
+        if cached and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+            return cached[2]
+        digest = await asyncio.to_thread(_hash_file, video_path)
+        self._digests[video_path] = (stat.st_mtime_ns, stat.st_size, digest)
+        return digest
+
+    async def _thumbnail(self, video_path: Path, output: Path) -> None:
+        png = await self._run(
+            "ffmpeg", "-v", "error",
+            "-i", str(video_path),
+            "-vf", f"thumbnail,scale={settings.thumbnail_width}:-2",
+            "-frames:v", "1",
+            "-f", "image2pipe", "-vcodec", "png", "-",
+        )
+        await asyncio.to_thread(_save_webp, png, output)
+
+    async def _spritesheet(self, video_path: Path, output: Path) -> None:
+        duration = float(
+            await self._run(
+                "ffprobe", "-v", "error",
+                "-show_entries", "format=duration",
+                "-of", "default=noprint_wrappers=1:nokey=1",
+                str(video_path),
+            )
+        )
+        frames = max(1, settings.spritesheet_frames)
+        columns = math.ceil(math.sqrt(frames))
+        rows = math.ceil(frames / columns)
+        await self._run(
+            "ffmpeg", "-v", "error",
+            "-i", str(video_path),
+            "-vf", f"fps={frames / max(duration, 0.1):.6f},scale={_SPRITE_TILE_WIDTH}:-2,tile={columns}x{rows}",
+            "-frames:v", "1",
+            "-q:v", "4",
+            "-y", str(output),
+        )
+
+    async def _preview(self, video_path: Path, output: Path) -> None:
+        await self._run(
+            "ffmpeg", "-v", "error",
+            "-i", str(video_path),
+            "-vf", f"scale=-2:'min({settings.preview_height},ih)'",
+            "-c:v", "libx264", "-preset", "veryfast", "-crf", "30",
+            "-an",
+            "-movflags", "+faststart",
+            "-y", str(output),
+        )
+
+    async def _run(self, *args: str) -> bytes:
+        """Run ffmpeg/ffprobe in the worker pool; return its stdout."""
+        with FFMPEG_QUEUE_DEPTH.track_inprogress():
+            async with self._workers:
+                try:
+                    process = await asyncio.create_subprocess_exec(
+                        *args, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE
+                    )
+                except FileNotFoundError as e:
+                    raise RuntimeError(f"{args[0]} is not installed") from e
+
+                try:
+                    stdout, stderr = await asyncio.wait_for(process.communicate(), settings.ffmpeg_timeout)
+                except (asyncio.TimeoutError, asyncio.CancelledError) as e:
+                    process.kill()
+                    await process.wait()
+                    if isinstance(e, asyncio.TimeoutError):
+                        raise TimeoutError(f"{args[0]} timed out after {settings.ffmpeg_timeout:.0f}s") from e
+                    raise
+
+        if process.returncode != 0:
+            raise ValueError(f"{args[0]} failed: {stderr.decode(errors='replace').strip()[-500:]}")
+        return stdout
+
+
+# Singleton instance
+_derivative_service: Optional[DerivativeService] = None
+
+
+def get_derivative_service() -> DerivativeService:
+    """Get or create the derivative service singleton."""
+    global _derivative_service
+    if _derivative_service is None:
+        _derivative_service = DerivativeService()
+    return _derivative_service
@@ -2,22 +2,27 @@
 
 import json
 from datetime import datetime
-from typing import List, Optional
+from typing import TYPE_CHECKING, List, Optional
 from uuid import uuid4
 
-from anthropic import Anthropic
 from sqlalchemy.orm import Session
 from sqlalchemy import desc
 
 from ..config import settings
 from ..models.idea import (
+    VIDEO_IDEA_COLUMNS,
     VideoIdeaDB,
     VideoIdeaResponse,
     VideoIdeaCreate,
     VideoStyle,
+    video_idea_to_dict,
 )
 from ..models.news import NewsArticleDB
 from ..utils.logging_setup import logger
+from ..utils.metrics import track_upstream
+
+if TYPE_CHECKING:
+    from anthropic import Anthropic
 
 
 class IdeaService:
@@ -25,11 +30,19 @@ class IdeaService:
 
     def __init__(self, db: Session):
         self.db = db
-        if settings.anthropic_api_key:
-            self.client = Anthropic(api_key=settings.anthropic_api_key)
-        else:
-            self.client = None
-            logger.warning("Anthropic API key not configured")
+        self._client: Optional["Anthropic"] = None
+
+    @property
+    def client(self) -> Optional["Anthropic"]:
+        """Anthropic client, created on first use so read-only requests skip it."""
+        if self._client is None:
+            if settings.anthropic_api_key:
+                from anthropic import Anthropic
+
+                self._client = Anthropic(api_key=settings.anthropic_api_key)
+            else:
+                logger.warning("Anthropic API key not configured")
+        return self._client
 
     async def generate_ideas(
         self,
@@ -61,14 +74,15 @@ class IdeaService:
 
         try:
             # Call Claude API
-            response = self.client.messages.create(
-                model="claude-3-5-sonnet-20241022",
-                max_tokens=4000,
-                temperature=0.9,  # Higher creativity
-                messages=[
-                    {"role": "user", "content": prompt}
-                ]
-            )
+            with track_upstream("anthropic", "generate_ideas"):
+                response = self.client.messages.create(
+                    model="claude-3-5-sonnet-20241022",
+                    max_tokens=4000,
+                    temperature=0.9,  # Higher creativity
+                    messages=[
+                        {"role": "user", "content": prompt}
+                    ]
+                )
 
             # Parse response
             ideas_data = self._parse_claude_response(response.content[0].text)
@@ -202,10 +216,13 @@ Generate {num_ideas} unique ideas now. Return ONLY the JSON array, no additional
         style: Optional[VideoStyle] = None,
         limit: int = 20,
         offset: int = 0,
-    ) -> tuple[List[VideoIdeaResponse], int]:
+    ) -> tuple[List[dict], int]:
         """
         Get video ideas with filtering and pagination.
 
+        Only the response columns are selected and rows are mapped straight
+        to dicts, so list pages skip ORM hydration and Pydantic validation.
+
         Args:
             article_id: Filter by article ID
             is_approved: Filter by approval status
@@ -214,9 +231,9 @@ Generate {num_ideas} unique ideas now. Return ONLY the JSON array, no additional
             offset: Number of ideas to skip
 
         Returns:
-            Tuple of (ideas, total_count)
+            Tuple of (idea dicts matching VideoIdeaResponse, total_count)
         """
-        query = self.db.query(VideoIdeaDB)
+        query = self.db.query(*VIDEO_IDEA_COLUMNS)
 
         # Apply filters
         if article_id:
@@ -230,14 +247,14 @@ Generate {num_ideas} unique ideas now. Return ONLY the JSON array, no additional
         total = query.count()
 
         # Apply pagination and ordering
-        ideas = (
+        rows = (
             query.order_by(desc(VideoIdeaDB.created_at))
             .limit(limit)
             .offset(offset)
             .all()
         )
 
-        return [self._to_response(idea) for idea in ideas], total
+        return [video_idea_to_dict(row) for row in rows], total
 
     def get_idea_by_id(self, idea_id: str) -> Optional[VideoIdeaResponse]:
         """Get a single idea by ID."""
@@ -279,16 +296,4 @@ Generate {num_ideas} unique ideas now. Return ONLY the JSON array, no additional
 
     def _to_response(self, idea: VideoIdeaDB) -> VideoIdeaResponse:
         """Convert database model to response model."""
-        return VideoIdeaResponse(
-            id=str(idea.id),
-            article_id=str(idea.article_id),
-            title=idea.title,
-            concept=idea.concept,
-            video_prompt=idea.video_prompt,
-            style=VideoStyle(idea.style) if idea.style else None,
-            estimated_duration=idea.estimated_duration,
-            is_approved=idea.is_approved,
-            approved_by=idea.approved_by,
-            approved_at=idea.approved_at,
-            created_at=idea.created_at,
-        )
+        return VideoIdeaResponse(**video_idea_to_dict(idea))
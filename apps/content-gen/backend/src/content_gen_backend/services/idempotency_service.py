@@ -0,0 +1,194 @@
+"""De-duplication of video generation requests."""
+
+import asyncio
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from typing import Awaitable, Callable, Optional
+
+from ..config import settings
+from ..models.video_response import VideoJob
+from ..utils.logging_setup import logger
+
+# Upper bound on remembered keys and fingerprints (oldest dropped first)
+_MAX_ENTRIES = 10000
+
+
+class IdempotencyConflictError(Exception):
+    """An Idempotency-Key was reused with a different request."""
+
+
+def request_fingerprint(
+    prompt: str,
+    model: str,
+    seconds: int,
+    size: str,
+    reference: Optional[bytes] = None,
+    **options,
+) -> str:
+    """
+    Hash of everything that determines the generated video.
+
+    Args:
+        prompt: Text description of the video
+        model: Requested model (including "auto")
+        seconds: Duration in seconds
+        size: Resolution
+        reference: Reference image bytes, hashed by content
+        **options: Other generation parameters (image_url, routing limits, ...)
+
+    Returns:
+        Hex SHA-256 digest
+    """
+    fields = {
+        "prompt": " ".join(prompt.split()),
+        "model": model,
+        "seconds": seconds,
+        "size": size,
+        "reference": hashlib.sha256(reference).hexdigest() if reference else None,
+        **options,
+    }
+    return hashlib.sha256(json.dumps(fields, sort_keys=True).encode()).hexdigest()
+
+
+class _Job:
+    """One generation, shared by every request that maps to it."""
+
+    def __init__(self, fingerprint: str):
+        self.fingerprint = fingerprint
+        self.task: Optional[asyncio.Task] = None
+        self.finished_at: Optional[float] = None
+
+
+class IdempotencyService:
+    """
+    Makes sure a request creates at most one video.
+
+    Requests are matched by Idempotency-Key (for `key_ttl_seconds`) and by
+    request fingerprint (for `dedup_ttl_seconds`). A match that is still
+    being created is awaited rather than duplicated; a finished match
+    returns the job it created. Failed creations are forgotten so they can
+    be retried.
+
+    Creations run in tasks owned by the service, so a client disconnecting
+    neither cancels the provider call nor fails the requests sharing it.
+    """
+
+    def __init__(
+        self,
+        key_ttl_seconds: Optional[float] = None,
+        dedup_ttl_seconds: Optional[float] = None,
+    ):
+        self.key_ttl_seconds = (
+            settings.idempotency_key_ttl_seconds if key_ttl_seconds is None else key_ttl_seconds
+        )
+        self.dedup_ttl_seconds = (
+            settings.dedup_ttl_seconds if dedup_ttl_seconds is None else dedup_ttl_seconds
+        )
+        self._by_key: OrderedDict[str, _Job] = OrderedDict()
+        self._by_fingerprint: OrderedDict[str, _Job] = OrderedDict()
+        self._running: set[asyncio.Task] = set()
+
+    async def create_once(
+        self,
+        fingerprint: str,
+        create: Callable[[], Awaitable[VideoJob]],
+        idempotency_key: Optional[str] = None,
+    ) -> tuple[VideoJob, bool]:
+        """
+        Run `create` unless a matching request already did.
+
+        Args:
+            fingerprint: request_fingerprint() of the request
+            create: Creates the video job
+            idempotency_key: Client-supplied Idempotency-Key header
+
+        Returns:
+            (video job, True if it was created by an earlier request)
+
+        Raises:
+            IdempotencyConflictError: If the key was used for a different request
+        """
+        self._prune()
+
+        job = None
+        if idempotency_key is not None:
+            job = self._by_key.get(idempotency_key)
+            if job is not None and job.fingerprint != fingerprint:
+                raise IdempotencyConflictError(
+                    "Idempotency-Key was already used for a different request"
+                )
+        if job is None:
+            job = self._by_fingerprint.get(fingerprint)
+
+        if job is not None:
+            if idempotency_key is not None:
+                self._remember(self._by_key, idempotency_key, job)
+            logger.info(f"Reusing video generation for duplicate request {fingerprint[:12]}")
+            # Shielded so a disconnecting duplicate doesn't cancel the shared job
+            return await asyncio.shield(job.task), True
+
+        job = _Job(fingerprint)
+        self._remember(self._by_fingerprint, fingerprint, job)
+        if idempotency_key is not None:
+            self._remember(self._by_key, idempotency_key, job)
+
+        # The first request waits like its duplicates: disconnecting cancels
+        # only its own wait, not the paid creation
+        job.task = asyncio.ensure_future(self._run(job, create))
+        self._running.add(job.task)
+        job.task.add_done_callback(self._finished)
+        return await asyncio.shield(job.task), False
+
+    async def _run(self, job: _Job, create: Callable[[], Awaitable[VideoJob]]) -> VideoJob:
+        try:
+            video = await create()
+        except BaseException:
+            self._forget(job)
+            raise
+        job.finished_at = time.monotonic()
+        return video
+
+    def _finished(self, task: asyncio.Task) -> None:
+        self._running.discard(task)
+        if not task.cancelled():
+            task.exception()  # Mark retrieved; waiters still receive it
+
+    @staticmethod
+    def _remember(index: OrderedDict, name: str, job: _Job) -> None:
+        index[name] = job
+        index.move_to_end(name)
+        while len(index) > _MAX_ENTRIES:
+            index.popitem(last=False)
+
+    def _forget(self, job: _Job) -> None:
+        """Drop every reference to a job that failed."""
+        for index in (self._by_key, self._by_fingerprint):
+            for name in [name for name, other in index.items() if other is job]:
+                del index[name]
+
+    def _prune(self) -> None:
+        """Drop finished jobs older than their TTL, oldest first."""
+        now = time.monotonic()
+        for index, ttl in (
+            (self._by_key, self.key_ttl_seconds),
+            (self._by_fingerprint, self.dedup_ttl_seconds),
+        ):
+            while index:
+                job = next(iter(index.values()))
+                if job.finished_at is None or now - job.finished_at < ttl:
+                    break
+                index.popitem(last=False)
+
+
+# Singleton instance
+_idempotency_service: Optional[IdempotencyService] = None
+
+
+def get_idempotency_service() -> IdempotencyService:
+    """Get or create the idempotency service singleton."""
+    global _idempotency_service
+    if _idempotency_service is None:
+        _idempotency_service = IdempotencyService()
+    return _idempotency_service
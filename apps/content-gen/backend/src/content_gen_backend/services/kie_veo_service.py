@@ -2,12 +2,19 @@
 
 import asyncio
 import requests
-from typing import Optional
+from functools import partial
+from typing import AsyncIterator, Optional
 from ..config import settings
 from ..models.video_response import VideoJob, ErrorDetail
 from ..utils.logging_setup import logger
+from ..utils.metrics import VIDEO_POLLS, track_upstream
+from ..utils.rate_limiter import rate_limited
+from ..utils.resilience import ProviderAPIError, guard, time_left
 from .abstract_video_service import AbstractVideoService
 
+# Bytes read per chunk when streaming a result video
+_STREAM_CHUNK_SIZE = 1024 * 1024
+
 
 class KieVeoService(AbstractVideoService):
     """Service class for interacting with Kie.ai's Veo 3.1 API."""
@@ -68,18 +75,26 @@ class KieVeoService(AbstractVideoService):
             }
 
             # Make synchronous request (we'll wrap in asyncio)
-            loop = asyncio.get_event_loop()
-            response = await loop.run_in_executor(
-                None,
-                lambda: requests.post(url, json=payload, headers=headers, timeout=30)
-            )
-
-            response.raise_for_status()
-            result = response.json()
-
-            # Kie.ai response format: {"code": 200, "msg": "success", "data": {"taskId": "..."}}
-            if result.get('code') != 200:
-                raise Exception(f"Kie.ai API error: {result.get('msg', 'Unknown error')}")
+            with guard("kie_veo"), track_upstream("kie_veo", "create"):
+                loop = asyncio.get_event_loop()
+                response = await rate_limited(
+                    "kie_veo",
+                    "create",
+                    lambda: loop.run_in_executor(
+                        None,
+                        partial(requests.post, url, json=payload, headers=headers, timeout=time_left(30)),
+                    ),
+                )
+
+                response.raise_for_status()
+                result = response.json()
+
+                # Kie.ai response format: {"code": 200, "msg": "success", "data": {"taskId": "..."}}
+                if result.get('code') != 200:
+                    raise ProviderAPIError(
+                        f"Kie.ai API error: {result.get('msg', 'Unknown error')}",
+                        status_code=result.get('code'),
+                    )
 
             data = result.get('data', {})
             task_id = data.get('taskId')
@@ -113,7 +128,7 @@ class KieVeoService(AbstractVideoService):
             raise ValueError("Kie.ai API key not configured")
 
         try:
-            logger.debug(f"Fetching status for Kie Veo video: {video_id}")
+            logger.debug("Fetching status for Kie Veo video: %s", video_id)
 
             # Kie.ai task status endpoint (correct endpoint from docs)
             url = f"{self.base_url}/api/v1/veo/record-info?taskId={video_id}"
@@ -122,21 +137,29 @@ class KieVeoService(AbstractVideoService):
                 "Authorization": f"Bearer {self.api_key}"
             }
 
-            loop = asyncio.get_event_loop()
-            response = await loop.run_in_executor(
-                None,
-                lambda: requests.get(url, headers=headers, timeout=10)
-            )
-
-            response.raise_for_status()
-            result = response.json()
-
-            # Kie.ai response format: {"code": 200, "msg": "success", "data": {...}}
-            if result.get('code') != 200:
-                raise Exception(f"Kie.ai API error: {result.get('msg', 'Unknown error')}")
+            with guard("kie_veo"), track_upstream("kie_veo", "status"):
+                loop = asyncio.get_event_loop()
+                response = await rate_limited(
+                    "kie_veo",
+                    "status",
+                    lambda: loop.run_in_executor(
+                        None,
+                        partial(requests.get, url, headers=headers, timeout=time_left(10)),
+                    ),
+                )
+
+                response.raise_for_status()
+                result = response.json()
+
+                # Kie.ai response format: {"code": 200, "msg": "success", "data": {...}}
+                if result.get('code') != 200:
+                    raise ProviderAPIError(
+                        f"Kie.ai API error: {result.get('msg', 'Unknown error')}",
+                        status_code=result.get('code'),
+                    )
 
             data = result.get('data', {})
-            logger.debug(f"Kie Veo video {video_id} status: {data.get('successFlag')}")
+            logger.debug("Kie Veo video %s status: %s", video_id, data.get("successFlag"))
 
             return self._convert_to_video_job_from_status(data, video_id)
 
@@ -175,6 +198,7 @@ class KieVeoService(AbstractVideoService):
                 logger.warning(f"Polling timeout reached for Kie Veo video {video_id} after {elapsed:.1f}s")
                 raise TimeoutError(f"Polling timeout after {timeout} seconds")
 
+            VIDEO_POLLS.inc(provider="kie_veo")
             video = await self.get_video_status(video_id)
 
             if video.status in ["completed", "succeeded", "failed", "error"]:
@@ -183,12 +207,13 @@ class KieVeoService(AbstractVideoService):
 
             await asyncio.sleep(poll_interval)
 
-    async def download_video_content(self, video_id: str) -> bytes:
+    async def download_video_content(self, video_id: str, variant: str = "video") -> bytes:
         """
         Download video content from Kie.ai.
 
         Args:
             video_id: The video task identifier
+            variant: Must be "video" (Kie.ai has no thumbnails or spritesheets)
 
         Returns:
             Binary content of the video
@@ -199,20 +224,21 @@ class KieVeoService(AbstractVideoService):
         try:
             logger.info(f"Downloading video from Kie Veo: {video_id}")
 
-            # Get video status to get download URL
-            video = await self.get_video_status(video_id)
-
-            if not video.video_url:
-                raise ValueError(f"No video URL available for {video_id}")
+            video_url = await self._get_result_url(video_id, variant)
 
             # Download from URL
-            loop = asyncio.get_event_loop()
-            response = await loop.run_in_executor(
-                None,
-                lambda: requests.get(video.video_url, timeout=60)
-            )
-
-            response.raise_for_status()
+            with guard("kie_veo"), track_upstream("kie_veo", "download"):
+                loop = asyncio.get_event_loop()
+                response = await rate_limited(
+                    "kie_veo",
+                    "download",
+                    lambda: loop.run_in_executor(
+                        None,
+                        partial(requests.get, video_url, timeout=time_left(60)),
+                    ),
+                )
+
+                response.raise_for_status()
             data = response.content
 
             logger.info(f"Downloaded {len(data)} bytes from Kie Veo for video {video_id}")
@@ -222,6 +248,73 @@ class KieVeoService(AbstractVideoService):
             logger.error(f"Error downloading Kie Veo video {video_id}: {str(e)}")
             raise
 
+    async def stream_video_content(self, video_id: str, variant: str = "video") -> AsyncIterator[bytes]:
+        """
+        Stream video content from Kie.ai without buffering it.
+
+        Args:
+            video_id: The video task identifier
+            variant: Must be "video" (Kie.ai has no thumbnails or spritesheets)
+
+        Returns:
+            Async iterator of content chunks
+
+        Raises:
+            Exception: If download fails (raised while iterating)
+        """
+        logger.info(f"Streaming video from Kie Veo: {video_id}")
+
+        video_url = await self._get_result_url(video_id, variant)
+
+        with guard("kie_veo"), track_upstream("kie_veo", "download"):
+            loop = asyncio.get_event_loop()
+            response = await rate_limited(
+                "kie_veo",
+                "download",
+                lambda: loop.run_in_executor(
+                    None,
+                    partial(requests.get, video_url, stream=True, timeout=time_left(60)),
+                ),
+            )
+            try:
+                response.raise_for_status()
+                chunks = response.iter_content(chunk_size=_STREAM_CHUNK_SIZE)
+                while True:
+                    chunk = await loop.run_in_executor(None, next, chunks, None)
+                    if chunk is None:
+                        break
+                    yield chunk
+            finally:
+                response.close()
+
+    async def delete_video(self, video_id: str) -> dict:
+        """
+        Delete a video.
+
+        Kie.ai has no delete API and expires results on its own, so there is
+        nothing to delete upstream; local copies are removed by the caller.
+
+        Args:
+            video_id: The video task identifier
+
+        Returns:
+            Deletion confirmation dict
+        """
+        logger.info(f"Kie Veo video {video_id} has no upstream copy to delete")
+        return {"id": video_id, "object": "video", "deleted": True}
+
+    async def _get_result_url(self, video_id: str, variant: str) -> str:
+        """URL of a completed task's video."""
+        if variant != "video":
+            raise ValueError(f"Kie Veo provides only the video, not a {variant}")
+
+        # Get video status to get download URL
+        video = await self.get_video_status(video_id)
+
+        if not video.video_url:
+            raise ValueError(f"No video URL available for {video_id}")
+        return video.video_url
+
     def get_supported_models(self) -> list[str]:
         """Get list of models supported by Kie.ai."""
         return ["veo-3.1"]
@@ -323,3 +416,15 @@ class KieVeoService(AbstractVideoService):
             video_url=video_url,
             error=error_detail,
         )
+
+
+# Singleton instance
+_kie_veo_service: Optional[KieVeoService] = None
+
+
+def get_kie_veo_service() -> KieVeoService:
+    """Get or create the Kie Veo service singleton."""
+    global _kie_veo_service
+    if _kie_veo_service is None:
+        _kie_veo_service = KieVeoService()
+    return _kie_veo_service
@@ -2,9 +2,8 @@
 
 import json
 import logging
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
-from anthropic import AsyncAnthropic
 
 from ..config import settings
 from ..models.publishing import (
@@ -16,6 +15,10 @@ from ..models.publishing import (
     InstagramMetadata,
     VideoPrivacy,
 )
+from ..utils.metrics import track_upstream
+
+if TYPE_CHECKING:
+    from anthropic import AsyncAnthropic
 
 logger = logging.getLogger(__name__)
 
@@ -25,7 +28,16 @@ class MetadataGenerationService:
 
     def __init__(self):
         """Initialize the metadata generation service."""
-        self.client = AsyncAnthropic(api_key=settings.anthropic_api_key)
+        self._client: Optional["AsyncAnthropic"] = None
+
+    @property
+    def client(self) -> "AsyncAnthropic":
+        """Anthropic client, created on first use (the SDK is slow to import)."""
+        if self._client is None:
+            from anthropic import AsyncAnthropic
+
+            self._client = AsyncAnthropic(api_key=settings.anthropic_api_key)
+        return self._client
 
     async def generate_metadata(
         self,
@@ -54,12 +66,13 @@ class MetadataGenerationService:
         logger.info(f"Generating metadata for {request.platform.value} video {request.video_id}")
 
         try:
-            response = await self.client.messages.create(
-                model="claude-3-5-sonnet-20241022",
-                max_tokens=2000,
-                system=system_prompt,
-                messages=[{"role": "user", "content": user_prompt}],
-            )
+            with track_upstream("anthropic", "generate_metadata"):
+                response = await self.client.messages.create(
+                    model="claude-3-5-sonnet-20241022",
+                    max_tokens=2000,
+                    system=system_prompt,
+                    messages=[{"role": "user", "content": user_prompt}],
+                )
 
             # Parse the JSON response
             content = response.content[0].text
@@ -355,3 +368,15 @@ Include all relevant fields for {platform.value} based on the guidelines above."
                 # Continue with other platforms even if one fails
 
         return results
+
+
+# Singleton instance
+_metadata_service: Optional[MetadataGenerationService] = None
+
+
+def get_metadata_service() -> MetadataGenerationService:
+    """Get or create the metadata generation service singleton."""
+    global _metadata_service
+    if _metadata_service is None:
+        _metadata_service = MetadataGenerationService()
+    return _metadata_service
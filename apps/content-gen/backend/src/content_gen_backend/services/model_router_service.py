@@ -1,11 +1,104 @@
 """Model router service for multi-model video generation."""
 
+from dataclasses import dataclass
 from typing import Literal, Optional
+from ..config import settings
 from ..models.video_response import VideoJob
 from ..utils.logging_setup import logger
-from .sora_service import SoraService
-from .kie_veo_service import KieVeoService
-from .kie_wan_service import KieWanService
+from ..utils.resilience import CircuitBreaker, CircuitOpenError, get_breaker, hedge
+from .abstract_video_service import AbstractVideoService
+from .routing_stats import RoutingStats
+from .sora_service import SoraService, get_sora_service
+from .kie_veo_service import KieVeoService, get_kie_veo_service
+from .kie_wan_service import KieWanService, get_kie_wan_service
+from .prefetch_service import PrefetchService, get_prefetch_service
+from .video_job_store import VideoJobStore, get_video_job_store, job_provider
+
+MODEL_INFO = {
+    "sora-2": {
+        "name": "Sora 2",
+        "provider": "OpenAI",
+        "description": "Fast, general-purpose video generation",
+        "cost_per_10s": 0.15,
+        "max_duration": 12,
+        "resolutions": ["1280x720", "720x1280", "1024x1792", "1792x1024"]
+    },
+    "sora-2-pro": {
+        "name": "Sora 2 Pro",
+        "provider": "OpenAI",
+        "description": "High-quality, creative video generation",
+        "cost_per_10s": 0.30,
+        "max_duration": 12,
+        "resolutions": ["1280x720", "720x1280", "1024x1792", "1792x1024"]
+    },
+    "veo-3.1": {
+        "name": "Veo 3.1",
+        "provider": "Google (via Kie.ai)",
+        "description": "Cinematic, realistic video generation",
+        "cost_per_10s": 0.10,
+        "max_duration": 10,
+        "resolutions": ["720p", "1080p"]
+    },
+    "wan-2.5": {
+        "name": "Wan 2.5",
+        "provider": "Alibaba (via Kie.ai)",
+        "description": "Image-to-video with lip-sync and human subjects",
+        "cost_per_10s": 0.08,
+        "max_duration": 10,
+        "resolutions": ["720p", "1080p"],
+        "features": ["lip-sync", "image-to-video", "prompt-expansion"]
+    }
+}
+
+# Durations each model accepts
+MODEL_DURATIONS = {
+    "sora-2": (4, 8, 12),
+    "sora-2-pro": (4, 8, 12),
+    "veo-3.1": (5, 10),
+    "wan-2.5": (5, 10),
+}
+
+# Circuit breaker (provider) name per model
+MODEL_PROVIDERS = {
+    "sora-2": "sora",
+    "sora-2-pro": "sora",
+    "veo-3.1": "kie_veo",
+    "wan-2.5": "kie_wan",
+}
+
+# The keyword heuristic's pick wins unless another model scores this much better
+PRIOR_DISCOUNT = 0.75
+
+
+@dataclass
+class RoutingPolicy:
+    """
+    Service-level objectives for auto model selection.
+
+    Attributes:
+        objective: "fastest" (lowest expected time to a completed video) or
+            "cheapest" (lowest cost)
+        max_cost: Maximum cost in USD for the video
+        max_latency: Maximum expected seconds until the video is completed
+        min_success_rate: Skip models whose recent success rate is lower
+    """
+
+    objective: Literal["fastest", "cheapest"] = "fastest"
+    max_cost: Optional[float] = None
+    max_latency: Optional[float] = None
+    min_success_rate: float = 0.5
+
+    @classmethod
+    def from_settings(cls, **overrides) -> "RoutingPolicy":
+        """Build the configured default policy, with non-None overrides applied."""
+        values = {
+            "objective": settings.routing_objective,
+            "max_cost": settings.routing_max_cost,
+            "max_latency": settings.routing_max_latency,
+            "min_success_rate": settings.routing_min_success_rate,
+        }
+        values.update({key: value for key, value in overrides.items() if value is not None})
+        return cls(**values)
 
 
 class ModelRouterService:
@@ -18,17 +111,38 @@ class ModelRouterService:
     - Kie.ai Wan 2.5 (wan-2.5)
     """
 
-    def __init__(self):
-        """Initialize all available video services."""
-        self.sora = SoraService()
-        self.kie_veo = KieVeoService()
-        self.kie_wan = KieWanService()
+    def __init__(
+        self,
+        sora: Optional[SoraService] = None,
+        kie_veo: Optional[KieVeoService] = None,
+        kie_wan: Optional[KieWanService] = None,
+        prefetcher: Optional[PrefetchService] = None,
+        jobs: Optional[VideoJobStore] = None,
+    ):
+        """
+        Initialize the router with its video services.
+
+        Args:
+            sora: Sora service (default: shared instance)
+            kie_veo: Kie Veo service (default: shared instance)
+            kie_wan: Kie Wan service (default: shared instance)
+            prefetcher: Downloads completed jobs (default: shared instance)
+            jobs: Local job table (default: shared instance)
+        """
+        self.sora = sora or get_sora_service()
+        self.kie_veo = kie_veo or get_kie_veo_service()
+        self.kie_wan = kie_wan or get_kie_wan_service()
+        self.prefetcher = prefetcher or get_prefetch_service()
+        self.jobs = jobs or get_video_job_store()
+        self.stats = RoutingStats()
         logger.info("ModelRouterService initialized")
 
     async def generate_video(
         self,
         prompt: str,
         model: Literal["sora-2", "sora-2-pro", "veo-3.1", "wan-2.5", "auto"] = "auto",
+        policy: Optional[RoutingPolicy] = None,
+        fallback: bool = True,
         **kwargs
     ) -> VideoJob:
         """
@@ -41,7 +155,10 @@ class ModelRouterService:
                 - "sora-2-pro": OpenAI Sora 2 Pro (high quality)
                 - "veo-3.1": Kie.ai Veo 3.1 (Google's cinematic model)
                 - "wan-2.5": Kie.ai Wan 2.5 (Alibaba's image-to-video with lip-sync)
-                - "auto": Auto-select based on prompt characteristics
+                - "auto": Auto-select based on live provider stats and prompt
+            policy: Routing objectives for "auto" (default: from settings)
+            fallback: Retry a failed request on another model (the runner-up
+                for "auto", otherwise sora-2); False runs it on one model only
             **kwargs: Model-specific parameters
 
         Returns:
@@ -52,27 +169,125 @@ class ModelRouterService:
             Exception: If video generation fails
         """
         if model == "auto":
-            model = self._select_best_model(prompt, kwargs)
+            # Best-ranked model, with the runner-up as fallback
+            candidates = self._rank_models(prompt, kwargs, policy or RoutingPolicy.from_settings())[:2]
+        else:
+            # Fallback to Sora 2 if the requested model fails
+            candidates = [model] if model == "sora-2" else [model, "sora-2"]
+        if not fallback:
+            candidates = candidates[:1]
+
+        for attempt, candidate in enumerate(candidates):
+            if attempt:
+                logger.info(f"Attempting fallback to {candidate}")
+            logger.info(f"Routing video generation to model: {candidate}")
+
+            try:
+                video = await self._generate_with(candidate, prompt, **kwargs)
+            except Exception as e:
+                if not isinstance(e, CircuitOpenError):
+                    self.stats.create_failed(candidate)
+                if attempt == len(candidates) - 1:
+                    raise
+                logger.error(f"Error with {candidate}, trying fallback: {str(e)}")
+                continue
+
+            self.stats.job_created(candidate, video.id)
+            await self.jobs.record(video, prompt=prompt)
+            return video
+
+    def rank_models(self, prompt: str, policy: Optional[RoutingPolicy] = None, **kwargs) -> list[str]:
+        """
+        Models that could serve an "auto" request, best first.
 
-        logger.info(f"Routing video generation to model: {model}")
+        Args:
+            prompt: Text description of the video
+            policy: Routing objectives (default: from settings)
+            **kwargs: Generation parameters (seconds, input_reference, ...)
+        """
+        return self._rank_models(prompt, kwargs, policy or RoutingPolicy.from_settings())
 
-        try:
-            if model in ["sora-2", "sora-2-pro"]:
-                return await self._generate_with_sora(prompt, model, **kwargs)
-            elif model == "veo-3.1":
-                return await self._generate_with_veo(prompt, **kwargs)
-            elif model == "wan-2.5":
-                return await self._generate_with_wan(prompt, **kwargs)
-            else:
-                raise ValueError(f"Unsupported model: {model}")
+    async def get_video_status(self, video_id: str, model: str) -> VideoJob:
+        """
+        Fetch a job's status from the service that created it.
+
+        Args:
+            video_id: Video job identifier
+            model: Model the job was requested on; Sora ids ("video_...")
+                always go to Sora, since failed requests fall back to it
+        """
+        if video_id.startswith("video_"):
+            return await self.sora.get_video_status(video_id)
+        if model == "wan-2.5":
+            return await self.kie_wan.get_video_status(video_id)
+        return await self.kie_veo.get_video_status(video_id)
+
+    async def observe_job(self, video: VideoJob) -> None:
+        """
+        Feed a job's latest status into the routing statistics and the job
+        table, and queue completed jobs for download into local storage.
 
-        except Exception as e:
-            logger.error(f"Error with {model}, trying fallback")
-            # Fallback to Sora 2 if available
-            if model != "sora-2":
-                logger.info("Attempting fallback to sora-2")
-                return await self._generate_with_sora(prompt, "sora-2", **kwargs)
-            raise
+        Called wherever job status is fetched; only the first terminal status
+        of a job created by this router is counted.
+        """
+        await self.jobs.record(video)
+        if video.status in ("completed", "failed"):
+            self.stats.job_finished(video.id, ok=video.status == "completed")
+        if video.status == "completed":
+            self.prefetcher.schedule(video)
+
+    def get_service(self, provider: str) -> AbstractVideoService:
+        """Video service for a provider (sora, kie_veo, kie_wan)."""
+        return {"sora": self.sora, "kie_veo": self.kie_veo, "kie_wan": self.kie_wan}[provider]
+
+    async def known_service(self, video_id: str) -> Optional[AbstractVideoService]:
+        """
+        Service running a job, if known without asking a provider.
+
+        Sora IDs are recognisable; Kie Veo and Wan share an ID format, so
+        their jobs are looked up in the job table.
+        """
+        if video_id.startswith("video_"):
+            return self.sora
+        provider = await self.jobs.get_provider(video_id)
+        return self.get_service(provider) if provider else None
+
+    async def resolve_service(self, video_id: str) -> AbstractVideoService:
+        """
+        Service running a job, asking Kie Veo then Wan for jobs not in the
+        job table (e.g. created before it existed).
+
+        Raises:
+            Exception: If neither Kie service knows the job
+        """
+        service = await self.known_service(video_id)
+        if service is None:
+            video = await hedge(
+                lambda: self.kie_veo.get_video_status(video_id),
+                lambda: self.kie_wan.get_video_status(video_id),
+            )
+            await self.observe_job(video)
+            service = self.get_service(job_provider(video))
+        return service
+
+    def get_routing_stats(self) -> dict[str, dict]:
+        """Current per-model latency/success estimates and circuit states used by auto routing."""
+        snapshot = self.stats.snapshot()
+        for model, entry in snapshot.items():
+            if model in MODEL_PROVIDERS:
+                entry["circuit"] = get_breaker(MODEL_PROVIDERS[model]).state
+        return snapshot
+
+    async def _generate_with(self, model: str, prompt: str, **kwargs) -> VideoJob:
+        """Create a video on `model`."""
+        if model in ["sora-2", "sora-2-pro"]:
+            return await self._generate_with_sora(prompt, model, **kwargs)
+        elif model == "veo-3.1":
+            return await self._generate_with_veo(prompt, **kwargs)
+        elif model == "wan-2.5":
+            return await self._generate_with_wan(prompt, **kwargs)
+        else:
+            raise ValueError(f"Unsupported model: {model}")
 
     async def _generate_with_sora(
         self, prompt: str, model: str, **kwargs
@@ -121,9 +336,70 @@ class ModelRouterService:
             enable_prompt_expansion=True
         )
 
+    def _rank_models(self, prompt: str, kwargs: dict, policy: RoutingPolicy) -> list[str]:
+        """
+        Order the models that can serve this request, best first.
+
+        Each model is scored by the policy objective: expected time to a
+        completed video (live latency divided by success rate, so flaky
+        providers pay for their retries) or cost. The keyword heuristic's pick
+        gets a PRIOR_DISCOUNT. Models within the policy limits rank ahead of
+        those outside them; if none qualify, the closest is used. Models whose
+        provider circuit is open rank last.
+
+        Args:
+            prompt: Text description of the video
+            kwargs: Generation parameters (seconds, input_reference, ...)
+            policy: Routing objectives
+
+        Returns:
+            Model identifiers, best first
+        """
+        preferred = self._select_best_model(prompt, kwargs)
+        seconds = kwargs.get("seconds", 4)
+
+        candidates = [model for model, durations in MODEL_DURATIONS.items() if seconds in durations]
+        if kwargs.get("input_reference") is not None or not settings.kie_api_key:
+            # Uploaded reference images and a missing Kie.ai key both mean Sora only
+            candidates = [model for model in candidates if model.startswith("sora")]
+        if not candidates:
+            return [preferred]
+
+        ranked = []
+        for model in candidates:
+            latency, success_rate = self.stats.estimate(model)
+            expected_latency = latency / max(success_rate, 0.05)
+            cost = MODEL_INFO[model]["cost_per_10s"] * seconds / 10
+            within_policy = (
+                (policy.max_cost is None or cost <= policy.max_cost)
+                and (policy.max_latency is None or expected_latency <= policy.max_latency)
+                and success_rate >= policy.min_success_rate
+            )
+            circuit_open = get_breaker(MODEL_PROVIDERS[model]).state == CircuitBreaker.OPEN
+            prior = PRIOR_DISCOUNT if model == preferred else 1.0
+            if policy.objective == "cheapest":
+                score = (cost * prior, expected_latency)
+            else:
+                score = (expected_latency * prior, cost)
+            ranked.append((circuit_open, not within_policy, score, model, expected_latency, cost))
+
+        ranked.sort()
+        circuit_open, outside_policy, _, best, expected_latency, cost = ranked[0]
+        if circuit_open:
+            logger.warning("All candidate providers have open circuits; trying the best anyway")
+        elif outside_policy:
+            logger.warning(f"No model meets routing policy {policy}; using closest match")
+        logger.info(
+            f"Auto-routing to {best}: expected {expected_latency:.0f}s, ${cost:.3f} "
+            f"(objective: {policy.objective}, keyword prior: {preferred})"
+        )
+        return [entry[3] for entry in ranked]
+
     def _select_best_model(self, prompt: str, kwargs: dict) -> str:
         """
-        Auto-select best model based on prompt characteristics and parameters.
+        Pick a model from prompt characteristics and parameters.
+
+        Used as the prior for auto routing (see _rank_models).
 
         Selection heuristics:
         - Wan 2.5: Best for human subjects with dialogue/speech (requires image_url for best results)
@@ -142,7 +418,7 @@ class ModelRouterService:
             "lip-sync", "lip sync", "mouth", "voice", "announce", "presenter"
         ]):
             if seconds in [5, 10]:
-                logger.info("Auto-selected wan-2.5 for human speech/dialogue content")
+                logger.debug("Keyword prior: wan-2.5 for human speech/dialogue content")
                 return "wan-2.5"
 
         # Check for cinematic/realistic keywords (Veo 3.1)
@@ -152,10 +428,10 @@ class ModelRouterService:
             "professional", "commercial", "news", "interview"
         ]):
             if seconds in [5, 10]:
-                logger.info("Auto-selected veo-3.1 for realistic/cinematic content")
+                logger.debug("Keyword prior: veo-3.1 for realistic/cinematic content")
                 return "veo-3.1"
             else:
-                logger.info(f"Veo 3.1 preferred but duration {seconds}s incompatible, using sora-2-pro")
+                logger.debug(f"Keyword prior: Veo 3.1 preferred but duration {seconds}s incompatible, using sora-2-pro")
                 return "sora-2-pro"
 
         # Check for artistic/creative keywords (Sora 2 Pro)
@@ -163,11 +439,11 @@ class ModelRouterService:
             "artistic", "abstract", "surreal", "dreamlike", "fantasy",
             "painting", "watercolor", "anime", "stylized"
         ]):
-            logger.info("Auto-selected sora-2-pro for artistic content")
+            logger.debug("Keyword prior: sora-2-pro for artistic content")
             return "sora-2-pro"
 
         # Default to Sora 2 (fast, general purpose)
-        logger.info("Auto-selected sora-2 as default")
+        logger.debug("Keyword prior: sora-2 as default")
         return "sora-2"
 
     def _convert_size_to_resolution(self, size: str) -> str:
@@ -203,44 +479,20 @@ class ModelRouterService:
         Returns:
             Dictionary with model information
         """
-        model_info = {
-            "sora-2": {
-                "name": "Sora 2",
-                "provider": "OpenAI",
-                "description": "Fast, general-purpose video generation",
-                "cost_per_10s": 0.15,
-                "max_duration": 12,
-                "resolutions": ["1280x720", "720x1280", "1024x1792", "1792x1024"]
-            },
-            "sora-2-pro": {
-                "name": "Sora 2 Pro",
-                "provider": "OpenAI",
-                "description": "High-quality, creative video generation",
-                "cost_per_10s": 0.30,
-                "max_duration": 12,
-                "resolutions": ["1280x720", "720x1280", "1024x1792", "1792x1024"]
-            },
-            "veo-3.1": {
-                "name": "Veo 3.1",
-                "provider": "Google (via Kie.ai)",
-                "description": "Cinematic, realistic video generation",
-                "cost_per_10s": 0.10,
-                "max_duration": 10,
-                "resolutions": ["720p", "1080p"]
-            },
-            "wan-2.5": {
-                "name": "Wan 2.5",
-                "provider": "Alibaba (via Kie.ai)",
-                "description": "Image-to-video with lip-sync and human subjects",
-                "cost_per_10s": 0.08,
-                "max_duration": 10,
-                "resolutions": ["720p", "1080p"],
-                "features": ["lip-sync", "image-to-video", "prompt-expansion"]
-            }
-        }
-
-        return model_info.get(model, {
+        return MODEL_INFO.get(model, {
             "name": model,
             "provider": "Unknown",
             "description": "No information available"
         })
+
+
+# Singleton instance
+_model_router: Optional[ModelRouterService] = None
+
+
+def get_model_router() -> ModelRouterService:
+    """Get or create the model router singleton."""
+    global _model_router
+    if _model_router is None:
+        _model_router = ModelRouterService()
+    return _model_router
@@ -10,12 +10,15 @@ from sqlalchemy import desc, func
 
 from ..config import settings
 from ..models.news import (
+    NEWS_ARTICLE_COLUMNS,
     NewsArticleDB,
     NewsArticleResponse,
     NewsArticleCreate,
     NewsCategory,
+    news_article_to_dict,
 )
 from ..utils.logging_setup import logger
+from ..utils.metrics import track_upstream
 
 
 class NewsService:
@@ -57,8 +60,9 @@ class NewsService:
                 "pageSize": min(page_size, 100),
             }
 
-            response = requests.get(url, params=params, timeout=10)
-            response.raise_for_status()
+            with track_upstream("newsapi", "top_headlines"):
+                response = requests.get(url, params=params, timeout=10)
+                response.raise_for_status()
 
             data = response.json()
 
@@ -150,21 +154,7 @@ class NewsService:
                 self.db.commit()
                 self.db.refresh(db_article)
 
-                saved_articles.append(
-                    NewsArticleResponse(
-                        id=str(db_article.id),
-                        title=db_article.title,
-                        description=db_article.description,
-                        content=db_article.content,
-                        url=db_article.url,
-                        source=db_article.source,
-                        category=NewsCategory(db_article.category) if db_article.category else None,
-                        published_at=db_article.published_at,
-                        image_url=db_article.image_url,
-                        created_at=db_article.created_at,
-                        is_processed=db_article.is_processed,
-                    )
-                )
+                saved_articles.append(self._to_response(db_article))
 
             except Exception as e:
                 self.db.rollback()
@@ -200,10 +190,13 @@ class NewsService:
         is_processed: Optional[bool] = None,
         limit: int = 20,
         offset: int = 0,
-    ) -> tuple[List[NewsArticleResponse], int]:
+    ) -> tuple[List[dict], int]:
         """
         Get articles from database with filtering and pagination.
 
+        Only the response columns are selected and rows are mapped straight
+        to dicts, so list pages skip ORM hydration and Pydantic validation.
+
         Args:
             category: Filter by category
             is_processed: Filter by processing status
@@ -211,9 +204,9 @@ class NewsService:
             offset: Number of articles to skip
 
         Returns:
-            Tuple of (articles, total_count)
+            Tuple of (article dicts matching NewsArticleResponse, total_count)
         """
-        query = self.db.query(NewsArticleDB)
+        query = self.db.query(*NEWS_ARTICLE_COLUMNS)
 
         # Apply filters
         if category:
@@ -225,32 +218,14 @@ class NewsService:
         total = query.count()
 
         # Apply pagination and ordering
-        articles = (
+        rows = (
             query.order_by(desc(NewsArticleDB.created_at))
             .limit(limit)
             .offset(offset)
             .all()
         )
 
-        # Convert to response models
-        article_responses = [
-            NewsArticleResponse(
-                id=str(article.id),
-                title=article.title,
-                description=article.description,
-                content=article.content,
-                url=article.url,
-                source=article.source,
-                category=NewsCategory(article.category) if article.category else None,
-                published_at=article.published_at,
-                image_url=article.image_url,
-                created_at=article.created_at,
-                is_processed=article.is_processed,
-            )
-            for article in articles
-        ]
-
-        return article_responses, total
+        return [news_article_to_dict(row) for row in rows], total
 
     def get_article_by_id(self, article_id: str) -> Optional[NewsArticleResponse]:
         """Get a single article by ID."""
@@ -259,19 +234,7 @@ class NewsService:
         if not article:
             return None
 
-        return NewsArticleResponse(
-            id=str(article.id),
-            title=article.title,
-            description=article.description,
-            content=article.content,
-            url=article.url,
-            source=article.source,
-            category=NewsCategory(article.category) if article.category else None,
-            published_at=article.published_at,
-            image_url=article.image_url,
-            created_at=article.created_at,
-            is_processed=article.is_processed,
-        )
+        return self._to_response(article)
 
     def delete_article(self, article_id: str) -> bool:
         """Delete an article by ID."""
@@ -283,3 +246,7 @@ class NewsService:
         self.db.delete(article)
         self.db.commit()
         return True
+
+    def _to_response(self, article: NewsArticleDB) -> NewsArticleResponse:
+        """Convert database model to response model."""
+        return NewsArticleResponse(**news_article_to_dict(article))
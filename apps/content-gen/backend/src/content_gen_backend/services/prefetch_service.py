@@ -0,0 +1,174 @@
+"""Background download of completed videos into local storage."""
+
+import asyncio
+import itertools
+import time
+from collections import OrderedDict
+from typing import AsyncIterator, Optional
+
+from ..config import settings
+from ..models.video_response import VideoJob
+from ..utils.logging_setup import logger
+from ..utils.metrics import PREFETCH_DOWNLOADS, PREFETCH_QUEUE_DEPTH
+from .kie_veo_service import KieVeoService, get_kie_veo_service
+from .kie_wan_service import KieWanService, get_kie_wan_service
+from .sora_service import SoraService, get_sora_service
+from .storage_service import StorageService, get_storage_service
+
+# Jobs remembered as already scheduled (oldest forgotten first)
+_MAX_SCHEDULED = 10000
+
+# Failed downloads of an asset before it is no longer re-queued
+_MAX_ATTEMPTS = 3
+
+
+class PrefetchService:
+    """
+    Downloads the assets of completed jobs into StorageService.
+
+    A job is scheduled the first time a status check sees it completed;
+    if one of its downloads fails, the next status check queues it again,
+    up to `_MAX_ATTEMPTS` failures per asset. Each asset (Sora: video, thumbnail and spritesheet; Kie: video) is
+    queued separately and served by `prefetch_concurrency` workers, soonest
+    `expires_at` first, so a job's assets download side by side and ones
+    about to expire go before ones with time to spare.
+    """
+
+    def __init__(
+        self,
+        sora: Optional[SoraService] = None,
+        kie_veo: Optional[KieVeoService] = None,
+        kie_wan: Optional[KieWanService] = None,
+        storage: Optional[StorageService] = None,
+    ):
+        """
+        Initialize the prefetcher.
+
+        Args:
+            sora: Sora service (default: shared instance)
+            kie_veo: Kie Veo service (default: shared instance)
+            kie_wan: Kie Wan service (default: shared instance)
+            storage: Local storage to fill (default: shared instance)
+        """
+        self.sora = sora or get_sora_service()
+        self.kie_veo = kie_veo or get_kie_veo_service()
+        self.kie_wan = kie_wan or get_kie_wan_service()
+        self.storage = storage or get_storage_service()
+        self._queue: asyncio.PriorityQueue = asyncio.PriorityQueue()
+        self._order = itertools.count()  # FIFO among equal expiry
+        self._scheduled: OrderedDict[str, None] = OrderedDict()
+        self._failures: OrderedDict[tuple[str, str], int] = OrderedDict()  # (job, variant) -> failed downloads
+        self._inflight: dict[tuple[str, str], asyncio.Future] = {}
+        self._workers: list[asyncio.Task] = []
+        logger.info("PrefetchService initialized")
+
+    def schedule(self, video: VideoJob) -> bool:
+        """
+        Queue a completed job's assets for download, once per job.
+
+        Args:
+            video: Latest job status
+
+        Returns:
+            True if the job was newly queued
+        """
+        if not settings.prefetch_enabled or video.status != "completed" or video.id in self._scheduled:
+            return False
+
+        self._scheduled[video.id] = None
+        while len(self._scheduled) > _MAX_SCHEDULED:
+            self._scheduled.popitem(last=False)
+
+        variants = [
+            variant for variant in self._variants(video)
+            if self._failures.get((video.id, variant), 0) < _MAX_ATTEMPTS
+        ]
+        if not variants:
+            return False
+
+        expires_at = video.expires_at or float("inf")
+        for variant in variants:
+            self._queue.put_nowait((expires_at, next(self._order), video, variant))
+        PREFETCH_QUEUE_DEPTH.set(self._queue.qsize())
+        self._start_workers()
+
+        logger.debug("Queued prefetch of video %s (expires_at=%s)", video.id, video.expires_at)
+        return True
+
+    async def wait(self, video_id: str, variant: str) -> None:
+        """Wait for an in-progress prefetch of an asset, if there is one."""
+        future = self._inflight.get((video_id, variant))
+        if future is not None:
+            await asyncio.shield(future)
+
+    @staticmethod
+    def _variants(video: VideoJob) -> tuple[str, ...]:
+        if video.id.startswith("video_"):
+            return ("video", "thumbnail", "spritesheet")
+        return ("video",)
+
+    def _stream(self, video: VideoJob, variant: str) -> AsyncIterator[bytes]:
+        if video.id.startswith("video_"):
+            return self.sora.stream_video_content(video.id, variant)
+        if video.model.startswith("kie-wan"):
+            return self.kie_wan.stream_video_content(video.id)
+        return self.kie_veo.stream_video_content(video.id)
+
+    def _start_workers(self) -> None:
+        self._workers = [worker for worker in self._workers if not worker.done()]
+        for _ in range(max(1, settings.prefetch_concurrency) - len(self._workers)):
+            self._workers.append(asyncio.create_task(self._work()))
+
+    async def _work(self) -> None:
+        while True:
+            expires_at, _, video, variant = await self._queue.get()
+            PREFETCH_QUEUE_DEPTH.set(self._queue.qsize())
+            try:
+                await self._fetch(video, variant, expires_at)
+            finally:
+                self._queue.task_done()
+
+    async def _fetch(self, video: VideoJob, variant: str, expires_at: float) -> None:
+        """Download one asset unless it is already stored or has expired."""
+        if self.storage.has_video(video.id, variant):
+            PREFETCH_DOWNLOADS.inc(variant=variant, result="cached")
+            return
+        if expires_at <= time.time():
+            logger.warning(f"Skipping prefetch of {variant} for video {video.id}: assets expired")
+            PREFETCH_DOWNLOADS.inc(variant=variant, result="expired")
+            return
+
+        key = (video.id, variant)
+        if key in self._inflight:
+            return  # Queued again by a retry while still downloading
+        future = self._inflight[key] = asyncio.get_running_loop().create_future()
+        try:
+            # Streamed to disk, so workers never hold a whole video in memory
+            async for _ in self.storage.save_stream(video.id, self._stream(video, variant), variant):
+                pass
+            PREFETCH_DOWNLOADS.inc(variant=variant, result="ok")
+            self._failures.pop(key, None)
+        except Exception as e:
+            failures = self._failures[key] = self._failures.get(key, 0) + 1
+            while len(self._failures) > _MAX_SCHEDULED:
+                self._failures.popitem(last=False)
+            retry = "will retry" if failures < _MAX_ATTEMPTS else "giving up"
+            logger.warning(f"Prefetch of {variant} for video {video.id} failed ({failures}, {retry}): {str(e)}")
+            PREFETCH_DOWNLOADS.inc(variant=variant, result="error")
+            # Let the next status check queue the job again
+            self._scheduled.pop(video.id, None)
+        finally:
+            del self._inflight[key]
+            future.set_result(None)
+
+
+# Singleton instance
+_prefetch_service: Optional[PrefetchService] = None
+
+
+def get_prefetch_service() -> PrefetchService:
+    """Get or create the prefetch service singleton."""
+    global _prefetch_service
+    if _prefetch_service is None:
+        _prefetch_service = PrefetchService()
+    return _prefetch_service
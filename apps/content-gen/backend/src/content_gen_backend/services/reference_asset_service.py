@@ -0,0 +1,163 @@
+"""Store of normalised reference images for video generation."""
+
+import asyncio
+import io
+import re
+from dataclasses import dataclass
+from pathlib import Path
+from typing import BinaryIO, Optional
+
+import aiofiles
+
+from ..config import settings
+from ..utils.logging_setup import logger
+from ..utils.metrics import STORAGE_CACHE_REQUESTS
+
+# Stored file names: <sha256 of the upload>_<WxH>.jpg
+ASSET_NAME_PATTERN = re.compile(r"^[0-9a-f]{64}_\d+x\d+\.jpg$")
+
+_JPEG_QUALITY = 90
+
+
+@dataclass
+class ReferenceAsset:
+    """A reference image normalised for one output size."""
+
+    digest: str
+    size: str
+    path: Path
+
+    @property
+    def name(self) -> str:
+        return self.path.name
+
+    @property
+    def url(self) -> Optional[str]:
+        """Public URL providers can fetch the image from, if PUBLIC_BASE_URL is set."""
+        if not settings.public_base_url:
+            return None
+        return f"{settings.public_base_url.rstrip('/')}/api/v1/videos/references/{self.name}"
+
+    async def read(self) -> bytes:
+        async with aiofiles.open(self.path, "rb") as f:
+            return await f.read()
+
+
+def _normalise(source: BinaryIO, dimensions: tuple[int, int]) -> bytes:
+    """
+    Decode an image file and re-encode it as an RGB JPEG of `dimensions`.
+
+    Providers expect the reference to match the video resolution, so the
+    image is scaled and centre-cropped to it.
+
+    Raises:
+        ValueError: If the file is not a readable image
+    """
+    from PIL import Image, ImageOps, UnidentifiedImageError
+
+    try:
+        source.seek(0)
+        with Image.open(source, formats=("JPEG", "PNG", "WEBP")) as image:
+            image = ImageOps.exif_transpose(image).convert("RGB")
+            if image.size != dimensions:
+                image = ImageOps.fit(image, dimensions, Image.Resampling.LANCZOS)
+            output = io.BytesIO()
+            image.save(output, "JPEG", quality=_JPEG_QUALITY, optimize=True)
+            return output.getvalue()
+    except (UnidentifiedImageError, Image.DecompressionBombError, OSError) as e:
+        raise ValueError("Input reference is not a readable image (JPEG, PNG, or WebP)") from e
+
+
+class ReferenceAssetService:
+    """
+    Content-addressed store of reference images.
+
+    Each upload is hashed, normalised once per output size and kept on
+    disk, so the same brand image reused across jobs is decoded and resized
+    only the first time.
+    """
+
+    def __init__(self, storage_path: Optional[str] = None):
+        """
+        Initialize the reference asset store.
+
+        Args:
+            storage_path: Directory for normalised images
+        """
+        self.storage_path = Path(storage_path or settings.reference_storage_path)
+        self.storage_path.mkdir(parents=True, exist_ok=True)
+        self._pending: dict[str, asyncio.Future] = {}
+        logger.info(f"ReferenceAssetService initialized with path: {self.storage_path.absolute()}")
+
+    async def prepare(self, source: BinaryIO, digest: str, size: str) -> ReferenceAsset:
+        """
+        Get the normalised asset for an uploaded image, creating it if new.
+
+        Args:
+            source: Uploaded image file (read only on a cache miss)
+            digest: SHA-256 of the file contents
+            size: Output video resolution (e.g. "1280x720")
+
+        Returns:
+            ReferenceAsset
+
+        Raises:
+            ValueError: If the file is not a readable image or size isn't WxH
+        """
+        match = re.fullmatch(r"(\d+)x(\d+)", size)
+        if not match:
+            raise ValueError(f"Invalid size for reference image: {size}")
+        dimensions = (int(match.group(1)), int(match.group(2)))
+
+        asset = ReferenceAsset(digest, size, self.storage_path / f"{digest}_{size}.jpg")
+
+        if asset.path.exists():
+            STORAGE_CACHE_REQUESTS.inc(variant="reference", result="hit")
+            return asset
+        STORAGE_CACHE_REQUESTS.inc(variant="reference", result="miss")
+
+        # Concurrent uploads of the same image share one normalisation
+        pending = self._pending.get(asset.name)
+        if pending is not None:
+            await asyncio.shield(pending)
+            return asset
+
+        future = self._pending[asset.name] = asyncio.get_running_loop().create_future()
+        try:
+            normalised = await asyncio.to_thread(_normalise, source, dimensions)
+            temp_path = asset.path.with_suffix(".tmp")
+            async with aiofiles.open(temp_path, "wb") as f:
+                await f.write(normalised)
+            temp_path.replace(asset.path)
+            future.set_result(None)
+        except BaseException as e:
+            if isinstance(e, Exception):
+                future.set_exception(e)
+                future.exception()  # Mark retrieved; waiters still receive it
+            else:
+                future.cancel()
+            raise
+        finally:
+            del self._pending[asset.name]
+
+        logger.info(f"Stored reference image {asset.name} ({len(normalised)} bytes)")
+        return asset
+
+    def get_path(self, name: str) -> Optional[Path]:
+        """Path of a stored asset by file name, or None if unknown or invalid."""
+        if not ASSET_NAME_PATTERN.match(name):
+            return None
+        path = self.storage_path / name
+        return path if path.exists() else None
+
+
+# Singleton instance
+_reference_asset_service: Optional[ReferenceAssetService] = None
+
+
+def get_reference_asset_service() -> ReferenceAssetService:
+    """Get or create the reference asset service singleton."""
+    global _reference_asset_service
+    if _reference_asset_service is None:
+        _reference_asset_service = ReferenceAssetService()
+    return _reference_asset_service
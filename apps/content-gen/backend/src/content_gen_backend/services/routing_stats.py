@@ -0,0 +1,130 @@
+"""Live per-model latency and success statistics for auto routing."""
+
+import math
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Optional
+
+# Starting estimates (seconds from create to completed, success rate) used
+# until real jobs complete; rough figures from observed provider behaviour
+PRIOR_LATENCY = {
+    "sora-2": 90.0,
+    "sora-2-pro": 240.0,
+    "veo-3.1": 150.0,
+    "wan-2.5": 120.0,
+}
+PRIOR_SUCCESS_RATE = 0.95
+
+# Weight of the newest observation in the moving averages
+_EWMA_ALPHA = 0.2
+
+# Stats relax back toward the prior when a model hasn't been used lately, so
+# a provider that was slow an hour ago gets retried eventually
+_DECAY_SECONDS = 1800.0
+
+# Jobs created by this process and not yet seen finishing
+_MAX_PENDING_JOBS = 10000
+
+
+@dataclass
+class ModelStats:
+    """Moving averages for one model."""
+
+    latency: float
+    success_rate: float = PRIOR_SUCCESS_RATE
+    completed: int = 0
+    failed: int = 0
+    updated_at: float = field(default_factory=time.monotonic)
+
+    def record(self, ok: bool, latency: Optional[float] = None) -> None:
+        self.success_rate += _EWMA_ALPHA * ((1.0 if ok else 0.0) - self.success_rate)
+        if latency is not None:
+            self.latency += _EWMA_ALPHA * (latency - self.latency)
+        if ok:
+            self.completed += 1
+        else:
+            self.failed += 1
+        self.updated_at = time.monotonic()
+
+
+class RoutingStats:
+    """
+    Tracks time-to-completion and success rate per model.
+
+    Latency is measured from job creation (in this process) until a status
+    check first sees the job completed, so it includes provider queueing.
+    """
+
+    def __init__(self):
+        self._stats: dict[str, ModelStats] = {}
+        self._pending: OrderedDict[str, tuple[str, float]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _get(self, model: str) -> ModelStats:
+        stats = self._stats.get(model)
+        if stats is None:
+            stats = self._stats[model] = ModelStats(latency=PRIOR_LATENCY.get(model, 120.0))
+        return stats
+
+    def job_created(self, model: str, job_id: str) -> None:
+        """Start timing a job created on `model`."""
+        with self._lock:
+            self._pending[job_id] = (model, time.monotonic())
+            while len(self._pending) > _MAX_PENDING_JOBS:
+                self._pending.popitem(last=False)
+
+    def create_failed(self, model: str) -> None:
+        """Count a rejected create call as a failure."""
+        with self._lock:
+            self._get(model).record(ok=False)
+
+    def job_finished(self, job_id: str, ok: bool) -> None:
+        """Record the outcome of a job created by `job_created`; no-op otherwise."""
+        with self._lock:
+            pending = self._pending.pop(job_id, None)
+            if pending is None:
+                return
+            model, started = pending
+            self._get(model).record(ok, time.monotonic() - started if ok else None)
+
+    def estimate(self, model: str) -> tuple[float, float]:
+        """
+        Current (expected latency seconds, success rate) for `model`.
+
+        Estimates drift back to the prior as they age.
+        """
+        prior_latency = PRIOR_LATENCY.get(model, 120.0)
+        with self._lock:
+            stats = self._stats.get(model)
+            if stats is None:
+                return prior_latency, PRIOR_SUCCESS_RATE
+            weight = math.exp(-(time.monotonic() - stats.updated_at) / _DECAY_SECONDS)
+            latency = prior_latency + (stats.latency - prior_latency) * weight
+            success = PRIOR_SUCCESS_RATE + (stats.success_rate - PRIOR_SUCCESS_RATE) * weight
+        return latency, success
+
+    def snapshot(self) -> dict[str, dict]:
+        """Per-model estimates and counts, for logging and diagnostics."""
+        with self._lock:
+            models = set(PRIOR_LATENCY) | set(self._stats)
+            counts = {
+                model: (self._stats[model].completed, self._stats[model].failed)
+                for model in self._stats
+            }
+            in_flight: dict[str, int] = {}
+            for model, _ in self._pending.values():
+                in_flight[model] = in_flight.get(model, 0) + 1
+        result = {}
+        for model in sorted(models):
+            latency, success = self.estimate(model)
+            completed, failed = counts.get(model, (0, 0))
+            result[model] = {
+                "expected_latency": round(latency, 1),
+                "success_rate": round(success, 3),
+                "completed": completed,
+                "failed": failed,
+                "in_flight": in_flight.get(model, 0),
+            }
+        return result
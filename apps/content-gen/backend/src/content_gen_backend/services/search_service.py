@@ -0,0 +1,273 @@
+"""Full-text search over news articles and video ideas."""
+
+import re
+from typing import List, Optional
+
+from sqlalchemy import column, desc, literal_column, or_, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+from ..models.idea import VIDEO_IDEA_COLUMNS, VideoIdeaDB, video_idea_to_dict
+from ..models.news import NEWS_ARTICLE_COLUMNS, NewsArticleDB, news_article_to_dict
+from ..utils.logging_setup import logger
+
+# Indexed columns per table, most important first. Weights feed bm25() on
+# SQLite; on PostgreSQL the first three columns map to tsvector weights A/B/C.
+SEARCH_INDEXES = {
+    "news_articles": {
+        "columns": ["title", "description", "content"],
+        "weights": [10.0, 4.0, 1.0],
+    },
+    "video_ideas": {
+        "columns": ["title", "concept", "video_prompt"],
+        "weights": [10.0, 4.0, 1.0],
+    },
+}
+
+_PG_WEIGHTS = ["A", "B", "C", "D"]
+
+# Words that match nearly every row; dropped from queries that have other terms
+_STOPWORDS = frozenset(
+    "a an and are as at be but by for from has have in is it its of on or "
+    "that the their this to was were will with".split()
+)
+
+# Broad SQLite queries are ranked only among this many newest matches, so a
+# query matching most of the table doesn't score every row with bm25()
+_RANK_WINDOW = 5000
+
+# Set by init_search_indexes(); False means fall back to LIKE scans
+_fts_enabled = False
+
+
+def init_search_indexes(engine: Engine) -> None:
+    """
+    Create full-text indexes and keep them in sync with their tables.
+
+    SQLite uses external-content FTS5 tables maintained by triggers;
+    PostgreSQL uses a generated tsvector column with a GIN index. Safe to
+    call on every startup.
+    """
+    global _fts_enabled
+
+    dialect = engine.dialect.name
+    try:
+        with engine.begin() as conn:
+            for table_name, config in SEARCH_INDEXES.items():
+                if dialect == "sqlite":
+                    _create_sqlite_index(conn, table_name, config["columns"])
+                elif dialect == "postgresql":
+                    _create_postgres_index(conn, table_name, config["columns"])
+                else:
+                    logger.warning(f"Full-text search not supported on {dialect}, using LIKE fallback")
+                    return
+        _fts_enabled = True
+        logger.info(f"Full-text search indexes ready ({dialect})")
+    except Exception as e:
+        _fts_enabled = False
+        logger.warning(f"Full-text search unavailable, using LIKE fallback: {str(e)}")
+
+
+def _create_sqlite_index(conn, table_name: str, columns: list[str]) -> None:
+    """Create an FTS5 table mirroring `columns` of `table_name`."""
+    fts_name = f"{table_name}_fts"
+    exists = conn.execute(
+        text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = :name"),
+        {"name": fts_name},
+    ).first()
+
+    cols = ", ".join(columns)
+    new_cols = ", ".join(f"new.{c}" for c in columns)
+    old_cols = ", ".join(f"old.{c}" for c in columns)
+
+    conn.execute(text(
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS {fts_name} USING fts5("
+        f"{cols}, content='{table_name}', content_rowid='rowid', "
+        f"tokenize='porter unicode61')"
+    ))
+    conn.execute(text(
+        f"CREATE TRIGGER IF NOT EXISTS {fts_name}_ai AFTER INSERT ON {table_name} BEGIN "
+        f"INSERT INTO {fts_name}(rowid, {cols}) VALUES (new.rowid, {new_cols}); END"
+    ))
+    conn.execute(text(
+        f"CREATE TRIGGER IF NOT EXISTS {fts_name}_ad AFTER DELETE ON {table_name} BEGIN "
+        f"INSERT INTO {fts_name}({fts_name}, rowid, {cols}) VALUES ('delete', old.rowid, {old_cols}); END"
+    ))
+    conn.execute(text(
+        f"CREATE TRIGGER IF NOT EXISTS {fts_name}_au AFTER UPDATE ON {table_name} BEGIN "
+        f"INSERT INTO {fts_name}({fts_name}, rowid, {cols}) VALUES ('delete', old.rowid, {old_cols}); "
+        f"INSERT INTO {fts_name}(rowid, {cols}) VALUES (new.rowid, {new_cols}); END"
+    ))
+
+    if not exists:
+        # Index rows that were inserted before the FTS table existed
+        conn.execute(text(f"INSERT INTO {fts_name}({fts_name}) VALUES ('rebuild')"))
+        logger.info(f"Built FTS5 index {fts_name}")
+
+
+def _create_postgres_index(conn, table_name: str, columns: list[str]) -> None:
+    """Add a weighted, generated tsvector column and GIN index to `table_name`."""
+    vector = " || ".join(
+        f"setweight(to_tsvector('english', coalesce({col}, '')), '{_PG_WEIGHTS[min(i, 3)]}')"
+        for i, col in enumerate(columns)
+    )
+    conn.execute(text(
+        f"ALTER TABLE {table_name} ADD COLUMN IF NOT EXISTS search_vector tsvector "
+        f"GENERATED ALWAYS AS ({vector}) STORED"
+    ))
+    conn.execute(text(
+        f"CREATE INDEX IF NOT EXISTS ix_{table_name}_search_vector "
+        f"ON {table_name} USING GIN (search_vector)"
+    ))
+
+
+def _fts5_query(query: str) -> Optional[str]:
+    """
+    Turn free text into a safe FTS5 MATCH expression.
+
+    Each word is quoted so punctuation can't inject FTS syntax, and
+    stopwords are dropped unless nothing else is left. Words are matched
+    after Porter stemming, so "icons" also finds "icon".
+    """
+    terms = re.findall(r"\w+", query.lower())
+    if not terms:
+        return None
+    terms = [term for term in terms if term not in _STOPWORDS] or terms
+    return " ".join(f'"{term}"' for term in terms)
+
+
+class SearchService:
+    """Service for ranked full-text search over articles and ideas."""
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def search_articles(
+        self,
+        query: str,
+        limit: int = 20,
+        offset: int = 0,
+    ) -> tuple[List[dict], int]:
+        """
+        Search article title, description and content.
+
+        Args:
+            query: Free-text search query
+            limit: Maximum number of articles to return
+            offset: Number of articles to skip
+
+        Returns:
+            Tuple of (article dicts matching NewsArticleResponse, total_count),
+            best matches first
+        """
+        return self._search(
+            NewsArticleDB, NEWS_ARTICLE_COLUMNS, news_article_to_dict, query, limit, offset
+        )
+
+    def search_ideas(
+        self,
+        query: str,
+        limit: int = 20,
+        offset: int = 0,
+    ) -> tuple[List[dict], int]:
+        """
+        Search idea title, concept and video prompt.
+
+        Args:
+            query: Free-text search query
+            limit: Maximum number of ideas to return
+            offset: Number of ideas to skip
+
+        Returns:
+            Tuple of (idea dicts matching VideoIdeaResponse, total_count),
+            best matches first
+        """
+        return self._search(
+            VideoIdeaDB, VIDEO_IDEA_COLUMNS, video_idea_to_dict, query, limit, offset
+        )
+
+    def _search(self, model, columns, mapper, query: str, limit: int, offset: int) -> tuple[List[dict], int]:
+        """Run a ranked search against the index for `model`'s table."""
+        table_name = model.__tablename__
+        config = SEARCH_INDEXES[table_name]
+        dialect = self.db.get_bind().dialect.name
+
+        if _fts_enabled and dialect == "sqlite":
+            return self._search_sqlite(table_name, config, columns, mapper, query, limit, offset)
+
+        if _fts_enabled and dialect == "postgresql":
+            tsquery = "websearch_to_tsquery('english', :query)"
+            base = (
+                self.db.query(*columns)
+                .filter(text(f"{table_name}.search_vector @@ {tsquery}"))
+                .params(query=query)
+            )
+            ranked = base.order_by(text(f"ts_rank({table_name}.search_vector, {tsquery}) DESC"))
+
+        else:
+            # No index available: substring scan, newest first
+            pattern = f"%{query}%"
+            base = self.db.query(*columns).filter(
+                or_(*(getattr(model, col).ilike(pattern) for col in config["columns"]))
+            )
+            ranked = base.order_by(desc(model.created_at))
+
+        total = base.count()
+        rows = ranked.limit(limit).offset(offset).all()
+
+        logger.debug("Search '%s' on %s: %s matches", query, table_name, total)
+        return [mapper(row) for row in rows], total
+
+    def _search_sqlite(self, table_name: str, config: dict, columns, mapper, query: str, limit: int, offset: int) -> tuple[List[dict], int]:
+        """
+        Rank matches inside the FTS5 table and join back only the page rows.
+
+        Counting and bm25() ranking run on the FTS table alone; the wide base
+        table is only read for the rows actually returned.
+        """
+        match = _fts5_query(query)
+        if match is None:
+            return [], 0
+
+        fts_name = f"{table_name}_fts"
+        total = self.db.execute(
+            text(f"SELECT count(*) FROM {fts_name} WHERE {fts_name} MATCH :match"),
+            {"match": match},
+        ).scalar()
+        if not total or offset >= total:
+            return [], total or 0
+
+        # For very broad queries, only rank the newest matches (rowid order)
+        rowid_filter = ""
+        params = {"match": match, "limit": limit, "offset": offset}
+        window = max(_RANK_WINDOW, offset + limit)
+        if total > window:
+            params["floor"] = self.db.execute(
+                text(
+                    f"SELECT rowid FROM {fts_name} WHERE {fts_name} MATCH :match "
+                    f"ORDER BY rowid DESC LIMIT 1 OFFSET :skip"
+                ),
+                {"match": match, "skip": window - 1},
+            ).scalar()
+            rowid_filter = " AND rowid >= :floor"
+
+        weights = ", ".join(str(w) for w in config["weights"])
+        matches = (
+            text(
+                f"SELECT rowid, bm25({fts_name}, {weights}) AS score FROM {fts_name} "
+                f"WHERE {fts_name} MATCH :match{rowid_filter} "
+                f"ORDER BY score LIMIT :limit OFFSET :offset"
+            )
+            .bindparams(**params)
+            .columns(column("rowid"), column("score"))
+            .subquery("matches")
+        )
+        rows = (
+            self.db.query(*columns)
+            .join(matches, matches.c.rowid == literal_column(f"{table_name}.rowid"))
+            .order_by(matches.c.score)
+            .all()
+        )
+
+        logger.debug("Search '%s' on %s: %s matches", query, table_name, total)
+        return [mapper(row) for row in rows], total
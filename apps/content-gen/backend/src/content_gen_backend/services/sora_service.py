@@ -1,16 +1,22 @@
 """Sora API service wrapper for video generation."""
 
 import asyncio
-from typing import Optional, List, Literal
+from typing import AsyncIterator, Optional, List, Literal
 from openai import AsyncOpenAI, OpenAIError
 from ..config import settings
 from ..models.video_response import VideoJob, ErrorDetail
 from ..utils.logging_setup import logger
+from ..utils.metrics import VIDEO_POLLS, track_upstream
+from ..utils.rate_limiter import rate_limited
+from ..utils.resilience import guard, time_left
+from .abstract_video_service import AbstractVideoService
 
 
-class SoraService:
+class SoraService(AbstractVideoService):
     """Service class for interacting with OpenAI's Sora API."""
 
+    supports_remix = True
+
     def __init__(self):
         """Initialize the Sora service with OpenAI client."""
         self.client = AsyncOpenAI(api_key=settings.openai_api_key)
@@ -32,7 +38,8 @@ class SoraService:
             model: Model to use (sora-2 or sora-2-pro)
             seconds: Duration in seconds
             size: Resolution as widthxheight
-            input_reference: Optional reference image bytes
+            input_reference: Optional reference image as JPEG bytes
+                (see ReferenceAssetService)
 
         Returns:
             VideoJob with initial status
@@ -53,11 +60,14 @@ class SoraService:
 
             # Add input reference if provided
             if input_reference:
-                params["input_reference"] = input_reference
+                params["input_reference"] = ("reference.jpg", input_reference, "image/jpeg")
                 logger.info("Input reference image included")
 
             # Call OpenAI API
-            video = await self.client.videos.create(**params)
+            with guard("sora"), track_upstream("sora", "create"):
+                video = await rate_limited(
+                    "sora", "create", lambda: self.client.videos.create(**params, timeout=time_left(60))
+                )
 
             logger.info(f"Video creation started: {video.id}, status: {video.status}")
 
@@ -85,11 +95,14 @@ class SoraService:
             OpenAIError: If API call fails
         """
         try:
-            logger.debug(f"Fetching status for video: {video_id}")
+            logger.debug("Fetching status for video: %s", video_id)
 
-            video = await self.client.videos.retrieve(video_id)
+            with guard("sora"), track_upstream("sora", "status"):
+                video = await rate_limited(
+                    "sora", "status", lambda: self.client.videos.retrieve(video_id, timeout=time_left(10))
+                )
 
-            logger.debug(f"Video {video_id} status: {video.status}, progress: {getattr(video, 'progress', 'N/A')}")
+            logger.debug("Video %s status: %s, progress: %s", video_id, video.status, getattr(video, "progress", "N/A"))
 
             return self._convert_to_video_job(video)
 
@@ -131,6 +144,7 @@ class SoraService:
                 logger.warning(f"Polling timeout reached for video {video_id} after {elapsed:.1f}s")
                 raise TimeoutError(f"Polling timeout after {timeout} seconds")
 
+            VIDEO_POLLS.inc(provider="sora")
             video = await self.get_video_status(video_id)
 
             if video.status in ["completed", "failed"]:
@@ -160,7 +174,14 @@ class SoraService:
         try:
             logger.info(f"Downloading {variant} for video {video_id}")
 
-            content = await self.client.videos.download_content(video_id, variant=variant)
+            with guard("sora"), track_upstream("sora", "download"):
+                content = await rate_limited(
+                    "sora",
+                    "download",
+                    lambda: self.client.videos.download_content(
+                        video_id, variant=variant, timeout=time_left(120)
+                    ),
+                )
 
             # Read the content
             if hasattr(content, "read"):
@@ -181,6 +202,38 @@ class SoraService:
             logger.error(f"Unexpected error downloading {variant} for {video_id}: {str(e)}", exc_info=True)
             raise
 
+    async def stream_video_content(
+        self, video_id: str, variant: Literal["video", "thumbnail", "spritesheet"] = "video"
+    ) -> AsyncIterator[bytes]:
+        """
+        Stream video content or supporting assets without buffering them.
+
+        Args:
+            video_id: The video job identifier
+            variant: Type of asset to download
+
+        Returns:
+            Async iterator of content chunks
+
+        Raises:
+            OpenAIError: If API call fails (raised while iterating)
+        """
+        logger.info(f"Streaming {variant} for video {video_id}")
+
+        async def open_stream():
+            manager = self.client.videos.with_streaming_response.download_content(
+                video_id, variant=variant, timeout=time_left(120)
+            )
+            return manager, await manager.__aenter__()
+
+        with guard("sora"), track_upstream("sora", "download"):
+            manager, response = await rate_limited("sora", "download", open_stream)
+            try:
+                async for chunk in response.iter_bytes():
+                    yield chunk
+            finally:
+                await manager.__aexit__(None, None, None)
+
     async def list_videos(
         self,
         limit: int = 20,
@@ -208,7 +261,10 @@ class SoraService:
             if after:
                 params["after"] = after
 
-            page = await self.client.videos.list(**params)
+            with guard("sora"), track_upstream("sora", "list"):
+                page = await rate_limited(
+                    "sora", "list", lambda: self.client.videos.list(**params, timeout=time_left(30))
+                )
 
             videos = [self._convert_to_video_job(v) for v in page.data]
             has_more = getattr(page, "has_more", False)
@@ -240,7 +296,10 @@ class SoraService:
         try:
             logger.info(f"Deleting video {video_id}")
 
-            result = await self.client.videos.delete(video_id)
+            with guard("sora"), track_upstream("sora", "delete"):
+                result = await rate_limited(
+                    "sora", "delete", lambda: self.client.videos.delete(video_id, timeout=time_left(30))
+                )
 
             logger.info(f"Video {video_id} deleted successfully")
 
@@ -270,7 +329,12 @@ class SoraService:
         try:
             logger.info(f"Creating remix of video {video_id} with prompt: '{prompt[:50]}...'")
 
-            video = await self.client.videos.remix(video_id=video_id, prompt=prompt)
+            with guard("sora"), track_upstream("sora", "remix"):
+                video = await rate_limited(
+                    "sora",
+                    "remix",
+                    lambda: self.client.videos.remix(video_id=video_id, prompt=prompt, timeout=time_left(60)),
+                )
 
             logger.info(f"Remix created: {video.id}, remixed from: {video_id}")
 
@@ -283,6 +347,18 @@ class SoraService:
             logger.error(f"Unexpected error remixing video {video_id}: {str(e)}", exc_info=True)
             raise
 
+    def get_supported_models(self) -> list[str]:
+        """Get list of models supported by Sora."""
+        return ["sora-2", "sora-2-pro"]
+
+    def get_service_name(self) -> str:
+        """Get the name of this video generation service."""
+        return "sora"
+
+    def get_content_variants(self) -> tuple[str, ...]:
+        """Sora serves a thumbnail and spritesheet alongside each video."""
+        return ("video", "thumbnail", "spritesheet")
+
     def _convert_to_video_job(self, video) -> VideoJob:
         """
         Convert OpenAI video object to our VideoJob model.
@@ -314,3 +390,15 @@ class SoraService:
             remixed_from_video_id=getattr(video, "remixed_from_video_id", None),
             error=error_detail,
         )
+
+
+# Singleton instance
+_sora_service: Optional[SoraService] = None
+
+
+def get_sora_service() -> SoraService:
+    """Get or create the Sora service singleton."""
+    global _sora_service
+    if _sora_service is None:
+        _sora_service = SoraService()
+    return _sora_service
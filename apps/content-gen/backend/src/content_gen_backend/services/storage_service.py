@@ -2,9 +2,11 @@
 
 import aiofiles
 from pathlib import Path
-from typing import Optional, Literal
+from typing import AsyncIterator, Optional, Literal
+from uuid import uuid4
 from ..config import settings
 from ..utils.logging_setup import logger
+from ..utils.metrics import STORAGE_CACHE_REQUESTS
 
 
 class StorageService:
@@ -36,21 +38,14 @@ class StorageService:
             Path to saved file
         """
         try:
-            # Determine file extension
-            extensions = {
-                "video": ".mp4",
-                "thumbnail": ".webp",
-                "spritesheet": ".jpg",
-            }
-            ext = extensions.get(variant, ".bin")
-
-            # Create filename
-            filename = f"{video_id}_{variant}{ext}"
-            filepath = self.storage_path / filename
-
-            # Save file
-            async with aiofiles.open(filepath, "wb") as f:
+            filepath = self._filepath(video_id, variant)
+
+            # Write to a unique temporary name first so readers never see a
+            # partial file and concurrent downloads of the same asset don't interleave
+            temp_path = filepath.with_suffix(f"{filepath.suffix}.{uuid4().hex[:8]}.tmp")
+            async with aiofiles.open(temp_path, "wb") as f:
                 await f.write(content)
+            temp_path.replace(filepath)
 
             logger.info(f"Saved {variant} to {filepath} ({len(content)} bytes)")
             return filepath
@@ -59,6 +54,40 @@ class StorageService:
             logger.error(f"Error saving {variant} for video {video_id}: {str(e)}", exc_info=True)
             raise
 
+    async def save_stream(
+        self,
+        video_id: str,
+        chunks: AsyncIterator[bytes],
+        variant: Literal["video", "thumbnail", "spritesheet"] = "video",
+    ) -> AsyncIterator[bytes]:
+        """
+        Pass content through while saving it to local storage.
+
+        The file is only put in place once the whole stream has been read;
+        a failed or abandoned stream leaves nothing behind.
+
+        Args:
+            video_id: Video identifier
+            chunks: Content being downloaded
+            variant: Type of asset (video, thumbnail, spritesheet)
+
+        Returns:
+            Async iterator of the same chunks
+        """
+        filepath = self._filepath(video_id, variant)
+        temp_path = filepath.with_suffix(f"{filepath.suffix}.{uuid4().hex[:8]}.tmp")
+        size = 0
+        try:
+            async with aiofiles.open(temp_path, "wb") as f:
+                async for chunk in chunks:
+                    await f.write(chunk)
+                    size += len(chunk)
+                    yield chunk
+            temp_path.replace(filepath)
+            logger.info(f"Saved {variant} to {filepath} ({size} bytes)")
+        finally:
+            temp_path.unlink(missing_ok=True)
+
     async def get_video_path(
         self, video_id: str, variant: Literal["video", "thumbnail", "spritesheet"] = "video"
     ) -> Optional[Path]:
@@ -72,21 +101,30 @@ class StorageService:
         Returns:
             Path if file exists, None otherwise
         """
+        filepath = self._filepath(video_id, variant)
+
+        if filepath.exists():
+            STORAGE_CACHE_REQUESTS.inc(variant=variant, result="hit")
+            logger.debug("Found existing file: %s", filepath)
+            return filepath
+
+        STORAGE_CACHE_REQUESTS.inc(variant=variant, result="miss")
+        logger.debug("File not found: %s", filepath)
+        return None
+
+    def has_video(self, video_id: str, variant: Literal["video", "thumbnail", "spritesheet"] = "video") -> bool:
+        """Whether an asset is stored locally (not counted as a cache lookup)."""
+        return self._filepath(video_id, variant).exists()
+
+    def _filepath(self, video_id: str, variant: str) -> Path:
+        """Local path of a video asset: <video_id>_<variant>.<ext>."""
         extensions = {
             "video": ".mp4",
             "thumbnail": ".webp",
             "spritesheet": ".jpg",
         }
         ext = extensions.get(variant, ".bin")
-        filename = f"{video_id}_{variant}{ext}"
-        filepath = self.storage_path / filename
-
-        if filepath.exists():
-            logger.debug(f"Found existing file: {filepath}")
-            return filepath
-
-        logger.debug(f"File not found: {filepath}")
-        return None
+        return self.storage_path / f"{video_id}_{variant}{ext}"
 
     async def delete_video_files(self, video_id: str) -> int:
         """
@@ -131,3 +169,15 @@ class StorageService:
             "spritesheet": "image/jpeg",
         }
         return content_types.get(variant, "application/octet-stream")
+
+
+# Singleton instance
+_storage_service: Optional[StorageService] = None
+
+
+def get_storage_service() -> StorageService:
+    """Get or create the storage service singleton."""
+    global _storage_service
+    if _storage_service is None:
+        _storage_service = StorageService()
+    return _storage_service
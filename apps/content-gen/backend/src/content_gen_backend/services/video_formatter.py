@@ -9,6 +9,7 @@ from PIL import Image
 
 from ..config import settings
 from ..models.publishing import Platform
+from ..utils.metrics import FFMPEG_QUEUE_DEPTH
 
 logger = logging.getLogger(__name__)
 
@@ -113,7 +114,8 @@ class VideoFormatterService:
                 video_path,
             ]
 
-            result = subprocess.run(cmd, capture_output=True, text=True, check=True)
+            with FFMPEG_QUEUE_DEPTH.track_inprogress():
+                result = subprocess.run(cmd, capture_output=True, text=True, check=True)
 
             import json
             info = json.loads(result.stdout)
@@ -225,12 +227,13 @@ class VideoFormatterService:
         logger.info(f"Running ffmpeg: {' '.join(cmd)}")
 
         try:
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                check=True,
-            )
+            with FFMPEG_QUEUE_DEPTH.track_inprogress():
+                result = subprocess.run(
+                    cmd,
+                    capture_output=True,
+                    text=True,
+                    check=True,
+                )
             logger.info("Video conversion completed successfully")
 
         except subprocess.CalledProcessError as e:
@@ -274,7 +277,8 @@ class VideoFormatterService:
         ]
 
         try:
-            subprocess.run(cmd, capture_output=True, check=True)
+            with FFMPEG_QUEUE_DEPTH.track_inprogress():
+                subprocess.run(cmd, capture_output=True, check=True)
             logger.info(f"Thumbnail created: {output_path}")
             return str(output_path)
 
@@ -0,0 +1,208 @@
+"""Local job table backing the merged video listing."""
+
+import asyncio
+from typing import Callable, Literal, Optional
+
+from sqlalchemy import and_, or_
+from sqlalchemy.orm import Session
+
+from ..database import get_sessionmaker
+from ..models.video_job import VideoJobDB
+from ..models.video_response import ErrorDetail, VideoJob
+from ..utils.logging_setup import logger
+
+Provider = Literal["sora", "kie_veo", "kie_wan"]
+
+
+def job_provider(video: VideoJob) -> Provider:
+    """Provider that owns a job, from its ID and model."""
+    if video.id.startswith("video_"):
+        return "sora"
+    if video.model.startswith("kie-wan") or video.model == "wan-2.5":
+        return "kie_wan"
+    return "kie_veo"
+
+
+def _unix_seconds(value: Optional[int]) -> Optional[int]:
+    """Kie reports some timestamps in milliseconds; store seconds."""
+    if value and value > 10**11:
+        return value // 1000
+    return value
+
+
+def _to_video_job(row: VideoJobDB) -> VideoJob:
+    error = None
+    if row.error_message:
+        error = ErrorDetail(message=row.error_message, type=row.error_type or "unknown")
+    return VideoJob(
+        id=row.id,
+        status=row.status,
+        model=row.model,
+        progress=row.progress,
+        created_at=row.created_at,
+        completed_at=row.completed_at,
+        expires_at=row.expires_at,
+        size=row.size,
+        seconds=row.seconds,
+        remixed_from_video_id=row.remixed_from_video_id,
+        video_url=row.video_url,
+        error=error,
+    )
+
+
+class VideoJobStore:
+    """
+    Every video job this API has created or seen, whichever provider runs it.
+
+    Jobs are recorded when created and updated whenever their status is
+    fetched, so listing needs no provider calls and a job's provider is
+    known without probing each one. Database work runs in a worker thread
+    so status polls don't block the event loop.
+    """
+
+    def __init__(self, session_factory: Optional[Callable[[], Session]] = None):
+        """
+        Initialize the job store.
+
+        Args:
+            session_factory: Creates database sessions, one per operation
+                (default: the application's sessionmaker)
+        """
+        self.session_factory = session_factory or get_sessionmaker()
+
+    async def record(self, video: VideoJob, prompt: Optional[str] = None) -> None:
+        """
+        Insert or update a job from its latest status.
+
+        The first creation time and prompt seen are kept. Failures are
+        logged, not raised: the job table must never fail a request.
+
+        Args:
+            video: Latest job status
+            prompt: Prompt the job was created with, if known
+        """
+        await asyncio.to_thread(self._record, video, prompt)
+
+    def _record(self, video: VideoJob, prompt: Optional[str]) -> None:
+        try:
+            with self.session_factory() as db:
+                row = db.get(VideoJobDB, video.id)
+                if row is None:
+                    row = VideoJobDB(
+                        id=video.id,
+                        provider=job_provider(video),
+                        created_at=_unix_seconds(video.created_at),
+                        prompt=prompt,
+                    )
+                    db.add(row)
+                elif row.prompt is None:
+                    row.prompt = prompt
+
+                row.model = video.model
+                row.status = video.status
+                row.progress = video.progress
+                row.size = video.size
+                row.seconds = video.seconds
+                row.completed_at = _unix_seconds(video.completed_at)
+                row.expires_at = video.expires_at
+                row.video_url = video.video_url or row.video_url
+                row.remixed_from_video_id = video.remixed_from_video_id
+                row.error_message = video.error.message if video.error else None
+                row.error_type = video.error.type if video.error else None
+                db.commit()
+        except Exception as e:
+            logger.warning(f"Failed to record video job {video.id}: {str(e)}")
+
+    async def get_provider(self, video_id: str) -> Optional[Provider]:
+        """Provider of a recorded job, or None if unknown."""
+        return await asyncio.to_thread(self._get_provider, video_id)
+
+    def _get_provider(self, video_id: str) -> Optional[Provider]:
+        with self.session_factory() as db:
+            return db.query(VideoJobDB.provider).filter(VideoJobDB.id == video_id).scalar()
+
+    async def list(
+        self,
+        limit: int = 20,
+        after: Optional[str] = None,
+        order: Literal["asc", "desc"] = "desc",
+        provider: Optional[Provider] = None,
+        status: Optional[str] = None,
+    ) -> tuple[list[VideoJob], bool]:
+        """
+        List jobs across providers, newest first by default.
+
+        Args:
+            limit: Maximum number of results
+            after: Cursor: ID of the last job of the previous page
+            order: Sort order by creation time
+            provider: Only jobs on this provider
+            status: Only jobs with this status
+
+        Returns:
+            Tuple of (list of VideoJobs, has_more flag)
+        """
+        return await asyncio.to_thread(self._list, limit, after, order, provider, status)
+
+    def _list(
+        self,
+        limit: int,
+        after: Optional[str],
+        order: Literal["asc", "desc"],
+        provider: Optional[Provider],
+        status: Optional[str],
+    ) -> "tuple[list[VideoJob], bool]":  # Quoted: `list` here is the method above
+        with self.session_factory() as db:
+            query = db.query(VideoJobDB)
+            if provider:
+                query = query.filter(VideoJobDB.provider == provider)
+            if status:
+                query = query.filter(VideoJobDB.status == status)
+
+            if after:
+                cursor = db.query(VideoJobDB.created_at).filter(VideoJobDB.id == after).scalar()
+                if cursor is not None:
+                    if order == "desc":
+                        query = query.filter(
+                            or_(
+                                VideoJobDB.created_at < cursor,
+                                and_(VideoJobDB.created_at == cursor, VideoJobDB.id < after),
+                            )
+                        )
+                    else:
+                        query = query.filter(
+                            or_(
+                                VideoJobDB.created_at > cursor,
+                                and_(VideoJobDB.created_at == cursor, VideoJobDB.id > after),
+                            )
+                        )
+
+            if order == "desc":
+                query = query.order_by(VideoJobDB.created_at.desc(), VideoJobDB.id.desc())
+            else:
+                query = query.order_by(VideoJobDB.created_at.asc(), VideoJobDB.id.asc())
+
+            rows = query.limit(limit + 1).all()
+            return [_to_video_job(row) for row in rows[:limit]], len(rows) > limit
+
+    async def delete(self, video_id: str) -> bool:
+        """Forget a job; True if it was recorded."""
+        return await asyncio.to_thread(self._delete, video_id)
+
+    def _delete(self, video_id: str) -> bool:
+        with self.session_factory() as db:
+            deleted = db.query(VideoJobDB).filter(VideoJobDB.id == video_id).delete()
+            db.commit()
+            return deleted > 0
+
+
+# Singleton instance
+_video_job_store: Optional[VideoJobStore] = None
+
+
+def get_video_job_store() -> VideoJobStore:
+    """Get or create the video job store singleton."""
+    global _video_job_store
+    if _video_job_store is None:
+        _video_job_store = VideoJobStore()
+    return _video_job_store
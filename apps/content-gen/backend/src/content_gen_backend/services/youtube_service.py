@@ -3,18 +3,19 @@
 import logging
 import os
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 import httpx
-from google.auth.transport.requests import Request
-from google.oauth2.credentials import Credentials
-from google_auth_oauthlib.flow import InstalledAppFlow
-from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
-from googleapiclient.http import MediaFileUpload
 
 from ..config import settings
 from ..models.publishing import YouTubeMetadata, VideoPrivacy
+from ..utils.metrics import track_upstream
+
+# The Google auth and discovery clients are slow to import, so they are
+# imported where used
+if TYPE_CHECKING:
+    from google.oauth2.credentials import Credentials
 
 logger = logging.getLogger(__name__)
 
@@ -30,7 +31,7 @@ class YouTubeService:
 
     def __init__(self):
         """Initialize the YouTube service."""
-        self.credentials: Optional[Credentials] = None
+        self.credentials: Optional["Credentials"] = None
         self.youtube = None
 
     def _sanitize_tags(self, tags: list[str]) -> list[str]:
@@ -100,6 +101,11 @@ class YouTubeService:
         Returns:
             True if authentication successful
         """
+        from google.auth.transport.requests import Request
+        from google.oauth2.credentials import Credentials
+        from google_auth_oauthlib.flow import InstalledAppFlow
+        from googleapiclient.discovery import build
+
         creds_file = Path(settings.youtube_credentials_file)
         token_file = creds_file.parent / "youtube_token.json"
 
@@ -178,6 +184,8 @@ class YouTubeService:
             },
         }
 
+        from googleapiclient.http import MediaFileUpload
+
         # Create media upload
         media = MediaFileUpload(
             video_path,
@@ -196,12 +204,13 @@ class YouTubeService:
                 media_body=media,
             )
 
-            response = None
-            while response is None:
-                status, response = request.next_chunk()
-                if status:
-                    progress = int(status.progress() * 100)
-                    logger.info(f"Upload progress: {progress}%")
+            with track_upstream("youtube", "upload"):
+                response = None
+                while response is None:
+                    status, response = request.next_chunk()
+                    if status:
+                        progress = int(status.progress() * 100)
+                        logger.info(f"Upload progress: {progress}%")
 
             video_id = response["id"]
             video_url = f"https://www.youtube.com/watch?v={video_id}"
@@ -259,10 +268,11 @@ class YouTubeService:
         }
 
         try:
-            response = self.youtube.videos().update(
-                part="snippet,status",
-                body=body,
-            ).execute()
+            with track_upstream("youtube", "update"):
+                response = self.youtube.videos().update(
+                    part="snippet,status",
+                    body=body,
+                ).execute()
 
             logger.info(f"Video {video_id} updated successfully")
             return response
@@ -285,7 +295,8 @@ class YouTubeService:
             await self.authenticate()
 
         try:
-            self.youtube.videos().delete(id=video_id).execute()
+            with track_upstream("youtube", "delete"):
+                self.youtube.videos().delete(id=video_id).execute()
             logger.info(f"Video {video_id} deleted successfully")
             return True
 
@@ -307,10 +318,11 @@ class YouTubeService:
             await self.authenticate()
 
         try:
-            response = self.youtube.videos().list(
-                part="statistics,snippet,status",
-                id=video_id,
-            ).execute()
+            with track_upstream("youtube", "stats"):
+                response = self.youtube.videos().list(
+                    part="statistics,snippet,status",
+                    id=video_id,
+                ).execute()
 
             if not response.get("items"):
                 raise ValueError(f"Video {video_id} not found")
@@ -335,18 +347,19 @@ class YouTubeService:
         """Add video to specified playlists."""
         for playlist_id in playlist_ids:
             try:
-                self.youtube.playlistItems().insert(
-                    part="snippet",
-                    body={
-                        "snippet": {
-                            "playlistId": playlist_id,
-                            "resourceId": {
-                                "kind": "youtube#video",
-                                "videoId": video_id,
-                            },
-                        }
-                    },
-                ).execute()
+                with track_upstream("youtube", "playlist_insert"):
+                    self.youtube.playlistItems().insert(
+                        part="snippet",
+                        body={
+                            "snippet": {
+                                "playlistId": playlist_id,
+                                "resourceId": {
+                                    "kind": "youtube#video",
+                                    "videoId": video_id,
+                                },
+                            }
+                        },
+                    ).execute()
                 logger.info(f"Video {video_id} added to playlist {playlist_id}")
             except HttpError as e:
                 logger.error(f"Failed to add video to playlist {playlist_id}: {e}")
@@ -362,10 +375,11 @@ class YouTubeService:
             await self.authenticate()
 
         try:
-            response = self.youtube.channels().list(
-                part="snippet,contentDetails,statistics",
-                mine=True,
-            ).execute()
+            with track_upstream("youtube", "list_channels"):
+                response = self.youtube.channels().list(
+                    part="snippet,contentDetails,statistics",
+                    mine=True,
+                ).execute()
 
             channels = []
             for item in response.get("items", []):
@@ -405,12 +419,15 @@ class YouTubeService:
             raise FileNotFoundError(f"Thumbnail not found: {thumbnail_path}")
 
         try:
+            from googleapiclient.http import MediaFileUpload
+
             media = MediaFileUpload(thumbnail_path, mimetype="image/jpeg", resumable=False)
 
-            self.youtube.thumbnails().set(
-                videoId=video_id,
-                media_body=media,
-            ).execute()
+            with track_upstream("youtube", "thumbnail"):
+                self.youtube.thumbnails().set(
+                    videoId=video_id,
+                    media_body=media,
+                ).execute()
 
             logger.info(f"Thumbnail uploaded for video {video_id}")
             return True
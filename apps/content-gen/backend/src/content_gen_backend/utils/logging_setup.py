@@ -1,23 +1,129 @@
-"""Logging configuration with hourly log rotation."""
+"""Logging configuration with hourly log rotation.
 
+Handlers are attached by `configure_logging()`, which the application calls
+when it is created. Records are handed to a queue on the calling thread and
+written to the log file and console by a background listener thread, so
+logging in hot paths (status polls, downloads) never blocks the event loop
+on I/O.
+
+Environment variables:
+    LOG_LEVEL: Minimum level to record (default: INFO)
+    LOG_FORMAT: "text" (default) or "json" for one JSON object per line
+    LOG_DEBUG_SAMPLE_RATE: Keep 1 in N DEBUG records per call site (default: 1)
+"""
+
+import atexit
+import json
 import logging
+import os
+import queue
 import sys
+from collections import defaultdict
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener, TimedRotatingFileHandler
 from pathlib import Path
-from logging.handlers import TimedRotatingFileHandler
-from datetime import datetime
+from typing import Optional
+
+# Attributes every LogRecord has; anything else was passed via `extra=`
+_RECORD_ATTRS = frozenset(vars(logging.makeLogRecord({}))) | {"message", "asctime"}
+
+_listener: Optional[QueueListener] = None
+
 
+class JsonFormatter(logging.Formatter):
+    """Format records as single-line JSON objects (JSON Lines)."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "timestamp": datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "function": record.funcName,
+            "line": record.lineno,
+            "message": record.getMessage(),
+        }
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            entry["exception"] = record.exc_text
+        for key, value in vars(record).items():
+            if key not in _RECORD_ATTRS and not key.startswith("_"):
+                entry[key] = value
+        return json.dumps(entry, default=str, ensure_ascii=False)
+
+
+class DebugSampleFilter(logging.Filter):
+    """
+    Keep only every Nth DEBUG record from each call site.
 
-def setup_logging(log_dir: str = "./logs", log_level: int = logging.INFO) -> logging.Logger:
+    High-frequency debug lines (e.g. one per status poll) are thinned out
+    while rare ones still appear. INFO and above always pass.
+    """
+
+    def __init__(self, rate: int):
+        super().__init__()
+        self.rate = max(1, rate)
+        self._counts: dict[tuple[str, int], int] = defaultdict(int)
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno > logging.DEBUG or self.rate == 1:
+            return True
+        key = (record.pathname, record.lineno)
+        count = self._counts[key]
+        self._counts[key] = count + 1
+        return count % self.rate == 0
+
+
+class _DeferredQueueHandler(QueueHandler):
+    """
+    QueueHandler that leaves formatting to the listener's handlers.
+
+    The stock handler formats each record on the calling thread; this one
+    only merges the message arguments and renders tracebacks, which must
+    happen before the record leaves the thread. The record is updated in
+    place rather than copied; the result formats identically.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+
+def _stop_listener() -> None:
+    """Flush queued records and stop the listener thread."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+atexit.register(_stop_listener)
+
+
+def setup_logging(
+    log_dir: str = "./logs",
+    log_level: int = logging.INFO,
+    json_format: bool = False,
+    debug_sample_rate: int = 1,
+) -> logging.Logger:
     """
     Set up logging with hourly rotation and console output.
 
     Args:
         log_dir: Directory to store log files
         log_level: Logging level (default: INFO)
+        json_format: Write JSON Lines instead of plain text
+        debug_sample_rate: Keep 1 in N DEBUG records per call site
 
     Returns:
         Configured logger instance
     """
+    global _listener
+
     # Create logs directory if it doesn't exist
     log_path = Path(log_dir)
     log_path.mkdir(parents=True, exist_ok=True)
@@ -27,13 +133,17 @@ def setup_logging(log_dir: str = "./logs", log_level: int = logging.INFO) -> log
     logger.setLevel(log_level)
 
     # Remove existing handlers to avoid duplicates
+    _stop_listener()
     logger.handlers.clear()
 
     # Format for log messages
-    formatter = logging.Formatter(
-        "%(asctime)s - %(name)s - %(levelname)s - %(funcName)s:%(lineno)d - %(message)s",
-        datefmt="%Y-%m-%d %H:%M:%S",
-    )
+    if json_format:
+        formatter = JsonFormatter()
+    else:
+        formatter = logging.Formatter(
+            "%(asctime)s - %(name)s - %(levelname)s - %(funcName)s:%(lineno)d - %(message)s",
+            datefmt="%Y-%m-%d %H:%M:%S",
+        )
 
     # File handler with hourly rotation
     log_file = log_path / f"sora_api_{datetime.now().strftime('%Y%m%d')}.log"
@@ -53,9 +163,15 @@ def setup_logging(log_dir: str = "./logs", log_level: int = logging.INFO) -> log
     console_handler.setLevel(log_level)
     console_handler.setFormatter(formatter)
 
-    # Add handlers
-    logger.addHandler(file_handler)
-    logger.addHandler(console_handler)
+    # File and console I/O happen on the listener thread
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    queue_handler = _DeferredQueueHandler(log_queue)
+    queue_handler.setLevel(log_level)
+    queue_handler.addFilter(DebugSampleFilter(debug_sample_rate))
+    logger.addHandler(queue_handler)
+
+    _listener = QueueListener(log_queue, file_handler, console_handler, respect_handler_level=True)
+    _listener.start()
 
     logger.info("Logging initialized")
     logger.info(f"Log files will be stored in: {log_path.absolute()}")
@@ -63,5 +179,19 @@ def setup_logging(log_dir: str = "./logs", log_level: int = logging.INFO) -> log
     return logger
 
 
-# Global logger instance
-logger = setup_logging()
+def configure_logging() -> logging.Logger:
+    """
+    Set up logging from the LOG_* environment variables.
+
+    Called once by the application entrypoint; importing this module on its
+    own creates no files or threads.
+    """
+    return setup_logging(
+        log_level=logging.getLevelName(os.getenv("LOG_LEVEL", "INFO").upper()),
+        json_format=os.getenv("LOG_FORMAT", "text").lower() == "json",
+        debug_sample_rate=int(os.getenv("LOG_DEBUG_SAMPLE_RATE", "1")),
+    )
+
+
+# Global logger instance; handlers are attached by configure_logging()
+logger = logging.getLogger("content_gen_backend")
@@ -0,0 +1,366 @@
+"""In-process metrics exposed in the Prometheus text format.
+
+A small dependency-free registry of counters, gauges and histograms. Values
+are kept in memory per process and rendered on demand by `/metrics`.
+
+Example:
+    with track_upstream("sora", "status"):
+        video = await client.videos.retrieve(video_id)
+"""
+
+import asyncio
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from typing import Callable, Iterator, Optional
+
+from .logging_setup import logger
+
+# Request latencies are mostly milliseconds; upstream calls can take a minute
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+UPSTREAM_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+_registry: list["_Metric"] = []
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(names: tuple[str, ...], values: tuple[str, ...], extra: str = "") -> str:
+    """Render a `{name="value",...}` label set."""
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class _Metric:
+    """Base class: a named metric with a fixed set of label names."""
+
+    type_name = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: tuple[str, ...] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+        _registry.append(self)
+
+    def _key(self, labels: dict) -> tuple[str, ...]:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}, got {tuple(labels)}")
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def _samples(self) -> Iterator[str]:
+        raise NotImplementedError
+
+    def render(self) -> str:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.type_name}"]
+        lines.extend(self._samples())
+        return "\n".join(lines)
+
+
+class Counter(_Metric):
+    """Monotonically increasing count."""
+
+    type_name = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: tuple[str, ...] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: dict[tuple[str, ...], float] = {}
+
+    def inc(self, amount: float = 1.0, **labels) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def get(self, **labels) -> float:
+        return self._values.get(self._key(labels), 0.0)
+
+    def _samples(self) -> Iterator[str]:
+        with self._lock:
+            items = list(self._values.items()) or ([((), 0.0)] if not self.labelnames else [])
+        for key, value in items:
+            yield f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}"
+
+
+class Gauge(_Metric):
+    """Value that can go up and down, or be read from a callback."""
+
+    type_name = "gauge"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: tuple[str, ...] = (),
+        function: Optional[Callable[[], float]] = None,
+    ):
+        super().__init__(name, documentation, labelnames)
+        self._values: dict[tuple[str, ...], float] = {}
+        self._function = function
+
+    def set(self, value: float, **labels) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+    def inc(self, amount: float = 1.0, **labels) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def dec(self, amount: float = 1.0, **labels) -> None:
+        self.inc(-amount, **labels)
+
+    def get(self, **labels) -> float:
+        if self._function is not None:
+            return self._function()
+        return self._values.get(self._key(labels), 0.0)
+
+    @contextmanager
+    def track_inprogress(self, **labels) -> Iterator[None]:
+        """Increment while the block runs."""
+        self.inc(**labels)
+        try:
+            yield
+        finally:
+            self.dec(**labels)
+
+    def _samples(self) -> Iterator[str]:
+        if self._function is not None:
+            yield f"{self.name} {_format_value(self._function())}"
+            return
+        with self._lock:
+            items = list(self._values.items()) or ([((), 0.0)] if not self.labelnames else [])
+        for key, value in items:
+            yield f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}"
+
+
+class Histogram(_Metric):
+    """Distribution of observations in cumulative buckets."""
+
+    type_name = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # Per label set: [count per bucket (+Inf last)], sum
+        self._values: dict[tuple[str, ...], tuple[list[int], list[float]]] = {}
+
+    def observe(self, value: float, **labels) -> None:
+        key = self._key(labels)
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            entry = self._values.get(key)
+            if entry is None:
+                entry = self._values[key] = ([0] * (len(self.buckets) + 1), [0.0])
+            entry[0][index] += 1
+            entry[1][0] += value
+
+    @contextmanager
+    def time(self, **labels) -> Iterator[None]:
+        """Observe the duration of the block in seconds."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, **labels)
+
+    def _samples(self) -> Iterator[str]:
+        with self._lock:
+            items = [(key, (list(counts), total[0])) for key, (counts, total) in self._values.items()]
+        for key, (counts, total) in items:
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += count
+                le = f'le="{_format_value(bound)}"'
+                yield f"{self.name}_bucket{_format_labels(self.labelnames, key, le)} {cumulative}"
+            labels = _format_labels(self.labelnames, key)
+            yield f"{self.name}_sum{labels} {_format_value(total)}"
+            yield f"{self.name}_count{labels} {cumulative}"
+
+
+def render() -> str:
+    """Render every registered metric in the Prometheus text format."""
+    return "\n".join(metric.render() for metric in _registry) + "\n"
+
+
+# ============ Application metrics ============
+
+HTTP_REQUEST_DURATION = Histogram(
+    "content_gen_http_request_duration_seconds",
+    "HTTP request latency by route template",
+    ("method", "route", "status"),
+)
+
+UPSTREAM_REQUEST_DURATION = Histogram(
+    "content_gen_upstream_request_duration_seconds",
+    "Latency of calls to external providers",
+    ("provider", "operation"),
+    buckets=UPSTREAM_BUCKETS,
+)
+
+UPSTREAM_ERRORS = Counter(
+    "content_gen_upstream_errors_total",
+    "Failed calls to external providers",
+    ("provider", "operation"),
+)
+
+CIRCUIT_STATE = Gauge(
+    "content_gen_circuit_state",
+    "Provider circuit breaker state (0 closed, 1 half-open, 2 open)",
+    ("provider",),
+)
+
+CIRCUIT_REJECTIONS = Counter(
+    "content_gen_circuit_rejections_total",
+    "Calls failed fast because the provider's circuit was open",
+    ("provider",),
+)
+
+RATE_LIMIT_WAIT = Histogram(
+    "content_gen_rate_limit_wait_seconds",
+    "Time calls waited for a provider rate limit token",
+    ("provider", "operation"),
+    buckets=(0.0, 0.1, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0),
+)
+
+UPSTREAM_THROTTLED = Counter(
+    "content_gen_upstream_throttled_total",
+    "429 responses from providers (each pauses the provider's bucket)",
+    ("provider", "operation"),
+)
+
+VIDEO_POLLS = Counter(
+    "content_gen_video_polls_total",
+    "Status checks made while polling video jobs",
+    ("provider",),
+)
+
+STORAGE_CACHE_REQUESTS = Counter(
+    "content_gen_storage_cache_requests_total",
+    "Local video storage lookups; hit ratio = hit / (hit + miss)",
+    ("variant", "result"),
+)
+
+PREFETCH_DOWNLOADS = Counter(
+    "content_gen_prefetch_downloads_total",
+    "Assets of completed jobs fetched into local storage in the background",
+    ("variant", "result"),
+)
+
+PREFETCH_QUEUE_DEPTH = Gauge(
+    "content_gen_prefetch_queue_depth",
+    "Assets waiting to be prefetched",
+)
+
+FFMPEG_QUEUE_DEPTH = Gauge(
+    "content_gen_ffmpeg_queue_depth",
+    "ffmpeg/ffprobe jobs currently queued or running",
+)
+
+EVENT_LOOP_LAG = Gauge(
+    "content_gen_event_loop_lag_seconds",
+    "Most recent event loop scheduling delay",
+)
+
+EVENT_LOOP_LAG_HISTOGRAM = Histogram(
+    "content_gen_event_loop_lag_distribution_seconds",
+    "Event loop scheduling delay",
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0),
+)
+
+
+@contextmanager
+def track_upstream(provider: str, operation: str) -> Iterator[None]:
+    """
+    Time a call to an external provider and count it if it raises.
+
+    Args:
+        provider: Provider name (sora, kie_veo, kie_wan, anthropic, youtube, newsapi)
+        operation: Short name of the call (create, status, download, ...)
+    """
+    start = time.perf_counter()
+    try:
+        yield
+    except Exception:
+        UPSTREAM_ERRORS.inc(provider=provider, operation=operation)
+        raise
+    finally:
+        UPSTREAM_REQUEST_DURATION.observe(
+            time.perf_counter() - start, provider=provider, operation=operation
+        )
+
+
+async def monitor_event_loop_lag(interval: float = 0.5) -> None:
+    """
+    Measure how late the event loop wakes a sleeping task, forever.
+
+    Lag well above zero means something is blocking the loop (sync I/O,
+    CPU-heavy work, subprocess calls).
+    """
+    loop = asyncio.get_running_loop()
+    while True:
+        start = loop.time()
+        await asyncio.sleep(interval)
+        lag = max(0.0, loop.time() - start - interval)
+        EVENT_LOOP_LAG.set(lag)
+        EVENT_LOOP_LAG_HISTOGRAM.observe(lag)
+        if lag > 1.0:
+            logger.warning("Event loop lagged %.2fs", lag)
+
+
+class MetricsMiddleware:
+    """
+    ASGI middleware recording request latency per route template.
+
+    Routes are labelled by their path template (e.g. /api/v1/videos/{video_id})
+    so label cardinality stays bounded; unmatched paths share one label.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status = 500
+        start = time.perf_counter()
+
+        async def send_wrapper(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            route = scope.get("route")
+            HTTP_REQUEST_DURATION.observe(
+                time.perf_counter() - start,
+                method=scope["method"],
+                route=getattr(route, "path", "unmatched"),
+                status=status,
+            )
@@ -0,0 +1,233 @@
+"""Token-bucket rate limits for upstream provider calls.
+
+Buckets are configured per provider or per provider operation in
+`rate_limits_per_minute` (e.g. "kie_veo" or "kie_veo:create"). Callers wait
+for a token instead of being rejected, and a 429 response pauses the bucket
+for the provider's Retry-After before the call is queued again.
+
+The local backend keeps buckets in process memory; the Redis backend
+(`RATE_LIMIT_BACKEND=redis`, needs the `redis` extra) shares them across
+workers.
+
+Example:
+    response = await rate_limited(
+        "kie_veo", "status", lambda: loop.run_in_executor(None, fetch)
+    )
+"""
+
+import asyncio
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Awaitable, Callable, Optional, TypeVar, Union
+
+from ..config import settings
+from .logging_setup import logger
+from .metrics import RATE_LIMIT_WAIT, UPSTREAM_THROTTLED
+from .resilience import DeadlineExceeded, time_left
+
+T = TypeVar("T")
+
+
+class LocalTokenBucket:
+    """
+    In-process token bucket.
+
+    Tokens may go negative: each caller reserves one and waits until the
+    bucket refills to cover it, so waiters are served in arrival order.
+    """
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate  # tokens per second
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()  # may be in the future while paused
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        if now > self._updated:
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+
+    async def reserve(self, cost: float = 1.0) -> float:
+        """Take `cost` tokens; return seconds to wait before using them."""
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self._tokens -= cost
+            return max(0.0, self._updated - now) + max(0.0, -self._tokens) / self.rate
+
+    async def pause(self, seconds: float) -> None:
+        """Hand out no tokens for `seconds` (e.g. after a 429)."""
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self._tokens = min(self._tokens, 0.0)
+            self._updated = max(self._updated, now + seconds)
+
+
+# Same algorithm as LocalTokenBucket, run atomically on the Redis server
+# clock. KEYS[1]: bucket hash; ARGV: rate, capacity, cost, pause seconds.
+_REDIS_SCRIPT = """
+local time = redis.call('TIME')
+local now = tonumber(time[1]) + tonumber(time[2]) / 1000000
+local rate = tonumber(ARGV[1])
+local capacity = tonumber(ARGV[2])
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'updated')
+local tokens = tonumber(state[1]) or capacity
+local updated = tonumber(state[2]) or now
+if now > updated then
+    tokens = math.min(capacity, tokens + (now - updated) * rate)
+    updated = now
+end
+local wait = 0
+local pause = tonumber(ARGV[4])
+if pause > 0 then
+    tokens = math.min(tokens, 0)
+    updated = math.max(updated, now + pause)
+else
+    tokens = tokens - tonumber(ARGV[3])
+    wait = math.max(0, updated - now) + math.max(0, -tokens) / rate
+end
+redis.call('HSET', KEYS[1], 'tokens', tokens, 'updated', updated)
+redis.call('EXPIRE', KEYS[1], math.ceil(math.max(0, updated - now) + capacity / rate) + 60)
+return tostring(wait)
+"""
+
+
+class RedisTokenBucket:
+    """Token bucket shared by every worker through Redis."""
+
+    _client = None
+
+    def __init__(self, name: str, rate: float, capacity: float):
+        self.key = f"content_gen:rate_limit:{name}"
+        self.rate = rate
+        self.capacity = capacity
+
+    @classmethod
+    def _get_client(cls):
+        if cls._client is None:
+            try:
+                import redis.asyncio as redis
+            except ImportError as e:
+                raise ImportError(
+                    "RATE_LIMIT_BACKEND=redis requires the redis package "
+                    "(pip install 'content-gen-backend[redis]')"
+                ) from e
+            cls._client = redis.from_url(settings.redis_url)
+        return cls._client
+
+    async def _run(self, cost: float, pause: float) -> float:
+        client = self._get_client()
+        result = await client.eval(_REDIS_SCRIPT, 1, self.key, self.rate, self.capacity, cost, pause)
+        return float(result)
+
+    async def reserve(self, cost: float = 1.0) -> float:
+        """Take `cost` tokens; return seconds to wait before using them."""
+        return await self._run(cost, 0.0)
+
+    async def pause(self, seconds: float) -> None:
+        """Hand out no tokens for `seconds` (e.g. after a 429)."""
+        await self._run(0.0, seconds)
+
+
+_buckets: dict[str, Union[LocalTokenBucket, RedisTokenBucket]] = {}
+
+
+def get_bucket(provider: str, operation: str) -> Optional[Union[LocalTokenBucket, RedisTokenBucket]]:
+    """
+    Get or create the bucket limiting `provider`'s `operation`.
+
+    "provider:operation" settings take precedence over "provider".
+
+    Returns:
+        The bucket, or None if the call is not rate limited
+    """
+    for name in (f"{provider}:{operation}", provider):
+        if name in _buckets:
+            return _buckets[name]
+        per_minute = settings.rate_limits_per_minute.get(name)
+        if per_minute is None:
+            continue
+        rate = per_minute / 60.0
+        capacity = max(1.0, float(settings.rate_limit_burst))
+        if settings.rate_limit_backend == "redis":
+            bucket = RedisTokenBucket(name, rate, capacity)
+        else:
+            bucket = LocalTokenBucket(rate, capacity)
+        _buckets[name] = bucket
+        return bucket
+    return None
+
+
+def _retry_after(result) -> Optional[float]:
+    """
+    Seconds to back off if `result` (a response or exception) is a 429.
+
+    Returns:
+        Retry-After in seconds (1 if missing or unparseable), or None if not a 429
+    """
+    response = getattr(result, "response", None) if isinstance(result, Exception) else result
+    status = getattr(result, "status_code", None) or getattr(response, "status_code", None)
+    if status != 429:
+        return None
+    value = (getattr(response, "headers", None) or {}).get("retry-after")
+    if value is None:
+        return 1.0
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return 1.0
+
+
+async def _wait_for_token(bucket, provider: str, operation: str) -> None:
+    wait = await bucket.reserve()
+    RATE_LIMIT_WAIT.observe(wait, provider=provider, operation=operation)
+    if wait > 0:
+        # Fail now rather than sleep past the request deadline
+        if time_left(wait) < wait:
+            raise DeadlineExceeded(f"Request deadline would pass waiting for {provider} rate limit")
+        await asyncio.sleep(wait)
+
+
+async def rate_limited(provider: str, operation: str, call: Callable[[], Awaitable[T]]) -> T:
+    """
+    Make an upstream call within the provider's rate limit.
+
+    Waits for a token first. A 429, whether returned or raised, pauses the
+    bucket for Retry-After and queues the call again, up to
+    `rate_limit_max_retries` times; after that the 429 is passed on.
+
+    Args:
+        provider: Provider name (sora, kie_veo, kie_wan)
+        operation: Short name of the call (create, status, download, ...)
+        call: Makes the request; called once per attempt
+
+    Returns:
+        Whatever `call` returns
+    """
+    bucket = get_bucket(provider, operation)
+    if bucket is None:
+        return await call()
+
+    for attempt in range(settings.rate_limit_max_retries + 1):
+        await _wait_for_token(bucket, provider, operation)
+        try:
+            result = await call()
+        except Exception as e:
+            retry_after = _retry_after(e)
+            if retry_after is None or attempt == settings.rate_limit_max_retries:
+                raise
+        else:
+            retry_after = _retry_after(result)
+            if retry_after is None or attempt == settings.rate_limit_max_retries:
+                return result
+
+        UPSTREAM_THROTTLED.inc(provider=provider, operation=operation)
+        logger.warning(f"{provider} {operation} rate limited; pausing {retry_after:.1f}s before retrying")
+        await bucket.pause(retry_after)
@@ -0,0 +1,265 @@
+"""Circuit breakers, request deadlines and hedged calls for upstream providers.
+
+Example:
+    with deadline(15):
+        with guard("kie_veo"):
+            response = requests.get(url, timeout=time_left(10))
+"""
+
+import asyncio
+import time
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Awaitable, Callable, Iterator, Optional, TypeVar
+
+from ..config import settings
+from .logging_setup import logger
+from .metrics import CIRCUIT_REJECTIONS, CIRCUIT_STATE
+
+T = TypeVar("T")
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling a provider whose circuit is open."""
+
+
+class DeadlineExceeded(TimeoutError):
+    """Raised when the current request's deadline has passed."""
+
+
+class ProviderAPIError(Exception):
+    """Error reported in a provider's response body, with its status code."""
+
+    def __init__(self, message: str, status_code: Optional[int] = None):
+        super().__init__(message)
+        self.status_code = status_code
+
+
+# ============ Deadlines ============
+
+# Absolute time.monotonic() deadline for the current request, if any
+_deadline: ContextVar[Optional[float]] = ContextVar("deadline", default=None)
+
+
+@contextmanager
+def deadline(seconds: float) -> Iterator[None]:
+    """
+    Bound everything inside the block to `seconds` from now.
+
+    Deadlines nest: an inner block can shorten the budget but never extend
+    it. The deadline follows the context into awaited calls and tasks.
+    """
+    limit = time.monotonic() + seconds
+    current = _deadline.get()
+    token = _deadline.set(limit if current is None else min(current, limit))
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+def time_left(timeout: float) -> float:
+    """
+    Timeout for the next upstream call: `timeout`, capped by the deadline.
+
+    Raises:
+        DeadlineExceeded: If the deadline has already passed
+    """
+    limit = _deadline.get()
+    if limit is None:
+        return timeout
+    remaining = limit - time.monotonic()
+    if remaining <= 0:
+        raise DeadlineExceeded("Request deadline exceeded")
+    return min(timeout, remaining)
+
+
+# ============ Circuit breakers ============
+
+class CircuitBreaker:
+    """
+    Error-rate circuit breaker for one provider.
+
+    closed: calls pass and outcomes are kept for `window_seconds`. Once the
+        window holds `min_requests` outcomes with a failure rate of at least
+        `failure_rate`, the circuit opens.
+    open: calls fail immediately with CircuitOpenError for `open_seconds`.
+    half_open: a single trial call is let through; success closes the
+        circuit, failure opens it again.
+
+    Not thread-safe; used from the event loop only.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    _STATE_VALUES = {CLOSED: 0, HALF_OPEN: 1, OPEN: 2}
+
+    def __init__(
+        self,
+        name: str,
+        failure_rate: float = 0.5,
+        window_seconds: float = 60.0,
+        min_requests: int = 5,
+        open_seconds: float = 30.0,
+    ):
+        self.name = name
+        self.failure_rate = failure_rate
+        self.window_seconds = window_seconds
+        self.min_requests = min_requests
+        self.open_seconds = open_seconds
+        self._outcomes: deque[tuple[float, bool]] = deque()
+        self._state = self.CLOSED
+        self._opened_at = 0.0
+        self._trial_in_flight = False
+        CIRCUIT_STATE.set(0, provider=name)
+
+    @property
+    def state(self) -> str:
+        if self._state == self.OPEN and time.monotonic() - self._opened_at >= self.open_seconds:
+            self._transition(self.HALF_OPEN)
+        return self._state
+
+    def allow(self) -> bool:
+        """Whether a call may go ahead now (claims the trial slot when half-open)."""
+        state = self.state
+        if state == self.CLOSED:
+            return True
+        if state == self.HALF_OPEN and not self._trial_in_flight:
+            self._trial_in_flight = True
+            return True
+        return False
+
+    def record(self, ok: bool) -> None:
+        """Record the outcome of an allowed call."""
+        now = time.monotonic()
+        if self._state == self.HALF_OPEN:
+            self._trial_in_flight = False
+            self._transition(self.CLOSED if ok else self.OPEN)
+            return
+
+        self._outcomes.append((now, ok))
+        while self._outcomes and now - self._outcomes[0][0] > self.window_seconds:
+            self._outcomes.popleft()
+
+        if self._state == self.CLOSED and len(self._outcomes) >= self.min_requests:
+            failures = sum(1 for _, outcome in self._outcomes if not outcome)
+            if failures / len(self._outcomes) >= self.failure_rate:
+                self._transition(self.OPEN)
+
+    def release(self) -> None:
+        """Give back a trial slot whose call was cancelled without an outcome."""
+        self._trial_in_flight = False
+
+    def _transition(self, state: str) -> None:
+        if state == self._state:
+            return
+        logger.warning(f"Circuit for {self.name}: {self._state} -> {state}")
+        self._state = state
+        if state == self.OPEN:
+            self._opened_at = time.monotonic()
+        self._outcomes.clear()
+        CIRCUIT_STATE.set(self._STATE_VALUES[state], provider=self.name)
+
+
+_breakers: dict[str, CircuitBreaker] = {}
+
+
+def get_breaker(provider: str) -> CircuitBreaker:
+    """Get or create the circuit breaker for `provider`."""
+    breaker = _breakers.get(provider)
+    if breaker is None:
+        breaker = _breakers[provider] = CircuitBreaker(
+            provider,
+            failure_rate=settings.circuit_failure_rate,
+            window_seconds=settings.circuit_window_seconds,
+            min_requests=settings.circuit_min_requests,
+            open_seconds=settings.circuit_open_seconds,
+        )
+    return breaker
+
+
+def _is_provider_failure(error: BaseException) -> bool:
+    """
+    Whether an error says something about the provider's health.
+
+    Timeouts, connection errors, 5xx and 429 count; other HTTP 4xx responses
+    (bad request, unknown video) are the caller's problem.
+    """
+    status = getattr(error, "status_code", None)
+    if not isinstance(status, int):
+        status = getattr(getattr(error, "response", None), "status_code", None)
+    if not isinstance(status, int):
+        return True
+    return status >= 500 or status == 429
+
+
+@contextmanager
+def guard(provider: str) -> Iterator[None]:
+    """
+    Run an upstream call through `provider`'s circuit breaker.
+
+    Raises:
+        CircuitOpenError: If the circuit is open (the call is not made)
+    """
+    breaker = get_breaker(provider)
+    if not breaker.allow():
+        CIRCUIT_REJECTIONS.inc(provider=provider)
+        raise CircuitOpenError(f"{provider} is unavailable (circuit open), failing fast")
+
+    try:
+        yield
+    except DeadlineExceeded:
+        # Our budget ran out before the call: no verdict on the provider
+        breaker.release()
+        raise
+    except Exception as e:
+        breaker.record(ok=not _is_provider_failure(e))
+        raise
+    except BaseException:
+        # Cancelled (e.g. a losing hedged request): no verdict either
+        breaker.release()
+        raise
+    else:
+        breaker.record(ok=True)
+
+
+# ============ Hedged calls ============
+
+async def hedge(*calls: Callable[[], Awaitable[T]], delay: Optional[float] = None) -> T:
+    """
+    Return the first successful result of `calls`, tried in order.
+
+    The next call starts when the previous one fails or, if `delay` is set,
+    when it hasn't finished after `delay` seconds (a hedged request).
+    Remaining calls are cancelled once one succeeds.
+
+    Raises:
+        The first call's exception, if every call fails
+    """
+    waiting = list(calls)
+    pending: set[asyncio.Task] = set()
+    first_error: Optional[BaseException] = None
+
+    try:
+        while waiting or pending:
+            if waiting:
+                pending.add(asyncio.ensure_future(waiting.pop(0)()))
+            done, pending = await asyncio.wait(
+                pending,
+                timeout=delay if waiting else None,
+                return_when=asyncio.FIRST_COMPLETED,
+            )
+            for task in done:
+                if task.exception() is None:
+                    return task.result()
+                first_error = first_error or task.exception()
+            if not done and waiting:
+                logger.debug("Hedging slow upstream call after %.2fs", delay)
+    finally:
+        for task in pending:
+            task.cancel()
+
+    raise first_error
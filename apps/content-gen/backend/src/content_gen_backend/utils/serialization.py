@@ -0,0 +1,46 @@
+"""Fast JSON serialisation helpers for list endpoints."""
+
+import json
+from datetime import date, datetime
+from enum import Enum
+from typing import Any
+from uuid import UUID
+
+from fastapi.responses import Response
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional (pip install 'content-gen-backend[orjson]')
+    orjson = None
+
+
+def _default(value: Any) -> Any:
+    """Serialise types the stdlib encoder doesn't know about."""
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, UUID):
+        return str(value)
+    if isinstance(value, Enum):
+        return value.value
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def dumps(content: Any) -> bytes:
+    """
+    Serialise content straight to JSON bytes.
+
+    Uses orjson when installed, falling back to the stdlib encoder.
+    """
+    if orjson is not None:
+        return orjson.dumps(content, default=_default)
+    return json.dumps(content, default=_default, separators=(",", ":")).encode("utf-8")
+
+
+def json_response(content: Any, status_code: int = 200) -> Response:
+    """
+    Build a JSON response from plain dicts/lists.
+
+    Returning a Response directly skips FastAPI's response_model validation,
+    so callers must only pass data that already matches the declared schema.
+    """
+    return Response(content=dumps(content), status_code=status_code, media_type="application/json")
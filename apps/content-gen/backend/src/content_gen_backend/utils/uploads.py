@@ -0,0 +1,153 @@
+"""Size limits and content checks for uploaded files.
+
+Multipart bodies are limited while they stream in (`UploadLimitMiddleware`),
+so an oversized upload is rejected after at most MAX_FILE_SIZE bytes rather
+than after being received in full. Starlette spools file parts over 1 MB to a
+temporary file, and `inspect_image_upload` checks the spooled part in chunks,
+so an upload is never held in memory whole.
+
+Example:
+    upload = await inspect_image_upload(input_reference, settings.max_file_size)
+"""
+
+import asyncio
+import hashlib
+from dataclasses import dataclass
+from typing import BinaryIO, Optional
+
+from fastapi import HTTPException, UploadFile
+from fastapi.responses import JSONResponse
+
+from ..config import settings
+
+# Room for the other form fields and multipart framing around the file
+_FORM_ALLOWANCE = 1024 * 1024
+
+_CHUNK_SIZE = 64 * 1024
+
+
+class UploadTooLargeError(ValueError):
+    """Raised when an uploaded file exceeds the size limit."""
+
+
+def _too_large_detail(max_size: int) -> str:
+    return f"File too large. Maximum size is {max_size} bytes"
+
+
+def sniff_image_type(head: bytes) -> Optional[str]:
+    """
+    Detect an image format from its first bytes.
+
+    Args:
+        head: At least the first 12 bytes of the file
+
+    Returns:
+        "image/jpeg", "image/png" or "image/webp", or None if unrecognised
+    """
+    if head.startswith(b"\xff\xd8\xff"):
+        return "image/jpeg"
+    if head.startswith(b"\x89PNG\r\n\x1a\n"):
+        return "image/png"
+    if head[:4] == b"RIFF" and head[8:12] == b"WEBP":
+        return "image/webp"
+    return None
+
+
+@dataclass
+class ImageUpload:
+    """An uploaded image that passed the size and format checks."""
+
+    file: BinaryIO
+    size: int
+    digest: str  # SHA-256 of the file contents
+    media_type: str  # Sniffed from the contents, not the client's content type
+
+
+def _inspect(file: BinaryIO, max_size: int) -> tuple[int, str, Optional[str]]:
+    """Hash and measure `file` in chunks, stopping once it passes `max_size`."""
+    file.seek(0)
+    head = file.read(_CHUNK_SIZE)
+    media_type = sniff_image_type(head)
+    if media_type is None:
+        return len(head), "", None
+
+    digest = hashlib.sha256()
+    size = 0
+    chunk = head
+    while chunk:
+        size += len(chunk)
+        if size > max_size:
+            raise UploadTooLargeError(_too_large_detail(max_size))
+        digest.update(chunk)
+        chunk = file.read(_CHUNK_SIZE)
+    file.seek(0)
+    return size, digest.hexdigest(), media_type
+
+
+async def inspect_image_upload(upload: UploadFile, max_size: int) -> ImageUpload:
+    """
+    Check an uploaded image without reading it into memory.
+
+    Args:
+        upload: Uploaded file
+        max_size: Maximum size in bytes
+
+    Returns:
+        ImageUpload, with the file rewound to the start
+
+    Raises:
+        UploadTooLargeError: If the file is larger than max_size
+        ValueError: If the file is not a JPEG, PNG or WebP image
+    """
+    # The part may have been spooled to disk, so read it off the event loop
+    size, digest, media_type = await asyncio.to_thread(_inspect, upload.file, max_size)
+    if media_type is None:
+        raise ValueError("Input reference must be an image (JPEG, PNG, or WebP)")
+    return ImageUpload(upload.file, size, digest, media_type)
+
+
+class UploadLimitMiddleware:
+    """
+    ASGI middleware rejecting multipart bodies larger than MAX_FILE_SIZE
+    plus a small allowance for the other form fields.
+
+    A declared Content-Length over the limit is answered with 413 before
+    anything is read; otherwise the body is counted as it arrives and the
+    request fails with 413 as soon as it passes the limit.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        headers = dict(scope["headers"])
+        if not headers.get(b"content-type", b"").startswith(b"multipart/form-data"):
+            await self.app(scope, receive, send)
+            return
+
+        limit = settings.max_file_size + _FORM_ALLOWANCE
+        try:
+            declared = int(headers.get(b"content-length", b""))
+        except ValueError:
+            declared = None
+        if declared is not None and declared > limit:
+            response = JSONResponse({"detail": _too_large_detail(settings.max_file_size)}, status_code=413)
+            await response(scope, receive, send)
+            return
+
+        received = 0
+
+        async def limited_receive():
+            nonlocal received
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > limit:
+                    raise HTTPException(status_code=413, detail=_too_large_detail(settings.max_file_size))
+            return message
+
+        await self.app(scope, limited_receive, send)